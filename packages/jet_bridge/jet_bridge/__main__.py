@@ -1,4 +1,5 @@
 import os
+import signal
 from datetime import datetime
 import sys
 
@@ -12,12 +13,14 @@ conf = JetBridgeConfiguration()
 configuration.set_configuration(conf)
 
 from jet_bridge_base.commands.check_token import check_token_command
-from jet_bridge_base.db import connect_database_from_settings
+from jet_bridge_base.db import connect_database_from_settings, reload_blacklist_hostnames
 from jet_bridge_base.logger import logger
 
 from jet_bridge import settings, VERSION
 from jet_bridge.settings import missing_options, required_options_without_default
+from jet_bridge.tasks.reload_blacklist_hostnames import run_reload_blacklist_hostnames_task
 from jet_bridge.tasks.release_inactive_graphql_schemas import run_release_inactive_graphql_schemas_task
+from jet_bridge.tasks.release_unused_ssl_certificates import run_release_unused_ssl_certificates_task
 
 
 def main():
@@ -49,6 +52,7 @@ def main():
             check_token_command(api_url)
             return
 
+    reload_blacklist_hostnames()
     connect_database_from_settings()
 
     from jet_bridge.app import make_app
@@ -80,6 +84,24 @@ def main():
         )
         release_inactive_graphql_schemas_task.start()
 
+    release_unused_ssl_certificates_task = PeriodicCallback(
+        lambda: run_release_unused_ssl_certificates_task(),
+        10 * 60 * 1000  # every 10 minutes
+    )
+    release_unused_ssl_certificates_task.start()
+
+    reload_blacklist_hostnames_task = PeriodicCallback(
+        lambda: run_reload_blacklist_hostnames_task(),
+        10 * 1000  # every 10 seconds
+    )
+    reload_blacklist_hostnames_task.start()
+
+    if hasattr(signal, 'SIGHUP'):
+        signal.signal(
+            signal.SIGHUP,
+            lambda signum, frame: IOLoop.current().add_callback_from_signal(reload_blacklist_hostnames)
+        )
+
     if settings.DEBUG:
         logger.warning('Server is running in DEBUG mode')
 
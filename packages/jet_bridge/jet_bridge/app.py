@@ -4,7 +4,7 @@ import tornado.ioloop
 import tornado.web
 
 from jet_bridge.handlers.temporary_redirect import TemporaryRedirectHandler
-from jet_bridge.utils.async_exec import set_max_workers
+from jet_bridge.utils.async_exec import set_max_workers, configure_scheduler
 from jet_bridge_base.sentry import sentry_controller
 from jet_bridge_base import settings as base_settings
 from jet_bridge_base.views.api import ApiView
@@ -23,6 +23,7 @@ from jet_bridge_base.views.model_description_relationship_override import ModelD
 from jet_bridge_base.views.proxy_request import ProxyRequestView
 from jet_bridge_base.views.register import RegisterView
 from jet_bridge_base.views.reload import ReloadView
+from jet_bridge_base.views.count import CountView
 from jet_bridge_base.views.sql import SqlView
 from jet_bridge_base.views.status import StatusView
 from jet_bridge_base.views.table import TableView
@@ -51,6 +52,7 @@ def make_app():
         (r'/api/model_descriptions/relationship_overrides/', view_handler(ModelDescriptionRelationshipOverrideView)),
         (r'/api/model_descriptions/', view_handler(ModelDescriptionView)),
         (r'/api/sql/', view_handler(SqlView)),
+        (r'/api/count/', view_handler(CountView)),
         (r'/api/messages/', view_handler(MessageView)),
         (r'/api/file_upload/', view_handler(FileUploadView)),
         (r'/api/image_resize/', view_handler(ImageResizeView)),
@@ -73,6 +75,12 @@ def make_app():
     if settings.THREADS is not None:
         set_max_workers(settings.THREADS)
 
+    configure_scheduler(
+        max_connection_threads=settings.CONNECTION_MAX_THREADS,
+        max_connection_queue=settings.CONNECTION_MAX_QUEUE,
+        weights=settings.CONNECTION_WEIGHTS
+    )
+
     if settings.SENTRY_DSN:
         sentry_controller.enable(
             dsn=settings.SENTRY_DSN,
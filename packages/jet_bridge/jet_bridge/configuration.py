@@ -1,6 +1,6 @@
 import os
 
-from jet_bridge.utils.async_exec import pool_submit
+from jet_bridge.utils.async_exec import pool_submit, scheduler_stats
 from jet_bridge_base.configuration import Configuration
 from jet_bridge_base.utils.common import get_random_string
 
@@ -51,6 +51,8 @@ class JetBridgeConfiguration(Configuration):
             'DATABASE_MAX_TABLES': settings.DATABASE_MAX_TABLES,
             'DATABASE_SCHEMA': settings.DATABASE_SCHEMA,
             'DATABASE_TIMEZONE': settings.DATABASE_TIMEZONE,
+            'DATABASE_STATEMENT_TIMEOUT': settings.DATABASE_STATEMENT_TIMEOUT,
+            'DATABASE_QUERY_CACHE_SIZE': settings.DATABASE_QUERY_CACHE_SIZE,
             'DATABASE_RLS_TYPE': settings.DATABASE_RLS_TYPE,
             'DATABASE_RLS_SSO': settings.DATABASE_RLS_SSO,
             'DATABASE_RLS_USER_PROPERTY': settings.DATABASE_RLS_USER_PROPERTY,
@@ -80,7 +82,20 @@ class JetBridgeConfiguration(Configuration):
             'TRACK_QUERY_SLOW_TIME': settings.TRACK_QUERY_SLOW_TIME,
             'TRACK_QUERY_HIGH_MEMORY': settings.TRACK_QUERY_HIGH_MEMORY,
             'RELEASE_INACTIVE_GRAPHQL_SCHEMAS_TIMEOUT': settings.RELEASE_INACTIVE_GRAPHQL_SCHEMAS_TIMEOUT,
-            'DISABLE_AUTH': settings.DISABLE_AUTH
+            'DISABLE_AUTH': settings.DISABLE_AUTH,
+            'ASYNC_DATABASE': settings.ASYNC_DATABASE,
+            'COUNT_STRATEGY': settings.COUNT_STRATEGY,
+            'COUNT_STRATEGIES': settings.COUNT_STRATEGIES,
+            'COUNT_CACHE_TTL': settings.COUNT_CACHE_TTL,
+            'COUNT_DEFERRED_WORKERS': settings.COUNT_DEFERRED_WORKERS,
+            'COUNT_DEFERRED_MAX_PENDING': settings.COUNT_DEFERRED_MAX_PENDING,
+            'PARALLEL_QUERIES': settings.PARALLEL_QUERIES,
+            'PARALLEL_QUERIES_WORKERS': settings.PARALLEL_QUERIES_WORKERS,
+            'SQL_CACHE_TTL': settings.SQL_CACHE_TTL,
+            'SQL_CACHE_MAX_MEMORY': settings.SQL_CACHE_MAX_MEMORY,
+            'SQL_BATCH_MAX_PARALLEL': settings.SQL_BATCH_MAX_PARALLEL,
+            'SQL_FETCH_BATCH_SIZE': settings.SQL_FETCH_BATCH_SIZE,
+            'SQL_MAX_ROWS': settings.SQL_MAX_ROWS
         }
 
     def media_get_available_name(self, path):
@@ -180,5 +195,8 @@ class JetBridgeConfiguration(Configuration):
     def session_clear(self, request, name):
         request.original_handler.clear_cookie(name)
 
+    def get_executor_stats(self):
+        return scheduler_stats()
+
     def run_async(self, func, *args, **kwargs):
         pool_submit(func, *args, **kwargs)
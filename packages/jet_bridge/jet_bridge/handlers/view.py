@@ -1,10 +1,14 @@
+import asyncio
 import sys
+import threading
 from datetime import datetime
 
 import tornado.web
-from jet_bridge.utils.async_exec import as_future
-from jet_bridge_base.db import get_connection
+from jet_bridge import settings
+from jet_bridge.utils.async_exec import schedule
+from jet_bridge_base.db import get_connection, cancel_request_queries
 from jet_bridge_base.exceptions.request_error import RequestError
+from jet_bridge_base.logger import logger
 from jet_bridge_base.sentry import sentry_controller
 from tornado import gen
 from six.moves.urllib_parse import parse_qs
@@ -18,6 +22,9 @@ from tornado.iostream import StreamClosedError
 
 class BaseViewHandler(tornado.web.RequestHandler):
     view = None
+    connection = None
+    view_request = None
+    async_action_future = None
 
     def request_headers(self):
         return {k.upper().replace('-', '_'): v for k, v in self.request.headers.items()}
@@ -54,6 +61,18 @@ class BaseViewHandler(tornado.web.RequestHandler):
     def after_dispatch(self, request):
         self.view.after_dispatch(request)
 
+    def on_connection_close(self):
+        super(BaseViewHandler, self).on_connection_close()
+
+        if self.async_action_future is not None:
+            # Async drivers cancel the running query when the awaiting task is cancelled
+            self.async_action_future.cancel()
+
+        if self.view_request is not None:
+            # Cancelling can open a new database connection, so it is not run on the IOLoop or
+            # the worker pool which may be busy with the very queries being cancelled
+            threading.Thread(target=cancel_request_queries, args=(self.view_request,), daemon=True).start()
+
     def on_finish(self):
         self.view.on_finish()
 
@@ -62,7 +81,11 @@ class BaseViewHandler(tornado.web.RequestHandler):
             self.set_header(name, value)
 
     @gen.coroutine
-    def write_response(self, response):
+    def write_response(self, response, request=None):
+        if response.streaming:
+            yield self.write_streaming_response(response, request)
+            raise gen.Return()
+
         try:
             if isinstance(response, RedirectResponse):
                 self.redirect(response.url, status=response.status)
@@ -83,6 +106,41 @@ class BaseViewHandler(tornado.web.RequestHandler):
 
         raise gen.Return()
 
+    @gen.coroutine
+    def write_streaming_response(self, response, request):
+        # Chunks are rendered in the pool one by one while the session is still open,
+        # after_dispatch is deferred by execute() until the response is written
+        chunks = response.render_chunks()
+
+        try:
+            chunk = yield self.run_in_pool(lambda: next(chunks, None), throttle=False)
+
+            for name, value in response.header_items():
+                self.set_header(name, value)
+
+            if response.status is not None:
+                self.set_status(response.status)
+
+            while chunk is not None:
+                self.write(chunk)
+                yield self.flush()
+
+                try:
+                    chunk = yield self.run_in_pool(lambda: next(chunks, None), throttle=False)
+                except Exception as e:
+                    # Headers are already sent, so the error can't be reported to the client
+                    logger.exception('Streaming response failed')
+                    sentry_controller.capture_exception(e)
+                    break
+
+            yield self.finish()
+        except StreamClosedError:
+            pass
+        finally:
+            yield self.run_in_pool(lambda: (chunks.close(), self.after_dispatch(request)), throttle=False)
+
+        raise gen.Return()
+
     @gen.coroutine
     def write_error(self, status_code, **kwargs):
         exc_type = exc = traceback = None
@@ -105,9 +163,59 @@ class BaseViewHandler(tornado.web.RequestHandler):
         self.set_status(HTTP_204_NO_CONTENT)
         self.finish()
 
+    def run_in_pool(self, func, throttle=True):
+        # Work continuing an already started request is never rejected
+        return schedule(self.connection, func, throttle=throttle)
+
+    @gen.coroutine
+    def execute(self, action, request, *args, **kwargs):
+        self.connection = get_connection(request)
+
+        # For streaming responses after_dispatch is called by write_streaming_response()
+        if not settings.ASYNC_DATABASE:
+            def execute():
+                self.before_dispatch(request)
+                result = None
+
+                try:
+                    result = self.view.dispatch(action, request, *args, **kwargs)
+                finally:
+                    if result is None or not result.streaming:
+                        self.after_dispatch(request)
+
+                return result
+
+            response = yield self.run_in_pool(execute)
+            raise gen.Return(response)
+
+        yield self.run_in_pool(lambda: self.before_dispatch(request))
+        response = None
+
+        try:
+            # Resolving the action can connect to the database, so it is not run on the IOLoop
+            async_action = yield self.run_in_pool(
+                lambda: self.view.get_async_action(action, request),
+                throttle=False
+            )
+
+            if async_action:
+                self.async_action_future = asyncio.ensure_future(async_action(request, *args, **kwargs))
+                response = yield self.async_action_future
+            else:
+                response = yield self.run_in_pool(
+                    lambda: self.view.dispatch(action, request, *args, **kwargs),
+                    throttle=False
+                )
+        finally:
+            if response is None or not response.streaming:
+                yield self.run_in_pool(lambda: self.after_dispatch(request), throttle=False)
+
+        raise gen.Return(response)
+
     @gen.coroutine
     def dispatch(self, action, *args, **kwargs):
         request = self.get_request()
+        self.view_request = request
 
         connection = get_connection(request)
         if connection:
@@ -120,19 +228,12 @@ class BaseViewHandler(tornado.web.RequestHandler):
         else:
             sentry_controller.set_context('Database connection', {})
 
-        def execute():
-            self.before_dispatch(request)
-
-            try:
-                result = self.view.dispatch(action, request, *args, **kwargs)
-            finally:
-                self.after_dispatch(request)
-
-            return result
-
         try:
-            response = yield as_future(execute)
-            yield self.write_response(response)
+            response = yield self.execute(action, request, *args, **kwargs)
+            yield self.write_response(response, request)
+        except asyncio.CancelledError:
+            # Client has disconnected, there is nobody to respond to
+            pass
         except Exception:
             exc_type, exc, traceback = sys.exc_info()
             response = self.view.error_response(request, exc_type, exc, traceback)
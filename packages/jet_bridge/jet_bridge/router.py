@@ -1,8 +1,6 @@
 import sys
 from tornado import gen
 
-from jet_bridge.utils.async_exec import as_future
-
 
 class Router(object):
     routes = [
@@ -38,19 +36,9 @@ class Router(object):
                     request = inner_self.get_request()
                     request.action = action
 
-                    def execute():
-                        inner_self.before_dispatch(request)
-
-                        try:
-                            result = inner_self.view.dispatch(action, request, *args, **kwargs)
-                        finally:
-                            inner_self.after_dispatch(request)
-
-                        return result
-
                     try:
-                        response = yield as_future(execute)
-                        yield inner_self.write_response(response)
+                        response = yield inner_self.execute(action, request, *args, **kwargs)
+                        yield inner_self.write_response(response, request)
                     except Exception:
                         exc_type, exc, traceback = sys.exc_info()
                         response = inner_self.view.error_response(request, exc_type, exc, traceback)
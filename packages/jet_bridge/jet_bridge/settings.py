@@ -30,6 +30,9 @@ define('read_only', default=False, help='read only', type=bool)
 define('threads', default=None, help='threads', type=int)
 define('connections', default=5, help='connections', type=int)
 define('connections_overflow', default=20, help='connections overflow', type=int)
+define('connection_max_threads', default=None, type=int)
+define('connection_max_queue', default=None, type=int)
+define('connection_weights', default='{}', type=str)
 define('auto_open_register', default=True, help='open token register automatically', type=bool)
 define('project', help='project', type=str)
 define('token', help='token', type=str)
@@ -61,6 +64,8 @@ define('database_except', default=None, type=str)
 define('database_max_tables', default=None, type=int)
 define('database_schema', default=None, type=str)
 define('database_timezone', default=None, type=str)
+define('database_statement_timeout', default=None, type=int)
+define('database_query_cache_size', default=1000, type=int)
 define('database_rls_type', default=None, type=str)
 define('database_rls_sso', default=None, type=str)
 define('database_rls_user_property', default=None, type=str)
@@ -102,6 +107,19 @@ define('track_query_high_memory', default=None, type=int)
 define('release_inactive_graphql_schemas_timeout', default=None, type=int)
 
 define('disable_auth', default=False, type=bool)
+define('async_database', default=False, type=bool)
+define('count_strategy', default='optimized')
+define('count_strategies', default='{}')
+define('count_cache_ttl', default=60, type=int)
+define('count_deferred_workers', default=2, type=int)
+define('count_deferred_max_pending', default=4, type=int)
+define('parallel_queries', default=True, type=bool)
+define('parallel_queries_workers', default=8, type=int)
+define('sql_cache_ttl', default=0, type=int)
+define('sql_cache_max_memory', default=64 * 1024 * 1024, type=int)
+define('sql_batch_max_parallel', default=4, type=int)
+define('sql_fetch_batch_size', default=1000, type=int)
+define('sql_max_rows', default=0, type=int)
 
 define('sentry_dsn', default='')
 
@@ -151,6 +169,8 @@ READ_ONLY = options.read_only
 THREADS = options.threads
 CONNECTIONS = options.connections
 CONNECTIONS_OVERFLOW = options.connections_overflow
+CONNECTION_MAX_THREADS = options.connection_max_threads
+CONNECTION_MAX_QUEUE = options.connection_max_queue
 AUTO_OPEN_REGISTER = options.auto_open_register
 CONFIG = options.config
 USE_DEFAULT_CONFIG = options.use_default_config.lower().split(',')
@@ -184,6 +204,8 @@ DATABASE_EXCEPT = options.database_except.split(',') if options.database_except
 DATABASE_MAX_TABLES = options.database_max_tables
 DATABASE_SCHEMA = options.database_schema
 DATABASE_TIMEZONE = options.database_timezone
+DATABASE_STATEMENT_TIMEOUT = options.database_statement_timeout
+DATABASE_QUERY_CACHE_SIZE = options.database_query_cache_size
 DATABASE_RLS_TYPE = options.database_rls_type
 DATABASE_RLS_SSO = options.database_rls_sso
 DATABASE_RLS_USER_PROPERTY = options.database_rls_user_property
@@ -215,6 +237,18 @@ except Exception as e:
     logger.error('SSO_APPLICATIONS parsing failed', exc_info=e)
     SSO_APPLICATIONS = {}
 
+try:
+    CONNECTION_WEIGHTS = json.loads(options.connection_weights)
+except Exception as e:
+    logger.error('CONNECTION_WEIGHTS parsing failed', exc_info=e)
+    CONNECTION_WEIGHTS = {}
+
+try:
+    COUNT_STRATEGIES = json.loads(options.count_strategies)
+except Exception as e:
+    logger.error('COUNT_STRATEGIES parsing failed', exc_info=e)
+    COUNT_STRATEGIES = {}
+
 ALLOW_ORIGIN = options.allow_origin
 
 TRACK_DATABASES = options.track_databases
@@ -230,6 +264,18 @@ TRACK_QUERY_HIGH_MEMORY = options.track_query_high_memory
 RELEASE_INACTIVE_GRAPHQL_SCHEMAS_TIMEOUT = options.release_inactive_graphql_schemas_timeout
 
 DISABLE_AUTH = options.disable_auth
+ASYNC_DATABASE = options.async_database
+COUNT_STRATEGY = options.count_strategy
+COUNT_CACHE_TTL = options.count_cache_ttl
+COUNT_DEFERRED_WORKERS = options.count_deferred_workers
+COUNT_DEFERRED_MAX_PENDING = options.count_deferred_max_pending
+PARALLEL_QUERIES = options.parallel_queries
+PARALLEL_QUERIES_WORKERS = options.parallel_queries_workers
+SQL_CACHE_TTL = options.sql_cache_ttl
+SQL_CACHE_MAX_MEMORY = options.sql_cache_max_memory
+SQL_BATCH_MAX_PARALLEL = options.sql_batch_max_parallel
+SQL_FETCH_BATCH_SIZE = options.sql_fetch_batch_size
+SQL_MAX_ROWS = options.sql_max_rows
 
 SENTRY_DSN = options.sentry_dsn
 
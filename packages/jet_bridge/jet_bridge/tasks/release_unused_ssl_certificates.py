@@ -0,0 +1,5 @@
+from jet_bridge_base.db import release_unused_ssl_certificates
+
+
+def run_release_unused_ssl_certificates_task():
+    release_unused_ssl_certificates()
@@ -0,0 +1,5 @@
+from jet_bridge_base.db import reload_blacklist_hostnames_if_changed
+
+
+def run_reload_blacklist_hostnames_task():
+    reload_blacklist_hostnames_if_changed()
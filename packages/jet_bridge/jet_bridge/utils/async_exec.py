@@ -1,6 +1,10 @@
 import multiprocessing
+import time
+from collections import deque
 from concurrent.futures import Executor, ThreadPoolExecutor
 
+from jet_bridge_base.exceptions.throttled import Throttled
+
 from tornado.concurrent import Future, chain_future
 from tornado.ioloop import IOLoop
 
@@ -56,10 +60,201 @@ class _AsyncExecution:
         self._pool.submit(query, *args, **kwargs)
 
 
+class _ConnectionQueue:
+    def __init__(self, key, weight):
+        self.key = key
+        self.weight = weight
+        self.current_weight = 0
+        self.queue = deque()
+        self.running = 0
+        self.submitted = 0
+        self.rejected = 0
+        self.wait_time_total = 0
+        self.wait_time_max = 0
+        self.last_activity = time.time()
+
+
+class _FairScheduler:
+    """Dispatches queries to the thread pool fairly between database connections.
+    Every connection gets its own queue, queues are served with smooth weighted
+    round-robin and only as many queries as there are pool workers are handed
+    to the pool at once, so queries of other connections don't wait behind the
+    whole backlog of one busy connection. CONNECTION_MAX_THREADS additionally
+    caps how many workers a single connection can hold. Queues are changed on
+    the IOLoop only, stats() may be called from any thread.
+    """
+
+    idle_queue_timeout = 60 * 60
+    idle_prune_interval = 60
+
+    def __init__(self, executor):
+        self._executor = executor
+        self._queues = {}
+        self._running = 0
+        self._last_prune = time.time()
+        self.max_connection_threads = None
+        self.max_connection_queue = None
+        self.weights = {}
+
+    def configure(self, max_connection_threads=None, max_connection_queue=None, weights=None):
+        self.max_connection_threads = max_connection_threads
+        self.max_connection_queue = max_connection_queue
+        self.weights = weights or {}
+
+    def get_weight(self, connection):
+        if connection is None:
+            return 1
+
+        # Weights can be set per connection id, project or database name
+        for key in [connection['id'], connection.get('project'), connection.get('name')]:
+            if key is not None and key in self.weights:
+                return max(int(self.weights[key]), 1)
+
+        return 1
+
+    def get_connection_threads_limit(self):
+        max_workers = self._executor._max_workers
+
+        if self.max_connection_threads:
+            return min(self.max_connection_threads, max_workers)
+
+        return max_workers
+
+    def get_queue(self, connection):
+        key = connection['id'] if connection else None
+        connection_queue = self._queues.get(key)
+
+        if connection_queue is None:
+            connection_queue = _ConnectionQueue(key, self.get_weight(connection))
+            self._queues[key] = connection_queue
+
+        return connection_queue
+
+    def schedule(self, connection, query, throttle=True):
+        connection_queue = self.get_queue(connection)
+        connection_queue.last_activity = time.time()
+
+        # Queue is unbounded unless CONNECTION_MAX_QUEUE is set (0 also means unbounded)
+        if throttle and self.max_connection_queue \
+                and len(connection_queue.queue) >= self.max_connection_queue:
+            connection_queue.rejected += 1
+            raise Throttled('Too many queued requests for this connection, try again later')
+
+        future = Future()  # type: Future
+        connection_queue.queue.append((query, future, time.time()))
+        self._dispatch()
+
+        return future
+
+    def _next_queue(self):
+        # Smooth weighted round-robin (the same algorithm nginx uses for upstreams)
+        connection_threads_limit = self.get_connection_threads_limit()
+        candidates = [
+            x for x in self._queues.values()
+            if x.queue and x.running < connection_threads_limit
+        ]
+
+        if not candidates:
+            return
+
+        total_weight = 0
+        selected = None
+
+        for connection_queue in candidates:
+            connection_queue.current_weight += connection_queue.weight
+            total_weight += connection_queue.weight
+
+            if selected is None or connection_queue.current_weight > selected.current_weight:
+                selected = connection_queue
+
+        selected.current_weight -= total_weight
+        return selected
+
+    def _dispatch(self):
+        while self._running < self._executor._max_workers:
+            connection_queue = self._next_queue()
+
+            if connection_queue is None:
+                break
+
+            query, future, queued = connection_queue.queue.popleft()
+
+            if future.cancelled():
+                continue
+
+            wait_time = time.time() - queued
+            connection_queue.submitted += 1
+            connection_queue.wait_time_total += wait_time
+            connection_queue.wait_time_max = max(connection_queue.wait_time_max, wait_time)
+            connection_queue.running += 1
+            self._running += 1
+
+            pool_future = self._executor.as_future(query)
+            IOLoop.current().add_future(
+                pool_future, lambda f, q=connection_queue, r=future: self._on_finish(q, f, r)
+            )
+
+    def _on_finish(self, connection_queue, pool_future, future):
+        connection_queue.running -= 1
+        connection_queue.last_activity = time.time()
+        self._running -= 1
+
+        chain_future(pool_future, future)
+        self._dispatch()
+        self._prune_idle_queues()
+
+    def _prune_idle_queues(self):
+        now = time.time()
+
+        if now - self._last_prune < self.idle_prune_interval:
+            return
+
+        self._last_prune = now
+
+        for key, connection_queue in list(self._queues.items()):
+            idle = not connection_queue.queue and not connection_queue.running
+
+            if idle and now - connection_queue.last_activity > self.idle_queue_timeout:
+                del self._queues[key]
+
+    def stats(self):
+        connections = {}
+
+        # Read-only snapshot, queues are changed by the IOLoop thread meanwhile
+        for key, connection_queue in list(self._queues.items()):
+            submitted = connection_queue.submitted
+
+            connections[key or 'default'] = {
+                'weight': connection_queue.weight,
+                'queued': len(connection_queue.queue),
+                'running': connection_queue.running,
+                'submitted': submitted,
+                'rejected': connection_queue.rejected,
+                'wait_time_avg': round(connection_queue.wait_time_total / submitted, 4) if submitted else None,
+                'wait_time_max': round(connection_queue.wait_time_max, 4)
+            }
+
+        return {
+            'max_workers': self._executor._max_workers,
+            'running': self._running,
+            'max_connection_threads': self.get_connection_threads_limit(),
+            'max_connection_queue': self.max_connection_queue,
+            'connections': connections
+        }
+
+
 _async_exec = _AsyncExecution()
 
+_scheduler = _FairScheduler(_async_exec)
+
 as_future = _async_exec.as_future
 
 set_max_workers = _async_exec.set_max_workers
 
 pool_submit = _async_exec.submit
+
+schedule = _scheduler.schedule
+
+configure_scheduler = _scheduler.configure
+
+scheduler_stats = _scheduler.stats
@@ -0,0 +1,126 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from jet_bridge_base.exceptions.throttled import Throttled
+
+from jet_bridge.utils.async_exec import _AsyncExecution, _FairScheduler
+
+A = {'id': 'a'}
+B = {'id': 'b'}
+
+
+def create_scheduler(**kwargs):
+    # Single worker, so queries are dispatched strictly one by one
+    scheduler = _FairScheduler(_AsyncExecution(max_workers=1))
+    scheduler.configure(**kwargs)
+    return scheduler
+
+
+def block_worker(scheduler):
+    event = threading.Event()
+    future = scheduler.schedule(A, lambda: event.wait(5), throttle=False)
+    return event, future
+
+
+def run(coroutine):
+    return asyncio.run(asyncio.wait_for(coroutine, 10))
+
+
+def test_weighted_round_robin():
+    executed = []
+
+    async def main():
+        scheduler = create_scheduler(weights={'a': 2})
+        event, blocking_future = block_worker(scheduler)
+        futures = []
+
+        for connection in [A] * 4 + [B] * 4:
+            futures.append(scheduler.schedule(connection, lambda x=connection['id']: executed.append(x)))
+
+        event.set()
+        await asyncio.gather(blocking_future, *futures)
+
+    run(main())
+
+    # Connection "a" gets two turns for every turn of "b" while both have queued queries
+    assert executed == ['a', 'b', 'a', 'a', 'b', 'a', 'b', 'b']
+
+
+def test_connection_queue_limit():
+    async def main():
+        scheduler = create_scheduler(max_connection_queue=2)
+        event, blocking_future = block_worker(scheduler)
+        futures = [scheduler.schedule(A, lambda: 1), scheduler.schedule(A, lambda: 2)]
+
+        with pytest.raises(Throttled) as e:
+            scheduler.schedule(A, lambda: 3)
+
+        assert e.value.status_code == 429
+
+        # Other connections and not throttled queries are not limited
+        futures.append(scheduler.schedule(B, lambda: 4))
+        futures.append(scheduler.schedule(A, lambda: 5, throttle=False))
+
+        stats = scheduler.stats()['connections']
+        assert stats['a']['rejected'] == 1 and stats['a']['queued'] == 3
+        assert stats['b']['rejected'] == 0
+
+        event.set()
+        await blocking_future
+        return await asyncio.gather(*futures)
+
+    assert run(main()) == [1, 2, 4, 5]
+
+
+def test_connection_queue_unbounded():
+    async def main():
+        scheduler = create_scheduler()
+        event, blocking_future = block_worker(scheduler)
+        futures = list(map(lambda x: scheduler.schedule(A, lambda: x), range(100)))
+
+        event.set()
+        await blocking_future
+        return await asyncio.gather(*futures)
+
+    assert run(main()) == list(range(100))
+
+
+def test_schedule_during_stats():
+    async def main():
+        scheduler = create_scheduler()
+        await scheduler.schedule(A, lambda: None)
+
+        # Queue is idle for long enough to be pruned
+        scheduler._queues['a'].last_activity = time.time() - scheduler.idle_queue_timeout - 1
+        get_queue = scheduler.get_queue
+
+        def get_queue_with_stats(connection):
+            connection_queue = get_queue(connection)
+            # Status request is served by a pool thread right between queue lookup and append
+            thread = threading.Thread(target=scheduler.stats)
+            thread.start()
+            thread.join()
+            return connection_queue
+
+        scheduler.get_queue = get_queue_with_stats
+
+        return await scheduler.schedule(A, lambda: 'done')
+
+    assert run(main()) == 'done'
+
+
+def test_idle_queues_pruned():
+    async def main():
+        scheduler = create_scheduler()
+        await scheduler.schedule(A, lambda: None)
+
+        scheduler._queues['a'].last_activity = time.time() - scheduler.idle_queue_timeout - 1
+        scheduler._last_prune = 0
+        await scheduler.schedule(B, lambda: None)
+
+        return scheduler.stats()['connections']
+
+    assert list(run(main()).keys()) == ['b']
@@ -0,0 +1,101 @@
+import os
+import tempfile
+import threading
+import time
+
+from jet_bridge_base.logger import logger
+from jet_bridge_base.utils.crypt import get_sha256_hash
+
+
+class CertificateStore(object):
+    """
+    Content-addressed storage for SSL certificates passed inside X-Bridge-Settings.
+    Each certificate is written to disk once and then resolved from the in-memory index
+    without checking the file, which is checked again only after a connection error.
+    """
+
+    max_unused_time = 60 * 60
+
+    def __init__(self, dir_path):
+        self.dir_path = dir_path
+        self.files = {}
+        self.lock = threading.Lock()
+
+    def file_path(self, name, content_hash):
+        return os.path.join(self.dir_path, name.format(content_hash))
+
+    def write_file(self, file_path, content):
+        try:
+            os.makedirs(self.dir_path)
+        except OSError:
+            pass
+
+        temp_path = '{}.{}.tmp'.format(file_path, threading.get_ident())
+
+        with open(temp_path, 'w') as f:
+            f.write(content)
+
+        os.replace(temp_path, file_path)
+
+    def save(self, name, content):
+        content_hash = get_sha256_hash(content)
+        file_path = self.file_path(name, content_hash)
+
+        with self.lock:
+            file = self.files.get(file_path)
+
+            if file is None:
+                if not os.path.exists(file_path):
+                    self.write_file(file_path, content)
+
+                file = {'path': file_path}
+                self.files[file_path] = file
+
+            file['last_used'] = time.time()
+
+        return file_path
+
+    def forget_missing(self, file_paths):
+        # Files removed from disk (e.g. by temp dir cleanup) are written again on the next save()
+        forgotten = 0
+
+        with self.lock:
+            for file_path in file_paths:
+                if file_path in self.files and not os.path.exists(file_path):
+                    del self.files[file_path]
+                    forgotten += 1
+
+        return forgotten
+
+    def release_unused(self, referenced_paths):
+        now = time.time()
+        released = 0
+
+        with self.lock:
+            for file_path, file in list(self.files.items()):
+                if file_path in referenced_paths:
+                    continue
+
+                if now - file['last_used'] <= self.max_unused_time:
+                    continue
+
+                try:
+                    os.remove(file_path)
+                except OSError:
+                    pass
+
+                del self.files[file_path]
+                released += 1
+
+        if released:
+            logger.info('Released {} unused SSL certificate(s)'.format(released))
+
+        return released
+
+    def stats(self):
+        return {
+            'files': len(self.files)
+        }
+
+
+certificate_store = CertificateStore(os.path.join(tempfile.gettempdir(), 'ssl'))
@@ -1,15 +1,18 @@
 import contextlib
+import os
 import threading
 from datetime import timedelta, datetime
 
 from jet_bridge_base import settings
+from jet_bridge_base.configuration import configuration
+from jet_bridge_base.certificate_store import certificate_store
 from jet_bridge_base.db_types import dump_metadata_file, load_mapped_base, init_database_connection, \
-    fetch_default_timezone
+    fetch_default_timezone, cancel_session_queries, cancel_async_connection_query
 from jet_bridge_base.logger import logger
 from jet_bridge_base.ssh_tunnel import SSHTunnel
 from jet_bridge_base.utils.common import get_random_string, format_size
 from jet_bridge_base.utils.conf import get_connection_id, get_connection_schema, get_connection_name, \
-    get_connection_params_id, is_tunnel_connection, get_conf, get_settings_conf
+    is_tunnel_connection, get_settings_conf, ConnectionContext
 from jet_bridge_base.utils.datetime import date_trunc_minutes
 
 try:
@@ -21,6 +24,12 @@ connections = {}
 pending_connections = {}
 MODEL_DESCRIPTIONS_RESPONSE_CACHE_KEY = 'model_descriptions_response'
 MODEL_DESCRIPTIONS_HASH_CACHE_KEY = 'model_descriptions_hash'
+MODEL_SERIALIZERS_CACHE_KEY = 'model_serializers'
+MODEL_FILTER_CLASSES_CACHE_KEY = 'model_filter_classes'
+blacklist = {
+    'hostnames': None,
+    'config_mtime': None
+}
 
 
 def get_connection_tunnel(conf):
@@ -129,7 +138,7 @@ def clean_hostname(hostname):
     return hostname
 
 
-def get_blacklist_hostnames():
+def read_blacklist_hostnames():
     hostnames = []
 
     if settings.BLACKLIST_HOSTS:
@@ -149,49 +158,74 @@ def get_blacklist_hostnames():
     except:
         pass
 
-    return list(filter(
+    return frozenset(filter(
         lambda x: x is not None,
         map(lambda x: clean_hostname(x), hostnames)
     ))
 
 
+def get_config_mtime():
+    try:
+        return os.path.getmtime(settings.CONFIG)
+    except (OSError, TypeError):
+        return None
+
+
+def reload_blacklist_hostnames():
+    blacklist['config_mtime'] = get_config_mtime()
+    blacklist['hostnames'] = read_blacklist_hostnames()
+    return blacklist['hostnames']
+
+
+def reload_blacklist_hostnames_if_changed():
+    if get_config_mtime() != blacklist['config_mtime']:
+        logger.info('Config file changed, reloading BLACKLIST_HOSTS')
+        reload_blacklist_hostnames()
+
+
+def get_blacklist_hostnames():
+    if blacklist['hostnames'] is None:
+        return reload_blacklist_hostnames()
+    return blacklist['hostnames']
+
+
 def is_hostname_blacklisted(hostname):
     hostname = clean_hostname(hostname)
     if not hostname:
         return False
 
-    blacklist_hosts = get_blacklist_hostnames()
-    if len(blacklist_hosts) == 0:
-        return False
+    return hostname in get_blacklist_hostnames()
 
-    return hostname in blacklist_hosts
 
-
-def connect_database(conf):
+def connect_database(conf, context=None):
     global connections, pending_connections
 
+    if context is None:
+        context = ConnectionContext(conf)
+
     hostname = conf.get('host')
     if is_hostname_blacklisted(hostname):
         raise Exception('Hostname "{}" is blacklisted'.format(hostname))
 
-    connection_id = get_connection_id(conf)
-    connection_params_id = get_connection_params_id(conf)
-    schema = get_connection_schema(conf)
-    connection_name = get_connection_name(conf, schema)
-    id_short = connection_id[:4]
+    connection_id = context.id
+    connection_params_id = context.params_id
 
     existing_connection = connections.get(connection_id)
+    if existing_connection and existing_connection['params_id'] == connection_params_id:
+        return existing_connection
+
+    schema = context.schema
+    connection_name = context.name
+    id_short = context.id_short
+
     if existing_connection:
-        if existing_connection['params_id'] == connection_params_id:
-            return existing_connection
-        else:
-            logger.info('[{}] Reconnecting to database "{}" because of different params ({} {})...'.format(
-                id_short,
-                connection_name,
-                connection_params_id,
-                existing_connection['params_id']
-            ))
-            dispose_connection(conf)
+        logger.info('[{}] Reconnecting to database "{}" because of different params ({} {})...'.format(
+            id_short,
+            connection_name,
+            connection_params_id,
+            existing_connection['params_id']
+        ))
+        dispose_connection(conf, context)
 
     init_start = datetime.now()
 
@@ -212,6 +246,7 @@ def connect_database(conf):
 
     pending_connections[connection_id] = pending_connection
     tunnel = None
+    ssl_files = list(filter(lambda x: x, [conf.get('ssl_ca'), conf.get('ssl_cert'), conf.get('ssl_key')]))
 
     try:
         tunnel = get_connection_tunnel(conf)
@@ -237,6 +272,7 @@ def connect_database(conf):
             'token': conf.get('token'),
             'init_start': init_start.isoformat(),
             'last_request': datetime.now(),
+            'ssl_files': ssl_files,
             **database_connection
         }
 
@@ -245,6 +281,8 @@ def connect_database(conf):
         if tunnel:
             tunnel.close()
 
+        certificate_store.forget_missing(ssl_files)
+
         raise e
     finally:
         if connection_id in pending_connections and pending_connections[connection_id].get('id') == pending_connection_id:
@@ -258,6 +296,9 @@ def dispose_connection_object(connection):
     try:
         connection['engine'].dispose()
 
+        if connection.get('async_engine'):
+            connection['async_engine'].sync_engine.dispose()
+
         if connection.get('tunnel'):
             connection['tunnel'].close()
 
@@ -266,10 +307,10 @@ def dispose_connection_object(connection):
         return False
 
 
-def dispose_connection(conf):
+def dispose_connection(conf, context=None):
     global connections
 
-    connection_id = get_connection_id(conf)
+    connection_id = context.id if context else get_connection_id(conf)
     connection = connections.get(connection_id)
 
     if connection and dispose_connection_object(connection):
@@ -280,13 +321,13 @@ def dispose_connection(conf):
 
 
 def dispose_request_connection(request):
-    return dispose_connection(get_conf(request))
+    context = request.get_connection_context()
+    return dispose_connection(context.conf, context)
 
 
 def get_connection(request):
-    conf = get_conf(request)
-    connection_id = get_connection_id(conf)
-    return connections.get(connection_id)
+    context = request.get_connection_context()
+    return connections.get(context.id)
 
 
 def connect_database_from_settings():
@@ -296,7 +337,8 @@ def connect_database_from_settings():
 
 
 def get_request_connection(request):
-    return connect_database(get_conf(request))
+    context = request.get_connection_context()
+    return connect_database(context.conf, context)
 
 
 def create_session(request):
@@ -304,16 +346,31 @@ def create_session(request):
     if not connection:
         return
 
-    conf = get_conf(request)
-    hostname = conf.get('host')
+    context = request.get_connection_context()
+    hostname = context.conf.get('host')
 
     if is_hostname_blacklisted(hostname):
-        dispose_connection(conf)
+        dispose_connection(context.conf, context)
         raise Exception('Hostname "{}" is blacklisted'.format(hostname))
 
     return connection['Session']()
 
 
+def cancel_request_queries(request):
+    sessions = list(request.parallel_sessions)
+
+    if request.session is not None:
+        sessions.append(request.session)
+
+    cancelled = sum(map(cancel_session_queries, sessions))
+    cancelled += sum(map(cancel_async_connection_query, list(request.async_connections)))
+
+    if cancelled:
+        logger.info('Cancelled {} running queries of closed request {}'.format(cancelled, request.path))
+
+    return cancelled
+
+
 def get_connection_id_short(request):
     connection = get_request_connection(request)
     if not connection or 'id' not in connection:
@@ -335,19 +392,44 @@ def get_engine(request):
     return connection['engine']
 
 
-def get_type_code_to_sql_type(request):
+def get_async_engine(request):
     connection = get_request_connection(request)
     if not connection:
         return
-    return connection['type_code_to_sql_type']
+    return connection.get('async_engine')
 
 
-def get_default_timezone(request):
+def get_type_code_to_sql_type(request):
     connection = get_request_connection(request)
-
     if not connection:
         return
+    return connection['type_code_to_sql_type']
+
+
+def refresh_default_timezone(connection, conf):
+    id_short = connection['id'][:4]
+
+    try:
+        session = connection['Session']()
+
+        try:
+            new_default_timezone = fetch_default_timezone(conf, session)
+        finally:
+            session.close()
+
+        if new_default_timezone is not None:
+            connection['default_timezone'] = new_default_timezone
+            logger.info('[{}] Default timezone updated: "{}"'.format(id_short, new_default_timezone))
+        else:
+            logger.info('[{}] Failed to update default timezone'.format(id_short))
+    except Exception as e:
+        logger.info('[{}] Failed to update default timezone: {}'.format(id_short, e))
+    finally:
+        connection['default_timezone_updated'] = datetime.now()
+        connection['default_timezone_refreshing'] = False
+
 
+def get_connection_default_timezone(connection, conf):
     default_timezone = connection.get('default_timezone')
     default_timezone_updated = connection.get('default_timezone_updated')
 
@@ -357,25 +439,23 @@ def get_default_timezone(request):
     hour_now = date_trunc_minutes(datetime.now())
     hour_timezone_updated = date_trunc_minutes(default_timezone_updated)
 
-    if hour_now.timestamp() != hour_timezone_updated.timestamp():
-        conf = get_conf(request)
-        connection_id = get_connection_id(conf)
-        id_short = connection_id[:4]
+    # Requests keep using current timezone while it is refreshed in background
+    if hour_now.timestamp() != hour_timezone_updated.timestamp() and not connection.get('default_timezone_refreshing'):
+        connection['default_timezone_refreshing'] = True
+        configuration.run_async(refresh_default_timezone, connection, conf)
 
-        new_default_timezone = fetch_default_timezone(conf, request.session)
-        new_default_timezone_updated = datetime.now()
+    return default_timezone
 
-        if new_default_timezone is not None:
-            connection['default_timezone'] = new_default_timezone
-            connection['default_timezone_updated'] = new_default_timezone_updated
 
-            logger.info('[{}] Default timezone updated: "{}"'.format(id_short, default_timezone))
+def get_default_timezone(request):
+    context = request.get_connection_context()
 
-            return new_default_timezone
-        else:
-            logger.info('[{}] Failed to update default timezone'.format(id_short))
+    if not context.default_timezone_resolved:
+        connection = get_request_connection(request)
+        context.default_timezone = get_connection_default_timezone(connection, context.conf) if connection else None
+        context.default_timezone_resolved = True
 
-    return default_timezone
+    return context.default_timezone
 
 
 @contextlib.contextmanager
@@ -412,11 +492,13 @@ def connection_cache_set(request, name, value):
 
 
 def reload_request_mapped_base(request):
-    conf = get_conf(request)
+    conf = request.get_connection_context().conf
     MappedBase = get_mapped_base(request)
 
     load_mapped_base(MappedBase, True)
     reload_request_model_descriptions_cache(request)
+    reload_request_model_serializers(request)
+    reload_request_model_filter_classes(request)
     reload_request_graphql_schema(request)
     dump_metadata_file(conf, MappedBase.metadata)
 
@@ -457,6 +539,14 @@ def reload_request_model_descriptions_cache(request):
         cache[MODEL_DESCRIPTIONS_HASH_CACHE_KEY] = None
 
 
+def reload_request_model_serializers(request):
+    connection_cache_set(request, MODEL_SERIALIZERS_CACHE_KEY, None)
+
+
+def reload_request_model_filter_classes(request):
+    connection_cache_set(request, MODEL_FILTER_CLASSES_CACHE_KEY, None)
+
+
 def release_inactive_graphql_schemas():
     if not settings.RELEASE_INACTIVE_GRAPHQL_SCHEMAS_TIMEOUT:
         return
@@ -489,3 +579,12 @@ def release_inactive_graphql_schemas():
         ))
 
         reload_connection_graphql_schema(connection)
+
+
+def release_unused_ssl_certificates():
+    referenced_paths = set()
+
+    for connection in connections.values():
+        referenced_paths.update(connection.get('ssl_files', []))
+
+    certificate_store.release_unused(referenced_paths)
@@ -4,6 +4,9 @@ from .discover import discover_connection, discover_tables
 from .metadata_file import dump_metadata_file, remove_metadata_file
 from .queryset import desc_uniform, empty_filter, get_queryset_order_by, get_queryset_limit, apply_default_ordering, \
     queryset_count_optimized, queryset_aggregate, queryset_group, get_sql_aggregate_func_by_name, \
-    get_sql_group_func_lookup, queryset_search
+    get_sql_group_func_lookup, queryset_search, get_queryset_ordering_keys, reverse_ordering_keys, \
+    queryset_keyset_filter, queryset_count_estimate, queryset_count_exact, get_queryset_driver_sql
 from .timezones import fetch_default_timezone, apply_session_timezone
+from .statements import cancel_session_queries, get_connection_compiled_cache_stats, \
+    apply_session_statement_timeout, track_async_connection, cancel_async_connection_query
 from .mongo import MongoDeclarativeMeta, MongoColumn, MongoDesc, MongoQueryset, MongoSession
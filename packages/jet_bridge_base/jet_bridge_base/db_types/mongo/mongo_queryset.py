@@ -81,6 +81,8 @@ class MongoQueryset(object):
                 acc[column_path] = {'$in': value}
             elif arg.operator == 'or':
                 acc['$or'] = list(map(lambda x: self.map_operator(x), arg.lhs))
+            elif arg.operator == 'and':
+                acc['$and'] = list(map(lambda x: self.map_operator(x), arg.lhs))
             elif arg.operator == 'not':
                 positive = self.map_operator(arg.lhs)
                 for key, value in positive.items():
@@ -1,10 +1,12 @@
+import json
+
 import pymongo
 import sqlalchemy
-from sqlalchemy import desc, sql, func, or_, cast
+from sqlalchemy import desc, sql, func, or_, and_, cast, tuple_
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import DeclarativeMeta
 from sqlalchemy.sql import operators, sqltypes, text
-from sqlalchemy.sql.elements import AnnotatedColumnElement, UnaryExpression
+from sqlalchemy.sql.elements import AnnotatedColumnElement, ColumnClause, UnaryExpression
 from bson import ObjectId
 
 from jet_bridge_base.db_types.mongo import MongoOperator
@@ -73,6 +75,108 @@ def apply_default_ordering(Model, queryset):
     return queryset
 
 
+# Engines where NULL is ordered after other values in ascending order
+KEYSET_NULLS_LAST_ENGINES = ['postgresql', 'oracle']
+KEYSET_ROW_VALUES_ENGINES = ['postgresql', 'mysql', 'sqlite']
+
+
+def get_queryset_ordering_keys(Model, queryset):
+    # Returns (column, descending) pairs or None if queryset is ordered by something other than columns
+    ordering = get_queryset_order_by(queryset) or []
+    keys = []
+
+    if isinstance(queryset, MongoQueryset):
+        mapper = inspect_uniform(Model)
+
+        for name, direction in ordering:
+            column = mapper.columns.get(name)
+            if column is None:
+                return
+            keys.append((column, direction == pymongo.DESCENDING))
+    else:
+        for item in ordering:
+            descending = False
+
+            if isinstance(item, UnaryExpression):
+                if item.modifier == operators.desc_op:
+                    descending = True
+                elif item.modifier != operators.asc_op:
+                    return
+                item = item.element
+
+            if not isinstance(item, ColumnClause):
+                return
+
+            keys.append((item, descending))
+
+    return keys
+
+
+def reverse_ordering_keys(queryset, keys):
+    return queryset.order_by(None).order_by(*map(lambda x: x[0] if x[1] else desc_uniform(x[0]), keys))
+
+
+def queryset_keyset_filter(Model, queryset, keys, values, reverse=False):
+    # Filters rows placed after values in queryset ordering (or before them if reverse)
+    if isinstance(queryset, MongoQueryset):
+        engine = None
+        and_uniform = lambda *x: MongoOperator('and', list(x))
+        or_uniform = lambda *x: MongoOperator('or', list(x))
+    else:
+        engine = get_session_engine(queryset.session)
+        and_uniform = and_
+        or_uniform = or_
+
+    nulls_last = engine in KEYSET_NULLS_LAST_ENGINES
+
+    def get_equals(column, value):
+        return column.__eq__(value)
+
+    def get_after(column, descending, value):
+        larger = descending == reverse
+        nulls_after = nulls_last == larger
+
+        if value is None:
+            return column.isnot(None) if not nulls_after else None
+
+        criterion = column.__gt__(value) if larger else column.__lt__(value)
+
+        if nulls_after and getattr(column, 'nullable', True):
+            return or_uniform(criterion, column.__eq__(None))
+
+        return criterion
+
+    if engine in KEYSET_ROW_VALUES_ENGINES \
+            and len(set(map(lambda x: x[1], keys))) == 1 \
+            and all(map(lambda x: x is not None, values)) \
+            and not any(map(lambda x: getattr(x[0], 'nullable', True), keys)):
+        columns = tuple_(*map(lambda x: x[0], keys))
+        row_values = tuple_(*values)
+
+        if keys[0][1] == reverse:
+            return queryset.filter(columns > row_values)
+        else:
+            return queryset.filter(columns < row_values)
+
+    criteria = []
+
+    for i, (column, descending) in enumerate(keys):
+        after = get_after(column, descending, values[i])
+
+        if after is None:
+            continue
+
+        equals = list(map(lambda x: get_equals(x[0][0], x[1]), zip(keys[:i], values[:i])))
+        criteria.append(and_uniform(*equals, after) if equals else after)
+
+    if not criteria:
+        return queryset.filter(empty_filter(Model))
+    elif len(criteria) == 1:
+        return queryset.filter(criteria[0])
+    else:
+        return queryset.filter(or_uniform(*criteria))
+
+
 def queryset_count_optimized_for_postgresql(session, db_table):
     try:
         cursor = session.execute(text('SELECT reltuples FROM pg_class WHERE relname = :db_table'), {'db_table': db_table})
@@ -93,6 +197,76 @@ def queryset_count_optimized_for_mysql(session, db_table):
         raise
 
 
+def get_queryset_driver_sql(session, queryset):
+    # SQL and parameters in DBAPI paramstyle of the session dialect
+    compiled = queryset.statement.compile(dialect=session.get_bind().dialect)
+    params = compiled.params
+
+    if compiled.positional:
+        params = tuple(map(lambda x: params[x], compiled.positiontup))
+
+    return str(compiled), params
+
+
+def queryset_count_estimate_for_postgresql(session, queryset):
+    sql, params = get_queryset_driver_sql(session, queryset)
+
+    try:
+        cursor = session.connection().exec_driver_sql('EXPLAIN (FORMAT JSON) {}'.format(sql), params)
+        plan = cursor.fetchone()[0]
+    except SQLAlchemyError:
+        session.rollback()
+        raise
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def queryset_count_estimate_for_mysql(session, queryset):
+    sql, params = get_queryset_driver_sql(session, queryset)
+
+    try:
+        cursor = session.connection().exec_driver_sql('EXPLAIN {}'.format(sql), params)
+        row = cursor.mappings().first()
+    except SQLAlchemyError:
+        session.rollback()
+        raise
+
+    filtered = row.get('filtered')
+    rows = int(row['rows'] or 0)
+
+    if filtered is not None:
+        rows = int(rows * float(filtered) / 100)
+
+    return rows
+
+
+def queryset_count_estimate(session, queryset):
+    # Planner row estimate for filtered queries, None if engine is not supported
+    if isinstance(queryset, MongoQueryset):
+        return
+
+    queryset = queryset.order_by(None)
+
+    try:
+        if get_session_engine(queryset.session) == 'postgresql':
+            return queryset_count_estimate_for_postgresql(session, queryset)
+        elif get_session_engine(queryset.session) == 'mysql':
+            return queryset_count_estimate_for_mysql(session, queryset)
+    except (SQLAlchemyError, KeyError, IndexError, TypeError, ValueError):
+        pass
+
+
+def queryset_count_exact(queryset):
+    try:
+        return queryset.order_by(None).count()
+    except SQLAlchemyError:
+        queryset.session.rollback()
+        raise
+
+
 def queryset_count_optimized(session, queryset):
     queryset = queryset.order_by(None)
 
@@ -1,5 +1,8 @@
 from .common import sql_inspect, sql_get_session_engine
 from .sql_reflect import sql_get_tables, sql_reflect
-from .sql_db import sql_init_database_connection, sql_build_engine_url, sql_create_connection_engine, sql_load_mapped_base, sql_load_database_table
+from .sql_db import sql_init_database_connection, sql_build_engine_url, sql_create_connection_engine, \
+    sql_create_async_engine, sql_load_mapped_base, sql_load_database_table
 from .sql_metadata_file import sql_dump_metadata_file, sql_load_metadata_file
+from .statements import sql_cancel_session_queries, sql_get_compiled_cache_stats, \
+    sql_apply_session_statement_timeout, sql_track_async_connection, sql_cancel_connection_tracked_query
 from .timezones import sql_fetch_default_timezone
@@ -6,4 +6,6 @@ def sql_inspect(cls):
 
 
 def sql_get_session_engine(session):
-    return session.bind.engine.name
+    # Also accepts a Connection, which is used instead of Session on the async execution path
+    bind = session.bind if hasattr(session, 'bind') else session
+    return bind.engine.name
@@ -4,8 +4,10 @@ from datetime import datetime
 
 from six.moves.urllib_parse import parse_qsl, quote_plus
 from sqlalchemy import MetaData, create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, scoped_session
 
+from jet_bridge_base import settings
 from jet_bridge_base.automap import automap_base
 from jet_bridge_base.utils.conf import get_connection_only_predicate
 from jet_bridge_base.utils.process import get_memory_usage_human, get_memory_usage
@@ -14,12 +16,20 @@ from jet_bridge_base.logger import logger
 
 from .sql_metadata_file import sql_load_metadata_file, sql_dump_metadata_file
 from .sql_reflect import sql_reflect
+from .statements import sql_track_compiled_cache
 from .timezones import sql_fetch_default_timezone
 from .type_codes import fetch_type_code_to_sql_type
 
+ASYNC_ENGINES = {
+    'postgresql': 'postgresql+asyncpg',
+    'mysql': 'mysql+aiomysql',
+    'sqlite': 'sqlite+aiosqlite'
+}
+
 
 def sql_init_database_connection(conf, tunnel, id_short, connection_name, schema, pending_connection):
     engine = sql_create_connection_engine(conf, tunnel)
+    compiled_cache_stats = sql_track_compiled_cache(engine)
     pending_connection['engine'] = engine
 
     Session = scoped_session(sessionmaker(bind=engine))
@@ -79,8 +89,15 @@ def sql_init_database_connection(conf, tunnel, id_short, connection_name, schema
                 logger.warning(
                     '[{}] Table "{}" does not have primary key and will be ignored'.format(id_short, table_name))
 
+        async_engine = sql_create_async_engine(conf, tunnel) if settings.ASYNC_DATABASE else None
+
+        if async_engine is not None:
+            sql_track_compiled_cache(async_engine.sync_engine, compiled_cache_stats)
+
         result = {
             'engine': engine,
+            'async_engine': async_engine,
+            'compiled_cache_stats': compiled_cache_stats,
             'Session': Session,
             'MappedBase': MappedBase,
             'type_code_to_sql_type': type_code_to_sql_type,
@@ -224,7 +241,7 @@ def sql_create_connection_engine(conf, tunnel):
         raise Exception('Database configuration is not set')
 
     if conf.get('engine') == 'sqlite':
-        return create_engine(engine_url)
+        return create_engine(engine_url, query_cache_size=settings.DATABASE_QUERY_CACHE_SIZE)
     elif conf.get('engine') == 'mysql':
         connect_args = {}
         ssl = {
@@ -243,6 +260,7 @@ def sql_create_connection_engine(conf, tunnel):
             pool_pre_ping=True,
             max_overflow=conf.get('connections_overflow'),
             pool_recycle=300,
+            query_cache_size=settings.DATABASE_QUERY_CACHE_SIZE,
             connect_args={
                 'connect_timeout': 5,
                 **connect_args
@@ -254,7 +272,8 @@ def sql_create_connection_engine(conf, tunnel):
             pool_size=conf.get('connections'),
             pool_pre_ping=True,
             max_overflow=conf.get('connections_overflow'),
-            pool_recycle=300
+            pool_recycle=300,
+            query_cache_size=settings.DATABASE_QUERY_CACHE_SIZE
         )
     elif conf.get('engine') == 'oracle':
         return create_engine(
@@ -262,7 +281,8 @@ def sql_create_connection_engine(conf, tunnel):
             pool_size=conf.get('connections'),
             pool_pre_ping=True,
             max_overflow=conf.get('connections_overflow'),
-            pool_recycle=300
+            pool_recycle=300,
+            query_cache_size=settings.DATABASE_QUERY_CACHE_SIZE
         )
     else:
         return create_engine(
@@ -271,10 +291,49 @@ def sql_create_connection_engine(conf, tunnel):
             pool_pre_ping=True,
             max_overflow=conf.get('connections_overflow'),
             pool_recycle=300,
+            query_cache_size=settings.DATABASE_QUERY_CACHE_SIZE,
             connect_args={'connect_timeout': 5}
         )
 
 
+def sql_create_async_engine(conf, tunnel):
+    async_engine = ASYNC_ENGINES.get(conf.get('engine'))
+
+    if not async_engine:
+        return
+
+    try:
+        from sqlalchemy.ext.asyncio import create_async_engine
+    except ImportError:
+        return
+
+    engine_url = make_url(sql_build_engine_url(conf, tunnel)).set(drivername=async_engine)
+
+    if async_engine == 'postgresql+asyncpg' and 'prepared_statement_cache_size' not in engine_url.query:
+        # asyncpg prepares statements server side, repeated query shapes skip parsing and planning
+        engine_url = engine_url.update_query_dict({
+            'prepared_statement_cache_size': str(settings.DATABASE_QUERY_CACHE_SIZE)
+        })
+
+    try:
+        if conf.get('engine') == 'sqlite':
+            engine = create_async_engine(engine_url, query_cache_size=settings.DATABASE_QUERY_CACHE_SIZE)
+        else:
+            engine = create_async_engine(
+                engine_url,
+                pool_size=conf.get('connections'),
+                pool_pre_ping=True,
+                max_overflow=conf.get('connections_overflow'),
+                pool_recycle=300,
+                query_cache_size=settings.DATABASE_QUERY_CACHE_SIZE
+            )
+    except ImportError as e:
+        logger.warning('Async database driver "{}" is not installed: {}'.format(async_engine, e))
+        return
+
+    return engine
+
+
 def sql_load_mapped_base(MappedBase, clear=False):
     def classname_for_table(base, tablename, table):
         return get_table_name(MappedBase.metadata, table)
@@ -0,0 +1,206 @@
+import threading
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import Pool
+
+try:
+    from sqlalchemy.engine.default import CACHE_HIT, CACHE_MISS
+except ImportError:
+    CACHE_HIT = CACHE_MISS = None
+
+from jet_bridge_base.logger import logger
+
+ACTIVE_CONNECTIONS_KEY = 'active_connections'
+ACTIVE_TRANSACTION_KEY = 'jet_active_transaction'
+STATEMENT_TIMEOUT_KEY = 'jet_statement_timeout'
+
+# Guards ownership of pooled connections between query cancelling and returning connections to the pool
+active_transactions_lock = threading.Lock()
+
+
+def sql_get_dbapi_connection(connection):
+    fairy = connection.connection
+    return getattr(fairy, 'dbapi_connection', None) or fairy.connection
+
+
+def sql_get_session_connection(session):
+    # Also accepts a Connection, which is used instead of Session on the async execution path
+    return session.connection() if isinstance(session, Session) else session
+
+
+def sql_apply_session_statement_timeout(session, timeout):
+    connection = sql_get_session_connection(session)
+    engine_name = connection.engine.name
+    timeout_ms = int(timeout * 1000)
+
+    if engine_name == 'postgresql':
+        # Reverted by PostgreSQL itself on commit or rollback
+        connection.execute(text('SET LOCAL statement_timeout = {}'.format(timeout_ms)))
+    elif engine_name == 'mysql' and getattr(connection.dialect, 'is_mariadb', False):
+        # Reset when connection is returned to pool
+        connection.execute(text('SET SESSION max_statement_time = {}'.format(timeout)))
+        connection.info[STATEMENT_TIMEOUT_KEY] = 'mariadb'
+    elif engine_name == 'mysql':
+        # Applies to SELECT statements only (MySQL 5.7.8+), reset when connection is returned to pool
+        connection.execute(text('SET SESSION MAX_EXECUTION_TIME = {}'.format(timeout_ms)))
+        connection.info[STATEMENT_TIMEOUT_KEY] = engine_name
+    elif engine_name == 'mssql':
+        # pyodbc query timeout in seconds, reset when connection is returned to pool
+        dbapi_connection = sql_get_dbapi_connection(connection)
+
+        if hasattr(dbapi_connection, 'timeout'):
+            dbapi_connection.timeout = max(int(timeout), 1)
+            connection.info[STATEMENT_TIMEOUT_KEY] = engine_name
+
+
+def sql_reset_statement_timeout(engine_name, dbapi_connection):
+    if engine_name in ['mysql', 'mariadb']:
+        cursor = dbapi_connection.cursor()
+        if engine_name == 'mariadb':
+            cursor.execute('SET SESSION max_statement_time = 0')
+        else:
+            cursor.execute('SET SESSION MAX_EXECUTION_TIME = 0')
+        cursor.close()
+    elif engine_name == 'mssql':
+        dbapi_connection.timeout = 0
+
+
+@event.listens_for(Pool, 'checkin')
+def sql_release_pool_connection(dbapi_connection, connection_record):
+    # Connection can be checked out by another request from now on, so it must no longer be cancelled
+    with active_transactions_lock:
+        connection_record.info.pop(ACTIVE_TRANSACTION_KEY, None)
+
+    engine_name = connection_record.info.pop(STATEMENT_TIMEOUT_KEY, None)
+
+    if engine_name is not None and dbapi_connection is not None:
+        try:
+            sql_reset_statement_timeout(engine_name, dbapi_connection)
+        except Exception as e:
+            logger.warning('Failed to reset statement timeout: {}'.format(e))
+
+
+def sql_track_compiled_cache(engine, stats=None):
+    # Statements are cached by structure with parameters bound separately, so repeated
+    # query shapes with different values are served from engine's compiled cache
+    if stats is None:
+        stats = {'hits': 0, 'misses': 0}
+
+    def after_cursor_execute(connection, cursor, statement, parameters, context, executemany):
+        cache_hit = getattr(context, 'cache_hit', None)
+
+        if cache_hit is None:
+            return
+        elif cache_hit is CACHE_HIT:
+            stats['hits'] += 1
+        elif cache_hit is CACHE_MISS:
+            stats['misses'] += 1
+
+    event.listen(engine, 'after_cursor_execute', after_cursor_execute)
+    return stats
+
+
+def sql_get_compiled_cache_stats(engine, stats):
+    compiled_cache = getattr(engine, '_compiled_cache', None)
+    total = stats['hits'] + stats['misses']
+
+    return {
+        'size': len(compiled_cache) if compiled_cache is not None else None,
+        'max_size': getattr(compiled_cache, 'capacity', None),
+        'hits': stats['hits'],
+        'misses': stats['misses'],
+        'hit_ratio': round(stats['hits'] / total, 3) if total else None
+    }
+
+
+def sql_cancel_connection_query(engine, dbapi_connection, is_active):
+    # is_active() is checked under the lock right before cancelling, so that a connection already
+    # returned to the pool and checked out by another request is never cancelled
+    if engine.name == 'sqlite':
+        if engine.dialect.is_async:
+            # aiosqlite runs queries in its worker thread, sqlite3 connection can be interrupted from any thread
+            dbapi_connection = dbapi_connection._connection._conn
+
+        with active_transactions_lock:
+            if not is_active():
+                return False
+            dbapi_connection.interrupt()
+        return True
+    elif engine.dialect.is_async:
+        # Other async drivers are cancelled together with the task awaiting the query
+        return False
+    elif engine.name == 'postgresql':
+        if hasattr(dbapi_connection, 'cancel'):
+            with active_transactions_lock:
+                if not is_active():
+                    return False
+                dbapi_connection.cancel()
+            return True
+
+        pid = dbapi_connection.get_backend_pid()
+
+        with engine.connect() as cancel_connection:
+            with active_transactions_lock:
+                if not is_active():
+                    return False
+                cancel_connection.execute(text('SELECT pg_cancel_backend(:pid)'), {'pid': pid})
+        return True
+    elif engine.name == 'mysql':
+        thread_id = int(dbapi_connection.thread_id())
+
+        with engine.connect() as cancel_connection:
+            with active_transactions_lock:
+                if not is_active():
+                    return False
+                cancel_connection.exec_driver_sql('KILL QUERY {}'.format(thread_id))
+        return True
+
+    # Other engines rely on statement timeout
+    return False
+
+
+def sql_track_connection(connection, owner):
+    # Connections are tracked only while checked out by owner, so that a connection
+    # returned to the pool and reused by another request is never cancelled
+    record_info = connection.info
+
+    with active_transactions_lock:
+        record_info[ACTIVE_TRANSACTION_KEY] = owner
+
+    return owner, connection.engine, sql_get_dbapi_connection(connection), record_info
+
+
+def sql_track_async_connection(connection):
+    return sql_track_connection(connection, object())
+
+
+def sql_cancel_connection_tracked_query(tracked):
+    owner, engine, dbapi_connection, record_info = tracked
+
+    def is_active():
+        return record_info.get(ACTIVE_TRANSACTION_KEY) is owner
+
+    try:
+        return sql_cancel_connection_query(engine, dbapi_connection, is_active)
+    except Exception as e:
+        logger.warning('Failed to cancel query: {}'.format(e))
+        return False
+
+
+def sql_cancel_session_queries(session):
+    tracked_connections = list(session.info.get(ACTIVE_CONNECTIONS_KEY, {}).values())
+    return len(list(filter(sql_cancel_connection_tracked_query, tracked_connections)))
+
+
+@event.listens_for(Session, 'after_begin')
+def sql_track_session_connection(session, transaction, connection):
+    session.info.setdefault(ACTIVE_CONNECTIONS_KEY, {})[transaction] = sql_track_connection(connection, transaction)
+
+
+@event.listens_for(Session, 'after_transaction_end')
+def sql_untrack_session_connection(session, transaction):
+    connections = session.info.get(ACTIVE_CONNECTIONS_KEY)
+
+    if connections:
+        connections.pop(transaction, None)
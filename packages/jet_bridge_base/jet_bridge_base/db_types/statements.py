@@ -0,0 +1,35 @@
+from .mongo import MongoSession
+from .sql import sql_cancel_session_queries, sql_get_compiled_cache_stats, sql_apply_session_statement_timeout, \
+    sql_track_async_connection, sql_cancel_connection_tracked_query
+
+
+def cancel_session_queries(session):
+    if isinstance(session, MongoSession):
+        return 0
+    else:
+        return sql_cancel_session_queries(session)
+
+
+def track_async_connection(connection):
+    # Async execution path uses SQL connections only
+    return sql_track_async_connection(connection)
+
+
+def cancel_async_connection_query(tracked):
+    return sql_cancel_connection_tracked_query(tracked)
+
+
+def apply_session_statement_timeout(session, timeout):
+    if isinstance(session, MongoSession):
+        pass
+    else:
+        sql_apply_session_statement_timeout(session, timeout)
+
+
+def get_connection_compiled_cache_stats(connection):
+    stats = connection.get('compiled_cache_stats')
+
+    if stats is None:
+        return
+
+    return sql_get_compiled_cache_stats(connection['engine'], stats)
@@ -1,5 +1,6 @@
 import dateparser
 from datetime import datetime
+from sqlalchemy import text
 
 from .common import get_session_engine
 from .mongo import MongoSession
@@ -18,10 +19,10 @@ def apply_session_timezone(session, timezone):
         pass
     else:
         if get_session_engine(session) == 'mysql':
-            session.execute('SET time_zone = :tz', {'tz': timezone})
+            session.execute(text('SET time_zone = :tz'), {'tz': timezone})
             session.info['_queries_timezone'] = timezone
         elif get_session_engine(session) in ['postgresql', 'mssql']:
             offset_hours = dateparser.parse(datetime.now().isoformat() + timezone).utcoffset().total_seconds() / 60 / 60
             offset_hours_str = '{:+}'.format(offset_hours).replace(".0", "")
-            session.execute('SET TIME ZONE :tz', {'tz': offset_hours_str})
+            session.execute(text('SET TIME ZONE :tz'), {'tz': offset_hours_str})
             session.info['_queries_timezone'] = timezone
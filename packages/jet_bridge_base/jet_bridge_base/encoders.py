@@ -8,6 +8,96 @@ import uuid
 import six
 from bson import ObjectId
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def convert_datetime(obj):
+    representation = obj.isoformat()
+    if representation.endswith('+00:00'):
+        representation = representation[:-6] + 'Z'
+    return representation
+
+
+def convert_date(obj):
+    return obj.isoformat()
+
+
+def convert_time(obj):
+    if obj.utcoffset() is not None:
+        raise ValueError("JSON can't represent timezone-aware times.")
+    representation = obj.isoformat()
+    return representation
+
+
+def convert_timedelta(obj):
+    return six.text_type(obj.total_seconds())
+
+
+def convert_decimal(obj):
+    return float(obj)
+
+
+def convert_text(obj):
+    return six.text_type(obj)
+
+
+def convert_binary(obj):
+    return obj.decode('utf-8')
+
+
+def convert_set(obj):
+    return list(obj)
+
+
+def convert_other(obj):
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    elif hasattr(obj, '__getitem__'):
+        try:
+            return dict(obj)
+        except Exception:
+            pass
+    elif hasattr(obj, '__iter__'):
+        return tuple(item for item in obj)
+    raise TypeError('Object of type {} is not JSON serializable'.format(type(obj).__name__))
+
+
+JSON_CONVERTERS = {
+    datetime.datetime: convert_datetime,
+    datetime.date: convert_date,
+    datetime.time: convert_time,
+    datetime.timedelta: convert_timedelta,
+    decimal.Decimal: convert_decimal,
+    uuid.UUID: convert_text,
+    ObjectId: convert_text,
+    six.binary_type: convert_binary,
+    set: convert_set,
+    frozenset: convert_set
+}
+
+json_converters_by_type = {}
+
+
+def get_json_converter(value_type):
+    converter = json_converters_by_type.get(value_type)
+
+    if converter is None:
+        # Subclasses are resolved through MRO once and then served from the dict
+        converter = next(
+            (JSON_CONVERTERS[x] for x in value_type.__mro__ if x in JSON_CONVERTERS),
+            convert_other
+        )
+        json_converters_by_type[value_type] = converter
+
+    return converter
+
+
+def json_default(obj):
+    return get_json_converter(type(obj))(obj)
+
 
 class JSONEncoder(json.JSONEncoder):
 
@@ -27,35 +117,26 @@ class JSONEncoder(json.JSONEncoder):
         return super(JSONEncoder, self).encode(clean_obj(o))
 
     def default(self, obj):
-        if isinstance(obj, datetime.datetime):
-            representation = obj.isoformat()
-            if representation.endswith('+00:00'):
-                representation = representation[:-6] + 'Z'
-            return representation
-        elif isinstance(obj, datetime.date):
-            return obj.isoformat()
-        elif isinstance(obj, datetime.time):
-            if self.is_aware(obj):
-                raise ValueError("JSON can't represent timezone-aware times.")
-            representation = obj.isoformat()
-            return representation
-        elif isinstance(obj, datetime.timedelta):
-            return six.text_type(obj.total_seconds())
-        elif isinstance(obj, decimal.Decimal):
-            return float(obj)
-        elif isinstance(obj, uuid.UUID):
-            return six.text_type(obj)
-        elif isinstance(obj, ObjectId) or type(obj) is ObjectId:
-            return six.text_type(obj)
-        elif isinstance(obj, six.binary_type):
-            return obj.decode('utf-8')
-        elif hasattr(obj, 'tolist'):
-            return obj.tolist()
-        elif hasattr(obj, '__getitem__'):
-            try:
-                return dict(obj)
-            except Exception:
-                pass
-        elif hasattr(obj, '__iter__'):
-            return tuple(item for item in obj)
-        return super(JSONEncoder, self).default(obj)
+        try:
+            return json_default(obj)
+        except TypeError:
+            return super(JSONEncoder, self).default(obj)
+
+
+if orjson is not None:
+    # orjson writes NaN/Infinity as null by itself, datetimes are passed to json_default
+    # to keep "Z" suffix and formatting of JSONEncoder
+    ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+else:
+    ORJSON_OPTIONS = None
+
+
+def dumps(obj, cls=JSONEncoder):
+    if orjson is not None and cls is JSONEncoder:
+        try:
+            return orjson.dumps(obj, default=json_default, option=ORJSON_OPTIONS).decode('utf-8')
+        except TypeError:
+            # Not supported by orjson (integers over 64 bit, deep nesting), use JSONEncoder instead
+            pass
+
+    return json.dumps(obj, cls=cls)
@@ -0,0 +1,8 @@
+from jet_bridge_base import status
+from jet_bridge_base.exceptions.api import APIException
+
+
+class Throttled(APIException):
+    default_detail = 'Request was throttled'
+    default_code = 'throttled'
+    default_status_code = status.HTTP_429_TOO_MANY_REQUESTS
@@ -26,5 +26,9 @@ class ArrayField(Field):
 
         return internal_value
 
+    def get_representation_converter(self):
+        if self.many:
+            return super(ArrayField, self).get_representation_converter()
+
     def to_representation_item(self, value):
         return value
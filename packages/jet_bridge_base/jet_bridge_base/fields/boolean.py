@@ -26,5 +26,9 @@ class BooleanField(Field):
             return False
         return bool(value)
 
+    def get_representation_converter(self):
+        if self.many:
+            return super(BooleanField, self).get_representation_converter()
+
     def to_representation_item(self, value):
         return value
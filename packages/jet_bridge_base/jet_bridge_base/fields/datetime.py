@@ -1,9 +1,9 @@
 import datetime
-import dateparser
 import six
 
 from jet_bridge_base.db import get_default_timezone
 from jet_bridge_base.fields.field import Field
+from jet_bridge_base.utils.datetime import parse_datetime
 
 
 def get_timezone_from_str(value):
@@ -34,16 +34,32 @@ class DateTimeField(Field):
             return
         value = six.text_type(value).strip()
 
-        try:
-            result = dateparser.parse(value)
-        except ValueError:
-            result = None
+        result = parse_datetime(value) if value else None
 
         if result is None:
             self.error('invalid')
 
         return result
 
+    def get_representation_converter(self):
+        if self.many:
+            return super(DateTimeField, self).get_representation_converter()
+
+        # Default timezone is resolved once for the whole column instead of once per value
+        request = self.context.get('request')
+        default_timezone = get_default_timezone(request) if request else None
+
+        def convert(value):
+            if value is None:
+                return
+
+            if default_timezone and value.tzinfo is None:
+                value = value.replace(tzinfo=default_timezone)
+
+            return value.isoformat()
+
+        return convert
+
     def to_representation_item(self, value):
         if value is None:
             return
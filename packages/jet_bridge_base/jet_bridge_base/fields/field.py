@@ -105,6 +105,12 @@ class Field(object):
     def to_representation_item(self, value):
         raise NotImplementedError
 
+    def get_representation_converter(self):
+        # None means that values are returned as is
+        if self.many:
+            return self.to_representation
+        return self.to_representation_item
+
     def to_representation(self, value):
         if self.many:
             return list(map(lambda x: self.to_representation_item(x), value or []))
@@ -23,6 +23,10 @@ class FloatField(Field):
         except (ValueError, TypeError):
             self.error('invalid')
 
+    def get_representation_converter(self):
+        if self.many:
+            return super(FloatField, self).get_representation_converter()
+
     def to_representation_item(self, value):
         if value is None:
             return
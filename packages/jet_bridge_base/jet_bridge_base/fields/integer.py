@@ -24,6 +24,10 @@ class IntegerField(Field):
         except (ValueError, TypeError):
             self.error('invalid')
 
+    def get_representation_converter(self):
+        if self.many:
+            return super(IntegerField, self).get_representation_converter()
+
     def to_representation_item(self, value):
         if value is None:
             return
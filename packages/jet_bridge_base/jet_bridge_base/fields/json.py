@@ -25,5 +25,9 @@ class JSONField(Field):
         else:
             return value
 
+    def get_representation_converter(self):
+        if self.many:
+            return super(JSONField, self).get_representation_converter()
+
     def to_representation_item(self, value):
         return value
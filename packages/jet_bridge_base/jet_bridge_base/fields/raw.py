@@ -6,5 +6,9 @@ class RawField(Field):
     def to_internal_value_item(self, value):
         return value
 
+    def get_representation_converter(self):
+        if self.many:
+            return super(RawField, self).get_representation_converter()
+
     def to_representation_item(self, value):
         return value
@@ -1,70 +1,108 @@
+import copy
+import threading
+
 from jet_bridge_base.db_types import inspect_uniform
 from jet_bridge_base.filters import lookups
 from jet_bridge_base.filters.filter import Filter
 from jet_bridge_base.filters.filter_for_dbfield import filter_for_column
+from jet_bridge_base.filters.filter_plan import FilterPlan
+
+filter_plans_lock = threading.Lock()
 
 
 class FilterClass(object):
     filters = []
+    filter_plan = None
+    declared_filter_names = None
 
     def __init__(self, *args, **kwargs):
         self.meta = getattr(self, 'Meta', None)
+        self.handler = None
+        self.request = None
         if 'context' in kwargs:
             self.handler = kwargs['context'].get('handler', None)
+            self.request = kwargs['context'].get('request', None)
         self.update_filters()
 
+    @classmethod
+    def create_filter_plan(cls):
+        meta = getattr(cls, 'Meta', None)
+        filter_plan = FilterPlan()
+
+        if meta and hasattr(meta, 'model'):
+            mapper = inspect_uniform(meta.model)
+            columns = mapper.columns
+
+            if hasattr(meta, 'fields'):
+                columns = filter(lambda x: x.name in meta.fields, columns)
+
+            for column in columns:
+                filter_plan.add_column(column.key, column, filter_for_column(column))
+
+        return filter_plan
+
+    @classmethod
+    def get_filter_plan(cls):
+        # Compiled once per filter class, requests of different threads may ask for it at the same time
+        filter_plan = cls.__dict__.get('filter_plan')
+
+        if filter_plan is None:
+            with filter_plans_lock:
+                filter_plan = cls.__dict__.get('filter_plan')
+
+                if filter_plan is None:
+                    filter_plan = cls.create_filter_plan()
+                    cls.filter_plan = filter_plan
+
+        return filter_plan
+
+    @classmethod
+    def get_declared_filter_names(cls):
+        declared_filter_names = cls.__dict__.get('declared_filter_names')
+
+        if declared_filter_names is None:
+            with filter_plans_lock:
+                declared_filter_names = cls.__dict__.get('declared_filter_names')
+
+                if declared_filter_names is None:
+                    declared_filter_names = list(filter(lambda x: isinstance(getattr(cls, x), Filter), dir(cls)))
+                    cls.declared_filter_names = declared_filter_names
+
+        return declared_filter_names
+
     def update_filters(self):
         filters = []
+        Model = self.meta.model if self.meta and hasattr(self.meta, 'model') else None
 
-        if self.meta:
-            if hasattr(self.meta, 'model'):
-                Model = self.meta.model
-                mapper = inspect_uniform(Model)
-                columns = mapper.columns
-
-                if hasattr(self.meta, 'fields'):
-                    columns = filter(lambda x: x.name in self.meta.fields, columns)
-
-                for column in columns:
-                    item = filter_for_column(column)
-                    for lookup in item['lookups']:
-                        for exclude in [False, True]:
-                            instance = item['filter_class'](
-                                name=column.key,
-                                column=column,
-                                lookup=lookup,
-                                exclude=exclude
-                            )
-                            filters.append(instance)
-
-        declared_filters = filter(lambda x: isinstance(x[1], Filter), map(lambda x: (x, getattr(self, x)), dir(self)))
-
-        for filter_name, filter_item in declared_filters:
+        for filter_name in self.get_declared_filter_names():
+            # Declared filters are class attributes shared between requests, so state is set on a copy
+            filter_item = copy.copy(getattr(self, filter_name))
             filter_item.name = filter_name
             filter_item.model = Model
             filter_item.handler = self.handler
+            filter_item.request = self.request
             filters.append(filter_item)
 
         self.filters = filters
 
     def filter_queryset(self, request, queryset):
-        def get_filter_value(name, filters_instance=None):
+        def get_filter_value(name):
             return request.get_argument_safe(name, None)
 
+        queryset = self.get_filter_plan().filter_queryset(queryset, request.query_arguments.keys(), get_filter_value)
+
         for item in self.filters:
-            if item.name:
-                argument_name = '{}__{}'.format(item.name, item.lookup)
+            argument_name = '{}__{}'.format(item.name, item.lookup)
+            if item.exclude:
+                argument_name = 'exclude__{}'.format(argument_name)
+            value = get_filter_value(argument_name)
+
+            if value is None and item.lookup == lookups.DEFAULT_LOOKUP:
+                argument_name = item.name
                 if item.exclude:
                     argument_name = 'exclude__{}'.format(argument_name)
-                value = get_filter_value(argument_name, item)
-
-                if value is None and item.lookup == lookups.DEFAULT_LOOKUP:
-                    argument_name = item.name
-                    if item.exclude:
-                        argument_name = 'exclude__{}'.format(argument_name)
-                    value = get_filter_value(argument_name, item)
-            else:
-                value = None
+                value = get_filter_value(argument_name)
 
             queryset = item.filter(queryset, value)
+
         return queryset
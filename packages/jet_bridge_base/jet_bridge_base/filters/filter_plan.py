@@ -0,0 +1,58 @@
+from jet_bridge_base.filters import lookups
+
+
+class FilterPlan(object):
+    """
+    Column filters compiled once and indexed by query argument name, so that a request visits
+    only filters for arguments it actually has instead of every column/lookup/exclude combination.
+    """
+
+    def __init__(self):
+        self.filters = []
+        self.arguments = {}
+
+    def add_column(self, name, column, filter_data):
+        for lookup in filter_data['lookups']:
+            for exclude in [False, True]:
+                instance = filter_data['filter_class'](
+                    name=name,
+                    column=column,
+                    lookup=lookup,
+                    exclude=exclude
+                )
+                position = len(self.filters)
+                prefix = 'exclude__' if exclude else ''
+
+                self.filters.append(instance)
+                self.arguments['{}{}__{}'.format(prefix, name, lookup)] = (position, True)
+
+                if lookup == lookups.DEFAULT_LOOKUP:
+                    # "name" is used only when "name__exact" is not passed
+                    self.arguments.setdefault('{}{}'.format(prefix, name), (position, False))
+
+    def get_filter_values(self, argument_names, get_value):
+        values = {}
+
+        for argument_name in argument_names:
+            item = self.arguments.get(argument_name)
+            if item is None:
+                continue
+
+            position, primary = item
+            if not primary and position in values:
+                continue
+
+            value = get_value(argument_name)
+            if value is not None:
+                values[position] = value
+
+        return values
+
+    def filter_queryset(self, queryset, argument_names, get_value):
+        values = self.get_filter_values(argument_names, get_value)
+
+        # Filters are applied in plan order to keep generated queries the same for equal arguments
+        for position in sorted(values.keys()):
+            queryset = self.filters[position].filter(queryset, values[position])
+
+        return queryset
@@ -1,3 +1,4 @@
+from jet_bridge_base.db import get_request_connection, MODEL_FILTER_CLASSES_CACHE_KEY
 from jet_bridge_base.filters.filter_class import FilterClass
 from jet_bridge_base.filters.model_m2m import get_model_m2m_filter
 from jet_bridge_base.filters.model_relation import get_model_relation_filter
@@ -6,10 +7,10 @@ from jet_bridge_base.filters.model_segment import get_model_segment_filter
 from jet_bridge_base.filters.order_by import OrderFilter
 
 
-def get_model_filter_class(request, Model):
+def create_model_filter_class(request, Model):
     search_filter = get_model_search_filter(Model)
     model_m2m_filter = get_model_m2m_filter(Model)
-    model_segment_filter = get_model_segment_filter(request, Model)
+    model_segment_filter = get_model_segment_filter(Model)
     model_relation_filter = get_model_relation_filter(request, Model)
 
     class ModelFilterClass(FilterClass):
@@ -23,3 +24,28 @@ def get_model_filter_class(request, Model):
             model = Model
 
     return ModelFilterClass
+
+
+def get_model_filter_class(request, Model):
+    connection = get_request_connection(request)
+
+    if not connection:
+        return create_model_filter_class(request, Model)
+
+    # Filter classes (and their compiled filter plans) are kept until connection schema is reloaded
+    with connection['lock']:
+        model_filter_classes = connection['cache'].get(MODEL_FILTER_CLASSES_CACHE_KEY)
+
+        if model_filter_classes is None:
+            model_filter_classes = {}
+            connection['cache'][MODEL_FILTER_CLASSES_CACHE_KEY] = model_filter_classes
+
+        filter_class = model_filter_classes.get(Model)
+
+        if filter_class is None:
+            filter_class = create_model_filter_class(request, Model)
+            filter_class.get_filter_plan()
+            filter_class.get_declared_filter_names()
+            model_filter_classes[Model] = filter_class
+
+    return filter_class
@@ -0,0 +1,164 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import time
+from collections import OrderedDict
+
+from jet_bridge_base import encoders, settings
+from jet_bridge_base.db_types import get_queryset_ordering_keys, reverse_ordering_keys, queryset_keyset_filter
+from jet_bridge_base.exceptions.missing_argument_error import MissingArgumentError
+from jet_bridge_base.exceptions.validation_error import ValidationError
+from jet_bridge_base.paginators.pagination import Pagination
+from jet_bridge_base.responses.json import JSONResponse
+from jet_bridge_base.serializers.model_serializer import get_column_data_type
+from jet_bridge_base.utils.http import replace_query_param
+
+
+class CursorPagination(Pagination):
+    """
+    Keyset pagination: the cursor holds ordering key values of the last (or first) row of a page,
+    next page is selected with a range filter on these values instead of OFFSET. No count is made.
+    """
+
+    default_page_size = 25
+    cursor_query_param = '_cursor'
+    page_size_query_param = '_per_page'
+    max_page_size = 10000
+
+    page_size = None
+    data_query_time = None
+    next_cursor = None
+    previous_cursor = None
+
+    def get_cursor_signature(self, payload, keys):
+        # Cursor is bound to the ordering it was made for, edited cursors are rejected
+        ordering = ','.join(map(lambda x: '{}{}'.format('-' if x[1] else '', x[0].key), keys))
+        secret = (settings.TOKEN or settings.BEARER_AUTH_KEY or '').encode('utf-8')
+        message = '{}:{}'.format(ordering, payload).encode('utf-8')
+        return hmac.new(secret, message, hashlib.sha256).hexdigest()[:16]
+
+    def encode_cursor(self, values, keys, reverse=False):
+        data = {'v': values}
+        if reverse:
+            data['r'] = True
+        payload = base64.urlsafe_b64encode(encoders.dumps(data).encode('utf-8')).decode('ascii').rstrip('=')
+        return '{}.{}'.format(payload, self.get_cursor_signature(payload, keys))
+
+    def decode_cursor(self, value, keys):
+        payload, _, signature = value.partition('.')
+
+        expected_signature = self.get_cursor_signature(payload, keys)
+
+        if not hmac.compare_digest(signature.encode('utf-8'), expected_signature.encode('utf-8')):
+            raise ValidationError('Invalid cursor')
+
+        try:
+            data = json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)).decode('utf-8'))
+            values = data['v']
+            reverse = bool(data.get('r', False))
+        except (ValueError, TypeError, KeyError):
+            raise ValidationError('Invalid cursor')
+
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValidationError('Invalid cursor')
+
+        def map_value(item):
+            (column, _), value = item
+            if value is None:
+                return
+            field = get_column_data_type(column)(context={'model_field': column})
+            return field.to_internal_value(value)
+
+        return list(map(map_value, zip(keys, values))), reverse
+
+    def get_row_values(self, row, keys):
+        def map_value(key):
+            value = getattr(row, key[0].key)
+            # Same format as BinaryField expects, other values are decoded by their fields from JSON
+            if isinstance(value, bytes):
+                return binascii.hexlify(value).decode('ascii')
+            return value
+
+        return list(map(map_value, keys))
+
+    def paginate_queryset(self, request, queryset, handler):
+        page_size = self.get_page_size(request, handler)
+        Model = handler.get_model(request)
+        keys = get_queryset_ordering_keys(Model, queryset)
+
+        if not keys:
+            raise ValidationError('Cursor pagination is supported only for ordering by columns')
+
+        cursor = request.get_argument(self.cursor_query_param, None)
+        values, reverse = self.decode_cursor(cursor, keys) if cursor else (None, False)
+
+        if values is not None:
+            queryset = queryset_keyset_filter(Model, queryset, keys, values, reverse=reverse)
+
+        if reverse:
+            queryset = reverse_ordering_keys(queryset, keys)
+
+        data_query_start = time.time()
+        result = list(queryset.limit(page_size + 1))
+        data_query_end = time.time()
+
+        self.data_query_time = round(data_query_end - data_query_start, 3)
+        self.page_size = page_size
+
+        has_more = len(result) > page_size
+        result = result[:page_size]
+
+        if reverse:
+            result.reverse()
+
+        first_values = self.get_row_values(result[0], keys) if result else values
+        last_values = self.get_row_values(result[-1], keys) if result else values
+        has_next = has_more if not reverse else values is not None
+        has_previous = has_more if reverse else values is not None
+
+        self.next_cursor = self.encode_cursor(last_values, keys) if has_next and last_values else None
+        self.previous_cursor = self.encode_cursor(first_values, keys, reverse=True) \
+            if has_previous and first_values else None
+
+        return result
+
+    def get_cursor_link(self, request, cursor):
+        if cursor is None:
+            return None
+        url = request.full_url()
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_paginated_data(self, request, rows, results):
+        return OrderedDict([
+            ('next', self.get_cursor_link(request, self.next_cursor)),
+            ('previous', self.get_cursor_link(request, self.previous_cursor)),
+            *results.items(),
+            ('per_page', self.page_size),
+            ('has_more', self.next_cursor is not None),
+            ('next_cursor', self.next_cursor),
+            ('previous_cursor', self.previous_cursor),
+            ('data_query_time', self.data_query_time),
+        ])
+
+    def get_paginated_response(self, request, data, response_class=JSONResponse):
+        return response_class(self.get_paginated_data(request, data, OrderedDict([('results', data)])))
+
+    def get_paginated_columns_response(self, request, data, response_class=JSONResponse):
+        return response_class(self.get_paginated_data(request, data['rows'], data))
+
+    def get_page_size(self, request, handler):
+        if self.page_size_query_param:
+            try:
+                result = int(request.get_argument(self.page_size_query_param))
+                result = max(result, 1)
+
+                if self.max_page_size:
+                    result = min(result, self.max_page_size)
+
+                return result
+            except (MissingArgumentError, ValueError):
+                pass
+
+        return self.default_page_size
@@ -2,11 +2,12 @@ import time
 from collections import OrderedDict
 import math
 
-from jet_bridge_base.db_types import queryset_count_optimized
 from jet_bridge_base.exceptions.missing_argument_error import MissingArgumentError
 from jet_bridge_base.paginators.pagination import Pagination
 from jet_bridge_base.responses.json import JSONResponse
+from jet_bridge_base.utils.count import queryset_count
 from jet_bridge_base.utils.http import replace_query_param, remove_query_param
+from jet_bridge_base.utils.parallel import submit_parallel_query
 
 
 class PageNumberPagination(Pagination):
@@ -16,6 +17,8 @@ class PageNumberPagination(Pagination):
     max_page_size = 10000
 
     count = None
+    count_estimated = False
+    count_token = None
     count_query_time = None
     page_number = None
     page_size = None
@@ -31,20 +34,33 @@ class PageNumberPagination(Pagination):
         if not page_size:
             return None
 
+        count_future = None
+
+        # First page count is not needed when the page is not full, so it is run after the page only.
+        # For other pages count is run on a separate connection while the page is fetched
+        if page_number > 1:
+            count_future = submit_parallel_query(
+                request,
+                lambda session: self.get_queryset_count(request, queryset.with_session(session), session)
+            )
+
         data_query_start = time.time()
         result = list(queryset.offset((page_number - 1) * page_size).limit(page_size))
         data_query_end = time.time()
 
         self.data_query_time = round(data_query_end - data_query_start, 3)
 
-        count_query_start = time.time()
         if page_number == 1 and len(result) < page_size:
-            self.count = len(result)
+            count = {'count': len(result), 'count_query_time': 0}
+        elif count_future is not None:
+            count = count_future.result()
         else:
-            self.count = queryset_count_optimized(request.session, queryset)
-        count_query_end = time.time()
+            count = self.get_queryset_count(request, queryset)
 
-        self.count_query_time = round(count_query_end - count_query_start, 3)
+        self.count = count['count']
+        self.count_estimated = count.get('estimated', False)
+        self.count_token = count.get('count_token')
+        self.count_query_time = count['count_query_time']
 
         self.page_number = page_number
         self.page_size = page_size
@@ -52,21 +68,44 @@ class PageNumberPagination(Pagination):
 
         return result
 
+    def get_queryset_count(self, request, queryset, session=None):
+        count_query_start = time.time()
+        count = queryset_count(request, queryset, session=session)
+        count_query_end = time.time()
+
+        count['count_query_time'] = round(count_query_end - count_query_start, 3)
+
+        return count
+
     def get_pages_count(self):
         return int(math.ceil(self.count / self.page_size)) if self.count is not None else None
 
-    def get_paginated_response(self, request, data):
-        return JSONResponse(OrderedDict([
+    def get_paginated_data(self, request, rows, results):
+        data = OrderedDict([
             ('count', self.count),
-            ('next', self.get_next_link(request, data)),
+            ('next', self.get_next_link(request, rows)),
             ('previous', self.get_previous_link(request)),
-            ('results', data),
+            *results.items(),
             ('num_pages', self.get_pages_count()),
             ('per_page', self.page_size),
-            ('has_more', self.has_next_potential(data)),
+            ('has_more', self.has_next_potential(rows)),
             ('data_query_time', self.data_query_time),
             ('count_query_time', self.count_query_time),
-        ]))
+        ])
+
+        if self.count_estimated:
+            data['count_estimated'] = True
+
+        if self.count_token is not None:
+            data['count_token'] = self.count_token
+
+        return data
+
+    def get_paginated_response(self, request, data, response_class=JSONResponse):
+        return response_class(self.get_paginated_data(request, data, OrderedDict([('results', data)])))
+
+    def get_paginated_columns_response(self, request, data, response_class=JSONResponse):
+        return response_class(self.get_paginated_data(request, data['rows'], data))
 
     def get_page_number(self, request, handler):
         try:
@@ -5,5 +5,8 @@ class Pagination(object):
     def paginate_queryset(self, request, queryset, handler):
         raise NotImplementedError
 
-    def get_paginated_response(self, request, data):
+    def get_paginated_response(self, request, data, response_class=None):
+        raise NotImplementedError
+
+    def get_paginated_columns_response(self, request, data, response_class=None):
         raise NotImplementedError
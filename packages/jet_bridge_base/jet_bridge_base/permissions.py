@@ -1,6 +1,9 @@
+from functools import lru_cache
+
 from jet_bridge_base import settings
 from jet_bridge_base.sentry import sentry_controller
-from jet_bridge_base.utils.backend import project_auth
+from jet_bridge_base.utils.backend import cached_project_auth
+from jet_bridge_base.utils.cache import TTLCache
 from jet_bridge_base.utils.crypt import get_sha256_hash
 from jet_bridge_base.utils.token import decompress_permissions, parse_token, JWT_TOKEN_PREFIX, USER_TOKEN_PREFIX, \
     PROJECT_TOKEN_PREFIX, BEARER_TOKEN_PREFIX, decode_jwt_token
@@ -15,8 +18,67 @@ class BasePermission(object):
         return True
 
 
+class CompiledPermissions(object):
+    """
+    Decompressed JWT permissions indexed by (permission_type, permission_object).
+    """
+
+    def __init__(self, permissions):
+        self.models = {}
+        self.objects = {}
+
+        for item in permissions:
+            item_type = item.get('permission_type', '')
+            item_object = item.get('permission_object', '')
+            item_actions = item.get('permission_actions', '')
+
+            if item_type == 'model':
+                item_object_model = item_object.split('.', 1)[-1:][0]
+                resource_token_hash = item.get('resource_token_hash', '')
+                self.models.setdefault(item_object_model, []).append((resource_token_hash, item_actions))
+
+            self.objects.setdefault((item_type, item_object), []).append(item_actions)
+
+    def has_permission(self, permission_type, permission_object, permission_actions, token_hash):
+        if permission_type == 'model':
+            for resource_token_hash, item_actions in self.models.get(permission_object, []):
+                # TODO: make check non optional
+                if resource_token_hash and resource_token_hash != token_hash:
+                    continue
+
+                if permission_actions in item_actions:
+                    return True
+        else:
+            for item_actions in self.objects.get((permission_type, permission_object), []):
+                if permission_actions in item_actions:
+                    return True
+
+        return False
+
+
+jwt_permissions_cache = TTLCache(max_size=1024, ttl=60 * 60)
+
+
+@lru_cache(maxsize=256)
+def get_project_token_hash(project_token):
+    return get_sha256_hash(project_token.replace('-', '').lower())
+
+
+def get_compiled_permissions(user_permissions, cache_key=None):
+    if 'permissions' not in user_permissions:
+        return CompiledPermissions([])
+
+    def compile_permissions():
+        return CompiledPermissions(decompress_permissions(user_permissions['permissions']))
+
+    if cache_key is None:
+        return compile_permissions()
+
+    return jwt_permissions_cache.get_or_set(cache_key, compile_permissions)
+
+
 class HasProjectPermissions(BasePermission):
-    def has_view_permissions(self, view_permissions, user_permissions, project_token):
+    def has_view_permissions(self, view_permissions, user_permissions, project_token, cache_key=None):
         if not view_permissions:
             return True
         elif user_permissions.get('owner'):
@@ -24,11 +86,6 @@ class HasProjectPermissions(BasePermission):
         elif user_permissions.get('super_group'):
             return True
 
-        if 'permissions' in user_permissions:
-            permissions = decompress_permissions(user_permissions['permissions'])
-        else:
-            permissions = []
-
         view_permission_type = view_permissions.get('permission_type', '')
         view_permission_object = view_permissions.get('permission_object', '')
         view_permission_actions = view_permissions.get('permission_actions', '')
@@ -44,31 +101,15 @@ class HasProjectPermissions(BasePermission):
         if not project_token:
             return False
 
-        token_hash = get_sha256_hash(project_token.replace('-', '').lower())
-
-        for item in permissions:
-            item_type = item.get('permission_type', '')
-            item_object = item.get('permission_object', '')
-            item_actions = item.get('permission_actions', '')
-
-            if view_permission_type == 'model':
-                resource_token_hash = item.get('resource_token_hash', '')
-                item_object_model = item_object.split('.', 1)[-1:][0]
-
-                # TODO: make check non optional
-                if resource_token_hash and resource_token_hash != token_hash:
-                    continue
+        permissions = get_compiled_permissions(user_permissions, cache_key)
+        token_hash = get_project_token_hash(project_token)
 
-                if item_type != view_permission_type or item_object_model != view_permission_object:
-                    continue
-            else:
-                if item_type != view_permission_type or item_object != view_permission_object:
-                    continue
-
-            if view_permission_actions in item_actions:
-                return True
-
-        return False
+        return permissions.has_permission(
+            view_permission_type,
+            view_permission_object,
+            view_permission_actions,
+            token_hash
+        )
 
     def has_permission(self, view, request):
         token = parse_token(request.headers.get('AUTHORIZATION'))
@@ -108,16 +149,19 @@ class HasProjectPermissions(BasePermission):
             else:
                 sentry_controller.set_user(None)
 
-            return self.has_view_permissions(view_permissions, user_permissions, project_token)
+            signature = token['value'].rsplit('.', 1)[-1]
+            cache_key = (signature, project)
+
+            return self.has_view_permissions(view_permissions, user_permissions, project_token, cache_key)
         elif token['type'] == USER_TOKEN_PREFIX:
-            result = project_auth(token['value'], project_token, view_permissions, token['params'])
+            result = cached_project_auth(token['value'], project_token, view_permissions, token['params'])
 
             # if result.get('warning'):
             #     view.headers['X-Application-Warning'] = result['warning']
 
             return result['result']
         elif token['type'] == PROJECT_TOKEN_PREFIX:
-            result = project_auth(token['value'], project_token, view_permissions, token['params'])
+            result = cached_project_auth(token['value'], project_token, view_permissions, token['params'])
 
             # if result.get('warning'):
             #     view.headers['X-Application-Warning'] = result['warning']
@@ -1,30 +1,52 @@
 import json
-import os
-import tempfile
 import time
 from json import JSONDecodeError
 
+from jet_bridge_base.certificate_store import certificate_store
 from jet_bridge_base.exceptions.request_error import RequestError
 from jet_bridge_base.exceptions.validation_error import ValidationError
-from jet_bridge_base.utils.conf import get_conf
+from jet_bridge_base.utils.cache import TTLCache
+from jet_bridge_base.utils.conf import get_conf, ConnectionContext
 from jet_bridge_base.utils.crypt import get_sha256_hash
 from jet_bridge_base.utils.process import get_memory_usage
 from six import string_types
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
 
 from jet_bridge_base import settings
 from jet_bridge_base.exceptions.missing_argument_error import MissingArgumentError
+from jet_bridge_base.logger import logger
 
 _ARG_DEFAULT = object()
 
+bridge_settings_cache = TTLCache(max_size=1024, ttl=10 * 60)
+
+
+def decrypt_bridge_settings(bridge_settings_encoded):
+    from jet_bridge_base.utils.crypt import decrypt
+
+    secret_key = settings.TOKEN.replace('-', '').lower()
+    cache_key = get_sha256_hash('{}:{}'.format(secret_key, bridge_settings_encoded))
+    result = bridge_settings_cache.get(cache_key)
+
+    if result is None:
+        decrypted = decrypt(bridge_settings_encoded, secret_key)
+        result = json.loads(decrypted)
+        bridge_settings_cache.set(cache_key, result)
+
+    return result
+
 
 class Request(object):
 
     session = None
     bridge_settings = None
+    connection_context = None
     project = None
     environment = None
     resource_token = None
     sso_shared_data = None
+    paginator = None
     context = {}
 
     track_start_time = None
@@ -61,6 +83,8 @@ class Request(object):
         self.original_request = original_request
         self.original_handler = original_handler
         self.action = action
+        self.parallel_sessions = set()
+        self.async_connections = []
 
         content_type = self.headers.get('CONTENT_TYPE', '')
 
@@ -160,14 +184,9 @@ class Request(object):
         if not bridge_settings_encoded:
             return
 
-        from jet_bridge_base.utils.crypt import decrypt
-
         try:
-            secret_key = settings.TOKEN.replace('-', '').lower()
-            decrypted = decrypt(bridge_settings_encoded, secret_key)
-
             self.bridge_settings = {
-                **json.loads(decrypted),
+                **decrypt_bridge_settings(bridge_settings_encoded),
                 'raw': bridge_settings_encoded
             }
         except Exception:
@@ -177,32 +196,21 @@ class Request(object):
         database_ssl_cert = self.bridge_settings.get('database_ssl_cert')
         database_ssl_key = self.bridge_settings.get('database_ssl_key')
 
-        temp_dir = os.path.join(tempfile.gettempdir(), 'ssl')
-
-        try:
-            os.makedirs(temp_dir)
-        except OSError:
-            pass
-
         if database_ssl_ca:
-            self.bridge_settings['database_ssl_ca'] = self.save_file(temp_dir, '{}-ca.pem', database_ssl_ca)
+            self.bridge_settings['database_ssl_ca'] = certificate_store.save('{}-ca.pem', database_ssl_ca)
 
         if database_ssl_cert:
-            self.bridge_settings['database_ssl_cert'] = self.save_file(temp_dir, '{}-cert.pem', database_ssl_cert)
+            self.bridge_settings['database_ssl_cert'] = certificate_store.save('{}-cert.pem', database_ssl_cert)
 
         if database_ssl_key:
-            self.bridge_settings['database_ssl_key'] = self.save_file(temp_dir, '{}-key.pem', database_ssl_key)
+            self.bridge_settings['database_ssl_key'] = certificate_store.save('{}-key.pem', database_ssl_key)
 
         return self.bridge_settings
 
-    def save_file(self, dir_path, name, content):
-        file_hash = get_sha256_hash(content)
-        file_path = os.path.join(dir_path, name.format(file_hash))
-
-        with open(file_path, 'w') as f:
-            f.write(content)
-
-        return f.name
+    def get_connection_context(self):
+        if self.connection_context is None:
+            self.connection_context = ConnectionContext(get_conf(self))
+        return self.connection_context
 
     def start_track(self):
         self.track_start_time = time.time()
@@ -218,12 +226,40 @@ class Request(object):
             return
         return get_memory_usage() - self.track_start_memory_usage
 
-    def apply_rls_if_enabled(self):
-        conf = get_conf(self)
+    def get_rls_identity(self):
+        # Identifies rows visible to the request when RLS is used, None if RLS is disabled
+        conf = self.get_connection_context().conf
 
         if conf.get('rls_type') == 'supabase' and conf.get('rls_sso'):
             shared_data = (self.sso_shared_data or {}).get(conf['rls_sso'], {})
-            user_id = shared_data.get('user_id')
+            return conf['rls_type'], conf['rls_sso'], shared_data.get('user_id')
+
+    def apply_statement_timeout(self, session=None):
+        # Limits read queries only, so it is applied before anything else is set up in the transaction
+        if session is None:
+            session = self.session
+
+        timeout = self.get_connection_context().conf.get('statement_timeout')
+
+        if not timeout:
+            return
+
+        from jet_bridge_base.db_types import apply_session_statement_timeout
+
+        try:
+            apply_session_statement_timeout(session, timeout)
+        except SQLAlchemyError as e:
+            logger.warning('Failed to set statement timeout: {}'.format(e))
+            session.rollback()
+
+    def apply_rls_if_enabled(self, session=None):
+        if session is None:
+            session = self.session
+
+        rls_identity = self.get_rls_identity()
+
+        if rls_identity is not None:
+            user_id = rls_identity[2]
 
-            self.session.execute('SET ROLE authenticated')
-            self.session.execute('SELECT set_config(\'request.jwt.claim.sub\', :uid, TRUE)', {'uid': user_id})
+            session.execute(text('SET ROLE authenticated'))
+            session.execute(text('SELECT set_config(\'request.jwt.claim.sub\', :uid, TRUE)'), {'uid': user_id})
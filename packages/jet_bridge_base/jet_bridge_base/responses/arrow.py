@@ -0,0 +1,257 @@
+from __future__ import absolute_import
+
+import datetime
+import io
+from itertools import chain, islice
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+from jet_bridge_base import encoders
+from jet_bridge_base.models import data_types
+from jet_bridge_base.responses.base import Response
+
+
+def get_arrow_types():
+    if pyarrow is None:
+        return {}
+
+    return {
+        data_types.CHAR: pyarrow.string(),
+        data_types.FIXED_CHAR: pyarrow.string(),
+        data_types.TEXT: pyarrow.string(),
+        data_types.UUID: pyarrow.string(),
+        data_types.SELECT: pyarrow.string(),
+        data_types.BOOLEAN: pyarrow.bool_(),
+        data_types.INTEGER: pyarrow.int64(),
+        data_types.BIG_INTEGER: pyarrow.int64(),
+        data_types.SMALL_INTEGER: pyarrow.int64(),
+        data_types.FLOAT: pyarrow.float64(),
+        data_types.DOUBLE_PRECISION: pyarrow.float64()
+    }
+
+
+ARROW_TYPES = get_arrow_types()
+
+
+ARROW_ERRORS = (pyarrow.ArrowException, TypeError, ValueError, OverflowError) if pyarrow is not None else ()
+
+
+def to_string_value(value):
+    if value is None:
+        return None
+    elif isinstance(value, (dict, list)):
+        return encoders.dumps(value)
+    elif isinstance(value, datetime.datetime):
+        # ISO format keeps UTC offset of each value
+        return encoders.convert_datetime(value)
+    return str(value)
+
+
+def is_timezones_kept(array, values):
+    # Timestamp array has a single time zone, values from other zones would be converted to it
+    if not pyarrow.types.is_timestamp(array.type):
+        return True
+
+    timezones = set(map(lambda x: x.tzinfo, filter(lambda x: isinstance(x, datetime.datetime), values)))
+    return len(timezones) <= 1
+
+
+def to_arrow_array(values, arrow_type=None):
+    try:
+        array = pyarrow.array(values, type=arrow_type)
+        if is_timezones_kept(array, values):
+            return array
+    except ARROW_ERRORS:
+        pass
+
+    if arrow_type is not None and arrow_type != pyarrow.string():
+        try:
+            array = pyarrow.array(values)
+            if is_timezones_kept(array, values):
+                return array
+        except ARROW_ERRORS:
+            pass
+
+    return pyarrow.array(list(map(to_string_value, values)), type=pyarrow.string())
+
+
+def to_arrow_array_strict(values, array, arrow_type):
+    # Result must have exactly arrow_type, values which can't be converted to it are replaced with nulls
+    if array.type == arrow_type:
+        return array
+    elif arrow_type == pyarrow.string():
+        return pyarrow.array(list(map(to_string_value, values)), type=arrow_type)
+
+    try:
+        return array.cast(arrow_type)
+    except ARROW_ERRORS:
+        pass
+
+    try:
+        return pyarrow.array(values, type=arrow_type)
+    except ARROW_ERRORS:
+        pass
+
+    def convert(value):
+        try:
+            pyarrow.array([value], type=arrow_type)
+            return value
+        except ARROW_ERRORS:
+            return None
+
+    return pyarrow.array(list(map(convert, values)), type=arrow_type)
+
+
+class ArrowResponse(Response):
+    """
+    Columnar data ({"columns": [...], "rows": [...], ...}) encoded as Arrow IPC stream.
+    Rows are read and written in batches. column_descriptions (if present) are used as schema
+    types, other columns take types of the first batches and later batches are converted to them.
+    Other keys are stored as JSON in schema metadata.
+    """
+
+    streaming = True
+    batch_size = 10000
+    # Batches read ahead at most while column types are unknown (all values are nulls)
+    max_schema_batches = 5
+    exclude_metadata = ['columns', 'column_descriptions']
+
+    def __init__(self, data=None, *args, **kwargs):
+        self.rows_key = kwargs.pop('rows_key', 'rows')
+        self.rendered_data = None
+        super(ArrowResponse, self).__init__(data, *args, **kwargs)
+
+    def default_headers(self):
+        return {'Content-Type': 'application/vnd.apache.arrow.stream', 'Vary': 'Accept'}
+
+    def get_column_types(self, columns):
+        column_descriptions = self.data.get('column_descriptions') or {}
+
+        def get_type(name):
+            description = column_descriptions.get(name) or {}
+            return description.get('field')
+
+        return list(map(get_type, columns))
+
+    def get_metadata(self):
+        metadata = dict(filter(
+            lambda x: x[0] not in self.exclude_metadata and x[0] != self.rows_key,
+            self.data.items()
+        ))
+        return {'jet': encoders.dumps(metadata)}
+
+    def iter_batches(self, columns, field_types):
+        arrow_types = list(map(lambda x: ARROW_TYPES.get(x), field_types))
+        rows = iter(self.data.get(self.rows_key) or [])
+        first = True
+
+        while True:
+            batch_rows = list(islice(rows, self.batch_size))
+            # Empty result still produces one batch so that schema has column types
+            if not batch_rows and not first:
+                break
+            first = False
+
+            batch_values = []
+            arrays = []
+            for i, arrow_type in enumerate(arrow_types):
+                values = list(map(lambda x: x[i], batch_rows))
+                batch_values.append(values)
+                arrays.append(to_arrow_array(values, arrow_type))
+
+            yield batch_values, arrays
+
+            if len(batch_rows) < self.batch_size:
+                break
+
+    def get_batches_types(self, batches, complete):
+        result = []
+
+        for i in range(len(batches[0][1])):
+            types = set(map(lambda x: x[1][i].type, batches)) - {pyarrow.null()}
+
+            if len(types) == 1:
+                result.append(next(iter(types)))
+            elif len(types) > 1:
+                result.append(pyarrow.string())
+            elif complete:
+                result.append(pyarrow.null())
+            else:
+                # Values of later batches are unknown, string can hold any of them
+                result.append(pyarrow.string())
+
+        return result
+
+    def read_schema_batches(self, batches):
+        result = []
+
+        for batch in batches:
+            result.append(batch)
+
+            if len(result) >= self.max_schema_batches:
+                return result, False
+
+            if all(map(lambda x: x.type != pyarrow.null(), batch[1])):
+                return result, False
+
+        return result, True
+
+    def render(self):
+        if self.rendered_data is not None:
+            return self.rendered_data
+
+        if self.data is None:
+            return
+
+        self.rendered_data = b''.join(self.render_chunks())
+        return self.rendered_data
+
+    def render_chunks(self):
+        if self.data is None:
+            return
+
+        try:
+            for chunk in self.render_stream():
+                yield chunk
+        finally:
+            # Rows left unread when rendering is stopped early release their cursor
+            rows = self.data.get(self.rows_key)
+
+            if hasattr(rows, 'close'):
+                rows.close()
+
+    def render_stream(self):
+        columns = self.data.get('columns') or []
+        field_types = self.get_column_types(columns)
+        batches = self.iter_batches(columns, field_types)
+        schema_batches, complete = self.read_schema_batches(batches)
+        arrow_types = self.get_batches_types(schema_batches, complete)
+
+        fields = []
+        for i, column in enumerate(columns):
+            field_metadata = {'field': field_types[i]} if field_types[i] else None
+            fields.append(pyarrow.field(column if column is not None else '', arrow_types[i], metadata=field_metadata))
+
+        schema = pyarrow.schema(fields, metadata=self.get_metadata())
+        sink = io.BytesIO()
+        writer = pyarrow.ipc.new_stream(sink, schema)
+
+        def flush():
+            data = sink.getvalue()
+            sink.seek(0)
+            sink.truncate()
+            return data
+
+        for batch_values, arrays in chain(schema_batches, batches):
+            arrays = list(map(
+                lambda x: to_arrow_array_strict(batch_values[x[0]], x[1], arrow_types[x[0]]),
+                enumerate(arrays)
+            ))
+            writer.write_batch(pyarrow.record_batch(arrays, schema=schema))
+            yield flush()
+
+        writer.close()
+        yield flush()
@@ -1,5 +1,7 @@
 
 class Response(object):
+    streaming = False
+
     def __init__(self, data=None, status=None, headers=None, exception=False, content_type=None):
         self.data = data
         self.status = status
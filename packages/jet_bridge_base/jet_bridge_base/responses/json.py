@@ -1,5 +1,4 @@
 from __future__ import absolute_import
-import json
 
 from jet_bridge_base import encoders
 from jet_bridge_base.responses.base import Response
@@ -22,7 +21,7 @@ class JSONResponse(Response):
         if self.data is None:
             return
 
-        self.rendered_data = json.dumps(
+        self.rendered_data = encoders.dumps(
             self.data,
             cls=self.encoder_class
         )
@@ -0,0 +1,41 @@
+from __future__ import absolute_import
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+from jet_bridge_base import encoders
+from jet_bridge_base.responses.base import Response
+
+
+class MessagePackResponse(Response):
+    """
+    Same payload as JSONResponse encoded with MessagePack. Rendered in the pool like a streaming
+    response, so lazy rows are read while the session is still open.
+    """
+
+    streaming = True
+
+    def __init__(self, *args, **kwargs):
+        self.rendered_data = None
+        super(MessagePackResponse, self).__init__(*args, **kwargs)
+
+    def default_headers(self):
+        return {'Content-Type': 'application/msgpack', 'Vary': 'Accept'}
+
+    def render(self):
+        if self.rendered_data is not None:
+            return self.rendered_data
+
+        if self.data is None:
+            return
+
+        # Values without MessagePack type (datetimes, decimals, iterators) are converted as for JSON
+        self.rendered_data = msgpack.packb(self.data, default=encoders.json_default, use_bin_type=True)
+        return self.rendered_data
+
+    def render_chunks(self):
+        data = self.render()
+        if data is not None:
+            yield data
@@ -0,0 +1,96 @@
+from __future__ import absolute_import
+
+try:
+    from collections.abc import Iterator
+except ImportError:
+    from collections import Iterator
+
+from jet_bridge_base import encoders
+from jet_bridge_base.responses.json import JSONResponse
+
+
+class StreamingJSONResponse(JSONResponse):
+    """
+    JSON response which is rendered in chunks. Iterators found in data (either data itself
+    or values of top level dict) are encoded row by row, so the whole result is never
+    held in memory at once. The session is kept open until the response is fully written.
+    """
+
+    streaming = True
+    chunk_size = 64 * 1024
+
+    def render(self):
+        if self.rendered_data is not None:
+            return self.rendered_data
+
+        if self.data is None:
+            return
+
+        self.rendered_data = ''.join(self.render_chunks())
+        return self.rendered_data
+
+    def render_chunks(self):
+        buffer = []
+        buffer_size = 0
+
+        try:
+            for part in self.iterencode(self.data):
+                buffer.append(part)
+                buffer_size += len(part)
+
+                if buffer_size >= self.chunk_size:
+                    yield ''.join(buffer)
+                    buffer = []
+                    buffer_size = 0
+
+            if buffer:
+                yield ''.join(buffer)
+        finally:
+            # Rows left unread when rendering is stopped early release their cursors
+            self.close_iterators()
+
+    def close_iterators(self):
+        values = self.data.values() if isinstance(self.data, dict) else [self.data]
+
+        for value in values:
+            if isinstance(value, Iterator) and hasattr(value, 'close'):
+                value.close()
+
+    def encode(self, value):
+        return encoders.dumps(value, cls=self.encoder_class)
+
+    def iterencode(self, data):
+        if isinstance(data, Iterator):
+            for part in self.iterencode_rows(data):
+                yield part
+        elif isinstance(data, dict):
+            yield '{'
+
+            for i, (key, value) in enumerate(data.items()):
+                if i:
+                    yield ','
+
+                yield self.encode(str(key))
+                yield ':'
+
+                if isinstance(value, Iterator):
+                    for part in self.iterencode_rows(value):
+                        yield part
+                else:
+                    yield self.encode(value)
+
+            yield '}'
+        else:
+            yield self.encode(data)
+
+    def iterencode_rows(self, rows):
+        yield '['
+
+        for i, row in enumerate(rows):
+            if i:
+                yield ','
+
+            # NaN/Infinity are replaced by the encoder one row at a time
+            yield self.encode(row)
+
+        yield ']'
@@ -1,8 +1,9 @@
+from jet_bridge_base.db import get_request_connection, MODEL_SERIALIZERS_CACHE_KEY
 from jet_bridge_base.db_types import inspect_uniform
 from jet_bridge_base.serializers.model_serializer import ModelSerializer
 
 
-def get_model_serializer(Model):
+def create_model_serializer(Model):
     mapper = inspect_uniform(Model)
 
     class CustomModelSerializer(ModelSerializer):
@@ -11,3 +12,27 @@ def get_model_serializer(Model):
             model_fields = list(map(lambda x: x.key, mapper.columns))
 
     return CustomModelSerializer
+
+
+def get_model_serializer(Model, request=None):
+    connection = get_request_connection(request) if request else None
+
+    if not connection:
+        return create_model_serializer(Model)
+
+    # Serializer classes (and their compiled field plans) are kept until connection schema is reloaded
+    with connection['lock']:
+        model_serializers = connection['cache'].get(MODEL_SERIALIZERS_CACHE_KEY)
+
+        if model_serializers is None:
+            model_serializers = {}
+            connection['cache'][MODEL_SERIALIZERS_CACHE_KEY] = model_serializers
+
+        serializer_class = model_serializers.get(Model)
+
+        if serializer_class is None:
+            serializer_class = create_model_serializer(Model)
+            serializer_class.get_model_fields_plan()
+            model_serializers[Model] = serializer_class
+
+    return serializer_class
@@ -66,26 +66,43 @@ class ModelSerializer(Serializer):
         self.session = kwargs.get('context', {}).get('session', None)
         self.model = self.meta.model
 
+    @classmethod
+    def get_model_fields_plan(cls):
+        # Column data types are matched once per serializer class, serializers are cached per connection
+        if '_model_fields_plan' not in cls.__dict__:
+            meta = getattr(cls, 'Meta', None)
+            result = []
+
+            if hasattr(meta, 'model_fields'):
+                mapper = inspect_uniform(meta.model)
+                columns = dict(map(lambda x: (x.key, x), mapper.columns))
+
+                for field_name in meta.model_fields:
+                    column = columns.get(field_name)
+                    data_type = get_column_data_type(column)
+
+                    # if column.primary_key and column.autoincrement:
+                    #     kwargs['read_only'] = True
+                    required = not (column.autoincrement or column.default or column.server_default or column.nullable)
+
+                    result.append((field_name, column, data_type, required))
+
+            cls._model_fields_plan = result
+
+        return cls._model_fields_plan
+
     def get_fields(self):
         result = super(ModelSerializer, self).get_fields()
 
-        if hasattr(self.meta, 'model_fields'):
-            mapper = inspect_uniform(self.meta.model)
-            columns = dict(map(lambda x: (x.key, x), mapper.columns))
-
-            for field_name in self.meta.model_fields:
-                column = columns.get(field_name)
-                data_type = get_column_data_type(column)
-                kwargs = {'context': {**(self.context or {}), 'model_field': column}, 'serializer': self}
+        for field_name, column, data_type, required in self.get_model_fields_plan():
+            kwargs = {'context': {**(self.context or {}), 'model_field': column}, 'serializer': self}
 
-                # if column.primary_key and column.autoincrement:
-                #     kwargs['read_only'] = True
-                if column.autoincrement or column.default or column.server_default or column.nullable:
-                    kwargs['required'] = False
+            if not required:
+                kwargs['required'] = False
 
-                field = data_type(**kwargs)
-                field.field_name = field_name
-                result.append(field)
+            field = data_type(**kwargs)
+            field.field_name = field_name
+            result.append(field)
 
         return result
 
@@ -39,6 +39,7 @@ class Serializer(Field):
     validated_data = None
     fields = []
     errors = None
+    representation_plan = None
 
     def __init__(self, *args, **kwargs):
         self.instance = kwargs.pop('instance', None)
@@ -50,6 +51,7 @@ class Serializer(Field):
 
     def update_fields(self):
         self.fields = self.get_fields()
+        self.representation_plan = None
 
     def get_fields(self):
         result = []
@@ -134,22 +136,59 @@ class Serializer(Field):
 
         return result
 
+    def get_representation_plan(self):
+        # Field names and converters are resolved once per serializer instead of once per row
+        if self.representation_plan is None:
+            self.representation_plan = list(map(
+                lambda x: (x.field_name, x.get_representation_converter(), x.required),
+                self.readable_fields
+            ))
+        return self.representation_plan
+
     def to_representation_item(self, value):
         result = OrderedDict()
 
-        for field in self.readable_fields:
-            if isinstance(value, Mapping):
-                field_value = value.get(field.field_name, empty)
-            else:
-                field_value = getattr(value, field.field_name, empty)
+        if isinstance(value, Mapping):
+            get_value = value.get
+        else:
+            get_value = lambda name, default: getattr(value, name, default)
+
+        for field_name, converter, required in self.get_representation_plan():
+            field_value = get_value(field_name, empty)
+
+            if field_value is empty:
+                if not required:
+                    continue
+                else:
+                    field_value = None
+
+            result[field_name] = converter(field_value) if converter is not None else field_value
+
+        return result
+
+    def get_representation_columns(self):
+        return list(map(lambda x: x[0], self.get_representation_plan()))
+
+    def to_representation_row(self, value):
+        # Same as to_representation_item, but values are returned as list in get_representation_columns() order
+        result = []
+
+        if isinstance(value, Mapping):
+            get_value = value.get
+        else:
+            get_value = lambda name, default: getattr(value, name, default)
+
+        for field_name, converter, required in self.get_representation_plan():
+            field_value = get_value(field_name, empty)
 
             if field_value is empty:
-                if not field.required:
+                if not required:
+                    result.append(None)
                     continue
                 else:
                     field_value = None
 
-            result[field.field_name] = field.to_representation(field_value)
+            result.append(converter(field_value) if converter is not None else field_value)
 
         return result
 
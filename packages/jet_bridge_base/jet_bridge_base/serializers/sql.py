@@ -1,24 +1,38 @@
+import asyncio
 import datetime
+import queue
+import threading
 import time
 
+try:
+    from collections.abc import Iterator
+except ImportError:
+    from collections import Iterator
+
 from sqlalchemy import text, select, column, func, desc, or_, cast
 from sqlalchemy import sql
 from sqlalchemy.sql import sqltypes, quoted_name
 from sqlalchemy.exc import SQLAlchemyError
 
-from jet_bridge_base import fields
-from jet_bridge_base.db import get_type_code_to_sql_type
+from jet_bridge_base import fields, settings
+from jet_bridge_base.db import get_type_code_to_sql_type, get_async_engine, get_default_timezone
 from jet_bridge_base.db_types import get_session_engine, apply_session_timezone, get_sql_aggregate_func_by_name, \
-    get_sql_group_func_lookup
-from jet_bridge_base.fields.datetime import datetime_apply_default_timezone
+    get_sql_group_func_lookup, track_async_connection
 from jet_bridge_base.exceptions.sql import SqlError
 from jet_bridge_base.exceptions.validation_error import ValidationError
 from jet_bridge_base.fields.sql_params import SqlParamsSerializers
-from jet_bridge_base.filters import lookups
 from jet_bridge_base.filters.filter import EMPTY_VALUES
 from jet_bridge_base.filters.filter_for_dbfield import filter_for_data_type
+from jet_bridge_base.filters.filter_plan import FilterPlan
 from jet_bridge_base.serializers.serializer import Serializer
+from jet_bridge_base.utils.cache import TTLCache
 from jet_bridge_base.utils.db_types import map_to_sql_type, sql_to_map_type
+from jet_bridge_base.utils.parallel import submit_parallel_query
+from jet_bridge_base.utils.sql_cache import get_sql_cache_ttl, sql_cache_get_or_execute, \
+    sql_cache_get_or_execute_async
+
+sql_filter_plans_cache = TTLCache(max_size=1024, ttl=60 * 60)
+sql_subqueries_cache = TTLCache(max_size=1024, ttl=60 * 60)
 
 
 class ColumnSerializer(Serializer):
@@ -54,6 +68,59 @@ class GroupsSerializer(Serializer):
     yFunc = fields.CharField()
 
 
+class SqlRows(Iterator):
+    """
+    Rows of executed query read in SQL_FETCH_BATCH_SIZE batches, up to max_rows. Cursor is closed
+    when rows are exhausted or close() is called, even if no rows were read yet (client disconnected).
+    """
+
+    def __init__(self, result, max_rows=None, map_row=None):
+        self.result = result
+        self.max_rows = max_rows
+        self.map_row = map_row
+        self.fetched = 0
+        self.rows = iter(())
+        self.closed = False
+
+    def fetch_batch(self):
+        size = settings.SQL_FETCH_BATCH_SIZE
+
+        if self.max_rows is not None:
+            size = min(size, self.max_rows - self.fetched)
+
+        if self.closed or size <= 0:
+            return []
+
+        try:
+            rows = self.result.fetchmany(size)
+        except Exception:
+            self.close()
+            raise
+
+        self.fetched += len(rows)
+        return rows
+
+    def __next__(self):
+        row = next(self.rows, None)
+
+        if row is None:
+            self.rows = iter(self.fetch_batch())
+            row = next(self.rows, None)
+
+        if row is None:
+            self.close()
+            raise StopIteration
+
+        return self.map_row(row) if self.map_row is not None else row
+
+    def close(self):
+        self.rows = iter(())
+
+        if not self.closed:
+            self.closed = True
+            self.result.close()
+
+
 class SqlSerializer(Serializer):
     query = fields.CharField()
     offset = fields.IntegerField(required=False)
@@ -69,6 +136,7 @@ class SqlSerializer(Serializer):
     schema = fields.CharField(required=False)
     params = SqlParamsSerializers(required=False)
     params_obj = fields.JSONField(required=False)
+    cache_ttl = fields.IntegerField(required=False)
     v = fields.IntegerField(default=1)
 
     def validate(self, attrs):
@@ -152,49 +220,42 @@ class SqlSerializer(Serializer):
         else:
             return queryset.group_by(*x_lookup_names).order_by(*x_lookup_names)
 
-    def filter_queryset(self, queryset, data):
-        filters_instances = []
-        request = self.context.get('request')
-        session = request.session
+    def create_filter_plan(self, columns, session):
+        filter_plan = FilterPlan()
 
-        for item in data.get('columns', []):
+        for item in columns:
             query_type = map_to_sql_type(item['data_type'])()
-            filter_data = filter_for_data_type(query_type)
-            for lookup in filter_data['lookups']:
-                for exclude in [False, True]:
-                    column_ = self.get_column(session, item['name'], type_=query_type)
-                    instance = filter_data['filter_class'](
-                        name=item['name'],
-                        column=column_,
-                        lookup=lookup,
-                        exclude=exclude
-                    )
-                    filters_instances.append(instance)
-
-        def get_filter_value(name, filters_instance=None):
-            filter_items = list(filter(lambda x: x['name'] == name, data.get('filters', [])))
-
-            if not len(filter_items):
-                return
+            column_ = self.get_column(session, item['name'], type_=query_type)
+            filter_plan.add_column(item['name'], column_, filter_for_data_type(query_type))
 
-            return filter_items[0].get('value', None)
+        return filter_plan
 
-        for item in filters_instances:
-            if item.name:
-                argument_name = '{}__{}'.format(item.name, item.lookup)
-                if item.exclude:
-                    argument_name = 'exclude__{}'.format(argument_name)
-                value = get_filter_value(argument_name, item)
+    def get_filter_plan(self, data, session):
+        columns = data.get('columns', [])
+        key = (get_session_engine(session), tuple(map(lambda x: (x['name'], x['data_type']), columns)))
+        return sql_filter_plans_cache.get_or_set(key, lambda: self.create_filter_plan(columns, session))
 
-                if value is None and item.lookup == lookups.DEFAULT_LOOKUP:
-                    argument_name = item.name
-                    if item.exclude:
-                        argument_name = 'exclude__{}'.format(argument_name)
-                    value = get_filter_value(argument_name, item)
-            else:
-                value = None
+    def create_subquery(self, query):
+        subquery = text(query).columns().subquery('__jet_q2')
+        # Columns collection is memoized on first access, create it before subquery is shared
+        subquery.c
+        return subquery
+
+    def get_subquery(self, query):
+        # Same query text results in the same statement cache key, so compiled statement is reused
+        return sql_subqueries_cache.get_or_set(query, lambda: self.create_subquery(query))
 
-            queryset = item.filter(queryset, value)
+    def filter_queryset(self, queryset, data, session):
+        filter_values = {}
+
+        for item in data.get('filters', []):
+            filter_values.setdefault(item['name'], item.get('value', None))
+
+        def get_filter_value(name):
+            return filter_values.get(name)
+
+        filter_plan = self.get_filter_plan(data, session)
+        queryset = filter_plan.filter_queryset(queryset, filter_values.keys(), get_filter_value)
 
         search = get_filter_value('_search')
 
@@ -256,9 +317,68 @@ class SqlSerializer(Serializer):
 
         return queryset
 
-    def execute(self, data):
+    def execute_count(self, subquery, data, params, session, set_schema=False):
+        try:
+            if set_schema and 'schema' in data:
+                session.execute(text('SET search_path TO :schema'), {'schema': data['schema']})
+
+            count_queryset = select([func.count()]).select_from(subquery)
+            count_queryset = self.filter_queryset(count_queryset, data, session)
+
+            count_query_start = time.time()
+            count_result = session.execute(count_queryset, params)
+            count_rows = count_result.all()[0][0]
+            count_query_end = time.time()
+
+            return count_rows, round(count_query_end - count_query_start, 3)
+        except SQLAlchemyError:
+            session.rollback()
+        except Exception:
+            pass
+
+        return None, None
+
+    def get_max_rows(self, queryset):
+        # Row cap is applied only when the query itself can return more rows
+        max_rows = settings.SQL_MAX_ROWS
+
+        if not max_rows or (queryset._limit and queryset._limit <= max_rows):
+            return
+
+        return max_rows
+
+    def fetch_rows(self, result, max_rows=None, map_row=None):
+        return SqlRows(result, max_rows, map_row)
+
+    def get_row_mapper(self, request):
+        default_timezone = get_default_timezone(request)
+
+        def map_row_column(x):
+            if isinstance(x, bytes):
+                try:
+                    return x.decode('utf-8')
+                except UnicodeDecodeError:
+                    return x.hex()
+            elif isinstance(x, datetime.datetime):
+                if default_timezone and x.tzinfo is None:
+                    return x.replace(tzinfo=default_timezone)
+                return x
+            else:
+                return x
+
+        def map_row(row):
+            return list(map(map_row_column, row))
+
+        return map_row
+
+    def map_rows(self, request, rows):
+        return list(map(self.get_row_mapper(request), rows))
+
+    def execute(self, data, session=None, stream=False, map_rows=True):
         request = self.context.get('request')
-        session = request.session
+
+        if session is None:
+            session = request.session
 
         query = data['query']
 
@@ -267,6 +387,8 @@ class SqlSerializer(Serializer):
         else:
             params = data.get('params', [])
 
+        request.apply_statement_timeout(session)
+
         if data.get('timezone') is not None:
             try:
                 apply_session_timezone(session, data['timezone'])
@@ -276,32 +398,28 @@ class SqlSerializer(Serializer):
 
         if 'schema' in data:
             try:
-                session.execute('SET search_path TO :schema', {'schema': data['schema']})
+                session.execute(text('SET search_path TO :schema'), {'schema': data['schema']})
             except SQLAlchemyError:
                 session.rollback()
                 pass
 
-        request.apply_rls_if_enabled()
+        request.apply_rls_if_enabled(session)
 
-        subquery = text(query).columns().subquery('__jet_q2')
+        subquery = self.get_subquery(query)
         count_rows = None
         count_query_time = None
+        count_future = None
 
         if data['count']:
-            try:
-                count_queryset = select([func.count()]).select_from(subquery)
-                count_queryset = self.filter_queryset(count_queryset, data)
-
-                count_query_start = time.time()
-                count_result = session.execute(count_queryset, params)
-                count_rows = count_result.all()[0][0]
-                count_query_end = time.time()
+            # Count is run on a separate connection while data is fetched
+            count_future = submit_parallel_query(
+                request,
+                lambda count_session: self.execute_count(subquery, data, params, count_session, set_schema=True),
+                session
+            )
 
-                count_query_time = round(count_query_end - count_query_start, 3)
-            except SQLAlchemyError:
-                session.rollback()
-            except Exception:
-                pass
+            if count_future is None:
+                count_rows, count_query_time = self.execute_count(subquery, data, params, session)
 
         try:
             if 'aggregate' in data:
@@ -311,7 +429,7 @@ class SqlSerializer(Serializer):
             else:
                 queryset = select(['*']).select_from(subquery)
 
-            queryset = self.filter_queryset(queryset, data)
+            queryset = self.filter_queryset(queryset, data, session)
 
             if 'aggregate' not in data and 'group' not in data and 'groups' not in data:
                 queryset = self.paginate_queryset(queryset, data)
@@ -319,40 +437,35 @@ class SqlSerializer(Serializer):
             if 'group' not in data and 'groups' not in data:
                 queryset = self.sort_queryset(queryset, data, session)
 
+            if stream:
+                # Server-side cursor (psycopg2, MySQLdb), rows are not buffered by the driver
+                queryset = queryset.execution_options(stream_results=True)
+
             data_query_start = time.time()
             result = session.execute(queryset, params)
             data_query_end = time.time()
 
             data_query_time = round(data_query_end - data_query_start, 3)
 
+            if count_future is not None:
+                count_rows, count_query_time = count_future.result()
+
             def map_column(x):
                 if x == '?column?':
                     return
                 return x
 
-            def map_row_column(x):
-                if isinstance(x, bytes):
-                    try:
-                        return x.decode('utf-8')
-                    except UnicodeDecodeError:
-                        return x.hex()
-                elif isinstance(x, datetime.datetime):
-                    x = datetime_apply_default_timezone(x, request)
-                    return x
-                else:
-                    return x
-
-            def map_row(row):
-                return list(map(lambda x: map_row_column(row[x]), row.keys()))
-
             column_names = result.keys()
 
             if 'groups' in data or 'group' in data:
                 column_names = list(map(lambda x: 'group' if x == 'group_1' else x, column_names))
 
             cursor_description = result.cursor.description
+            max_rows = self.get_max_rows(queryset)
+            rows = self.fetch_rows(result, max_rows, self.get_row_mapper(request) if map_rows else None)
+
             response = {
-                'data': list(map(map_row, result)),
+                'data': rows if stream else list(rows),
                 'columns': list(map(map_column, column_names))
             }
 
@@ -375,6 +488,9 @@ class SqlSerializer(Serializer):
             if limit:
                 response['limit'] = limit
 
+            if max_rows is not None:
+                response['max_rows'] = max_rows
+
             response['data_query_time'] = data_query_time
 
             if count_rows is not None:
@@ -389,19 +505,185 @@ class SqlSerializer(Serializer):
         except Exception as e:
             raise SqlError(e)
         finally:
-            session.close()
+            # Streamed rows are read after return, the session is closed when the response is written
+            if not stream:
+                session.close()
+
+    async def execute_async(self, data):
+        request = self.context.get('request')
+        engine = get_async_engine(request)
+
+        async with engine.connect() as connection:
+            # Registered for cancelling when the client disconnects
+            tracked_connection = track_async_connection(connection.sync_connection)
+            request.async_connections.append(tracked_connection)
+
+            try:
+                response = await connection.run_sync(
+                    lambda sync_connection: self.execute(data, sync_connection, map_rows=False)
+                )
+            finally:
+                request.async_connections.remove(tracked_connection)
+
+        # Only the driver calls are run on the event loop, rows are converted in a worker thread
+        response['data'] = await asyncio.get_event_loop().run_in_executor(
+            None,
+            self.map_rows,
+            request,
+            response['data']
+        )
+
+        return response
+
+    def execute_cached(self, data, session=None, stream=False):
+        ttl = get_sql_cache_ttl(data)
+
+        if ttl is None:
+            return self.execute(data, session=session, stream=stream)
+
+        request = self.context.get('request')
+        return sql_cache_get_or_execute(request, data, ttl, lambda: self.execute(data, session=session))
+
+    async def execute_cached_async(self, data):
+        ttl = get_sql_cache_ttl(data)
+
+        if ttl is None:
+            return await self.execute_async(data)
+
+        request = self.context.get('request')
+        return await sql_cache_get_or_execute_async(request, data, ttl, lambda: self.execute_async(data))
 
 
 class SqlsSerializer(Serializer):
     queries = SqlSerializer(many=True)
+    stream = fields.BooleanField(default=False)
+
+    def execute_query(self, serializer, query, session=None):
+        execute_start = time.time()
+
+        try:
+            result = serializer.execute_cached(query, session=session)
+        except SqlError as e:
+            result = {'error': str(e.detail)}
+        except Exception as e:
+            # Errors are returned per query so that a failed worker doesn't abort the whole batch
+            result = {'error': str(e)}
+
+        result['execute_time'] = round(time.time() - execute_start, 3)
+        return result
+
+    def create_worker(self, queries, on_result):
+        serializer = SqlSerializer(context=self.context)
+        pending = iter(enumerate(queries))
+        lock = threading.Lock()
+
+        def worker(session=None):
+            while True:
+                with lock:
+                    item = next(pending, None)
+
+                if item is None:
+                    return
+
+                i, query = item
+                on_result(i, self.execute_query(serializer, query, session))
+
+        return worker
+
+    def start_parallel_workers(self, worker, count):
+        # Every worker takes the next query once the previous one is finished, each on its own connection
+        request = self.context.get('request')
+        futures = []
+
+        for i in range(min(count, settings.SQL_BATCH_MAX_PARALLEL)):
+            future = submit_parallel_query(request, worker, setup_session=False, connections=i + 2)
+
+            if future is None:
+                break
+
+            futures.append(future)
+
+        return futures
 
     def execute(self, data):
+        queries = data['queries']
+
+        if data.get('stream'):
+            return self.execute_stream(queries)
+
+        results = [None] * len(queries)
+        worker = self.create_worker(queries, lambda i, result: results.__setitem__(i, result))
+        futures = self.start_parallel_workers(worker, len(queries) - 1)
+
+        # Request session takes part in the batch as well
+        worker()
+
+        for future in futures:
+            future.result()
+
+        return results
+
+    def execute_stream(self, queries):
+        # Results are yielded in order of completion, "index" points to the query in the batch
+        finished = queue.Queue()
+        worker = self.create_worker(queries, lambda i, result: finished.put((i, result)))
+        futures = self.start_parallel_workers(worker, len(queries))
+
+        for future in futures:
+            # Finished worker is reported as well, so a worker failed outside of execute_query() can't hang results
+            future.add_done_callback(lambda x: finished.put((None, x)))
+
+        def results():
+            if not futures:
+                # No free connections, queries are run one by one on the request session
+                serializer = SqlSerializer(context=self.context)
+
+                for i, query in enumerate(queries):
+                    yield {'index': i, **self.execute_query(serializer, query)}
+
+                return
+
+            pending = set(range(len(queries)))
+            running = len(futures)
+            error = None
+
+            while pending and running:
+                i, result = finished.get()
+
+                if i is None:
+                    running -= 1
+
+                    if not result.cancelled() and result.exception() is not None:
+                        error = result.exception()
+
+                    continue
+
+                pending.discard(i)
+                yield {'index': i, **result}
+
+            # Queries taken by failed workers
+            for i in sorted(pending):
+                yield {'index': i, 'error': str(error) if error is not None else 'Query was not executed'}
+
+        return results()
+
+    async def execute_async(self, data):
         serializer = SqlSerializer(context=self.context)
+        semaphore = asyncio.Semaphore(max(settings.SQL_BATCH_MAX_PARALLEL, 1))
 
-        def map_query(query):
-            try:
-                return serializer.execute(query)
-            except SqlError as e:
-                return {'error': str(e.detail)}
+        async def execute_query(query):
+            async with semaphore:
+                execute_start = time.time()
+
+                try:
+                    result = await serializer.execute_cached_async(query)
+                except SqlError as e:
+                    result = {'error': str(e.detail)}
+                except Exception as e:
+                    # Errors are returned per query so that a single failure doesn't abort the whole gather
+                    result = {'error': str(e)}
+
+                result['execute_time'] = round(time.time() - execute_start, 3)
+                return result
 
-        return list(map(map_query, data['queries']))
+        return list(await asyncio.gather(*map(execute_query, data['queries'])))
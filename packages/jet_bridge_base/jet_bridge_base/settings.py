@@ -35,6 +35,8 @@ DATABASE_NAME = None
 DATABASE_EXTRA = None
 DATABASE_CONNECTIONS = None
 DATABASE_CONNECTIONS_OVERFLOW = None
+DATABASE_STATEMENT_TIMEOUT = None
+DATABASE_QUERY_CACHE_SIZE = 1000
 DATABASE_ONLY = None
 DATABASE_EXCEPT = None
 DATABASE_MAX_TABLES = None
@@ -82,6 +84,19 @@ TRACK_QUERY_HIGH_MEMORY = None
 RELEASE_INACTIVE_GRAPHQL_SCHEMAS_TIMEOUT = None
 
 DISABLE_AUTH = None
+ASYNC_DATABASE = False
+COUNT_STRATEGY = 'optimized'
+COUNT_STRATEGIES = {}
+COUNT_CACHE_TTL = 60
+COUNT_DEFERRED_WORKERS = 2
+COUNT_DEFERRED_MAX_PENDING = 4
+PARALLEL_QUERIES = True
+PARALLEL_QUERIES_WORKERS = 8
+SQL_CACHE_TTL = 0
+SQL_CACHE_MAX_MEMORY = 64 * 1024 * 1024
+SQL_BATCH_MAX_PARALLEL = 4
+SQL_FETCH_BATCH_SIZE = 1000
+SQL_MAX_ROWS = 0
 
 
 def set_settings(settings):
@@ -1,9 +1,19 @@
+import json
+
 import requests
 from requests import RequestException
 
 from jet_bridge_base import settings
 from jet_bridge_base.configuration import configuration
 from jet_bridge_base.logger import logger
+from jet_bridge_base.utils.cache import TTLCache
+from jet_bridge_base.utils.crypt import get_sha256_hash
+
+PROJECT_AUTH_CACHE_TTL = 60
+PROJECT_AUTH_CACHE_NEGATIVE_TTL = 10
+
+http_session = requests.Session()
+project_auth_cache = TTLCache(max_size=4096, ttl=PROJECT_AUTH_CACHE_TTL)
 
 
 def api_method_url(method):
@@ -19,7 +29,7 @@ def is_project_token_activated(project_token):
         'User-Agent': '{} v{}'.format(configuration.get_type(), configuration.get_version())
     }
 
-    r = requests.request('GET', url, headers=headers)
+    r = http_session.request('GET', url, headers=headers)
     success = 200 <= r.status_code < 300
 
     if not success:
@@ -43,7 +53,7 @@ def is_resource_token_activated(project_name, resource_token):
         'token': resource_token
     }
 
-    r = requests.request('POST', url, headers=headers, data=data)
+    r = http_session.request('POST', url, headers=headers, data=data)
 
     if 200 <= r.status_code < 300:
         result = r.json()
@@ -57,7 +67,8 @@ def is_resource_token_activated(project_name, resource_token):
 def project_auth(token, project_token, permission=None, params=None):
     if not project_token:
         return {
-            'result': False
+            'result': False,
+            'denied': True
         }
 
     url = api_method_url('project_auth/')
@@ -76,13 +87,14 @@ def project_auth(token, project_token, permission=None, params=None):
         if 'project_child' in params:
             data['project_child'] = params['project_child']
 
-    r = requests.request('POST', url, data=data, headers=headers)
+    r = http_session.request('POST', url, data=data, headers=headers)
     success = 200 <= r.status_code < 300
 
     if not success:
         logger.error('Project Auth request error: %d %s %s', r.status_code, r.reason, r.text)
         return {
-            'result': False
+            'result': False,
+            'denied': 400 <= r.status_code < 500
         }
 
     result = r.json()
@@ -90,6 +102,7 @@ def project_auth(token, project_token, permission=None, params=None):
     if result.get('access_disabled'):
         return {
             'result': False,
+            'denied': True,
             'warning': result.get('warning')
         }
 
@@ -99,6 +112,30 @@ def project_auth(token, project_token, permission=None, params=None):
     }
 
 
+def cached_project_auth(token, project_token, permission=None, params=None):
+    permission = permission or {}
+    params = params or {}
+    key = get_sha256_hash(json.dumps([
+        token,
+        project_token,
+        permission.get('permission_type'),
+        permission.get('permission_object'),
+        permission.get('permission_actions'),
+        params.get('project_child')
+    ]))
+
+    def ttl(result):
+        if result['result']:
+            return PROJECT_AUTH_CACHE_TTL
+        elif result.get('denied'):
+            return PROJECT_AUTH_CACHE_NEGATIVE_TTL
+        else:
+            # Backend failures are not cached, so the next request retries
+            return 0
+
+    return project_auth_cache.get_or_set(key, lambda: project_auth(token, project_token, permission, params), ttl)
+
+
 def get_resource_secret_tokens(project, resource, token):
     if not token:
         return []
@@ -109,7 +146,7 @@ def get_resource_secret_tokens(project, resource, token):
         'User-Agent': '{} v{}'.format(configuration.get_type(), configuration.get_version())
     }
 
-    r = requests.request('GET', url, headers=headers)
+    r = http_session.request('GET', url, headers=headers)
     success = 200 <= r.status_code < 300
 
     if not success:
@@ -140,7 +177,7 @@ def get_secret_tokens(project_name, environment_name, resource, draft, token, us
     if draft:
         data['draft'] = 1
 
-    r = requests.request('POST', url, headers=headers, data=data)
+    r = http_session.request('POST', url, headers=headers, data=data)
     success = 200 <= r.status_code < 300
 
     if not success:
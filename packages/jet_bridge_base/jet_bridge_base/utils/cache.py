@@ -0,0 +1,140 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+_MISSING = object()
+
+
+class TTLCache(object):
+    """
+    Thread-safe in-memory cache with LRU eviction and per-entry expiration.
+    When max_memory is set, entries are also evicted to keep total sizeof(value) within it.
+    """
+
+    def __init__(self, max_size=1024, ttl=None, max_memory=None, sizeof=None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.max_memory = max_memory
+        self.sizeof = sizeof
+        self.memory = 0
+        self.items = OrderedDict()
+        self.pending = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.coalesced = 0
+
+    def get(self, key, default=None):
+        with self.lock:
+            item = self.items.get(key, _MISSING)
+
+            if item is _MISSING:
+                self.misses += 1
+                return default
+
+            value, expires, size = item
+
+            if expires is not None and expires <= time.time():
+                del self.items[key]
+                self.memory -= size
+                self.misses += 1
+                return default
+
+            self.items.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, ttl=None):
+        if ttl is None:
+            ttl = self.ttl
+
+        if ttl is not None and ttl <= 0:
+            self.delete(key)
+            return
+
+        expires = time.time() + ttl if ttl is not None else None
+        size = self.sizeof(value) if self.sizeof is not None and self.max_memory is not None else 0
+
+        if self.max_memory is not None and size > self.max_memory:
+            self.delete(key)
+            return
+
+        with self.lock:
+            previous = self.items.pop(key, None)
+            if previous is not None:
+                self.memory -= previous[2]
+
+            self.items[key] = (value, expires, size)
+            self.memory += size
+
+            while len(self.items) > self.max_size \
+                    or (self.max_memory is not None and self.memory > self.max_memory):
+                self.memory -= self.items.popitem(last=False)[1][2]
+                self.evictions += 1
+
+    def get_or_set(self, key, func, ttl=None):
+        # Concurrent misses for the same key wait for a single func() call instead of repeating it
+        value = self.get(key, _MISSING)
+
+        if value is not _MISSING:
+            return value
+
+        with self.lock:
+            future = self.pending.get(key)
+            owner = future is None
+
+            if owner:
+                future = Future()
+                self.pending[key] = future
+            else:
+                self.coalesced += 1
+
+        if not owner:
+            return future.result()
+
+        try:
+            value = func()
+            self.set(key, value, ttl(value) if callable(ttl) else ttl)
+            future.set_result(value)
+            return value
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self.lock:
+                self.pending.pop(key, None)
+
+    def delete(self, key):
+        with self.lock:
+            item = self.items.pop(key, None)
+            if item is not None:
+                self.memory -= item[2]
+
+    def clear(self):
+        with self.lock:
+            self.items.clear()
+            self.memory = 0
+
+    def __len__(self):
+        return len(self.items)
+
+    def stats(self):
+        total = self.hits + self.misses
+        result = {
+            'size': len(self.items),
+            'max_size': self.max_size,
+            'ttl': self.ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'coalesced': self.coalesced,
+            'hit_ratio': round(self.hits / total, 3) if total else None
+        }
+
+        if self.max_memory is not None:
+            result['memory'] = self.memory
+            result['max_memory'] = self.max_memory
+
+        return result
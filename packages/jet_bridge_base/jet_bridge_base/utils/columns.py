@@ -0,0 +1,52 @@
+COLUMNS_FORMAT = 'columns'
+
+
+def dictionary_encode_rows(columns, rows):
+    """
+    Replaces values of string columns with many repeated values by indexes in per-column dictionaries.
+    Rows are changed in place, returns dictionaries by column name.
+    """
+
+    dictionaries = {}
+
+    for i, column in enumerate(columns):
+        values = {}
+        count = 0
+
+        for row in rows:
+            value = row[i]
+
+            if value is None:
+                continue
+            elif not isinstance(value, str):
+                values = None
+                break
+
+            if value not in values:
+                values[value] = len(values)
+            count += 1
+
+        if not values or len(values) * 2 > count:
+            continue
+
+        for row in rows:
+            if row[i] is not None:
+                row[i] = values[row[i]]
+
+        dictionaries[column] = list(values.keys())
+
+    return dictionaries
+
+
+def get_columns_data(serializer, instances, dictionary=False):
+    columns = serializer.get_representation_columns()
+    rows = list(map(serializer.to_representation_row, instances))
+    data = {
+        'columns': columns,
+        'rows': rows
+    }
+
+    if dictionary:
+        data['dictionaries'] = dictionary_encode_rows(columns, rows)
+
+    return data
@@ -7,6 +7,8 @@ from jet_bridge_base.utils.common import merge
 from jet_bridge_base.utils.crypt import get_sha256_hash
 from jet_bridge_base.utils.text import clean_alphanumeric
 
+_MISSING = object()
+
 
 def get_settings_conf():
     return {
@@ -20,6 +22,7 @@ def get_settings_conf():
         'extra': settings.DATABASE_EXTRA,
         'connections': settings.DATABASE_CONNECTIONS,
         'connections_overflow': settings.DATABASE_CONNECTIONS_OVERFLOW,
+        'statement_timeout': settings.DATABASE_STATEMENT_TIMEOUT,
         'only': settings.DATABASE_ONLY,
         'except': settings.DATABASE_EXCEPT,
         'schema': settings.DATABASE_SCHEMA,
@@ -56,6 +59,7 @@ def get_request_conf(request):
         'extra': bridge_settings.get('database_extra'),
         'connections': bridge_settings.get('database_connections', settings.DATABASE_CONNECTIONS),
         'connections_overflow': bridge_settings.get('database_connections_overflow', settings.DATABASE_CONNECTIONS_OVERFLOW),
+        'statement_timeout': bridge_settings.get('database_statement_timeout', settings.DATABASE_STATEMENT_TIMEOUT),
         'only': bridge_settings.get('database_only'),
         'except': bridge_settings.get('database_except'),
         'schema': bridge_settings.get('database_schema'),
@@ -171,6 +175,49 @@ def get_connection_name(conf, schema):
         return connection_name
 
 
+class ConnectionContext(object):
+    """
+    Connection identity (id, params id, schema, name) resolved lazily once per conf.
+    """
+
+    def __init__(self, conf):
+        self.conf = conf
+        self._id = _MISSING
+        self._params_id = _MISSING
+        self._schema = _MISSING
+        self._name = _MISSING
+        self.default_timezone = None
+        self.default_timezone_resolved = False
+
+    @property
+    def id(self):
+        if self._id is _MISSING:
+            self._id = get_connection_id(self.conf)
+        return self._id
+
+    @property
+    def id_short(self):
+        return self.id[:4]
+
+    @property
+    def params_id(self):
+        if self._params_id is _MISSING:
+            self._params_id = get_connection_params_id(self.conf)
+        return self._params_id
+
+    @property
+    def schema(self):
+        if self._schema is _MISSING:
+            self._schema = get_connection_schema(self.conf)
+        return self._schema
+
+    @property
+    def name(self):
+        if self._name is _MISSING:
+            self._name = get_connection_name(self.conf, self.schema)
+        return self._name
+
+
 def get_connection_short_name_parts(conf):
     result = []
 
@@ -0,0 +1,73 @@
+from jet_bridge_base.responses.arrow import ArrowResponse, pyarrow
+from jet_bridge_base.responses.json import JSONResponse
+from jet_bridge_base.responses.msgpack import MessagePackResponse, msgpack
+
+JSON_FORMAT = 'json'
+ARROW_FORMAT = 'arrow'
+MSGPACK_FORMAT = 'msgpack'
+
+MEDIA_TYPE_FORMATS = {
+    'application/json': JSON_FORMAT,
+    'application/vnd.apache.arrow.stream': ARROW_FORMAT,
+    'application/msgpack': MSGPACK_FORMAT,
+    'application/x-msgpack': MSGPACK_FORMAT,
+    'application/vnd.msgpack': MSGPACK_FORMAT
+}
+
+FORMAT_RESPONSE_CLASSES = {
+    JSON_FORMAT: JSONResponse,
+    ARROW_FORMAT: ArrowResponse,
+    MSGPACK_FORMAT: MessagePackResponse
+}
+
+
+def is_format_available(response_format):
+    if response_format == ARROW_FORMAT:
+        return pyarrow is not None
+    elif response_format == MSGPACK_FORMAT:
+        return msgpack is not None
+    return True
+
+
+def parse_accept(value):
+    media_types = []
+
+    for i, item in enumerate(value.split(',')):
+        parts = item.split(';')
+        media_type = parts[0].strip().lower()
+        quality = 1.0
+
+        for param in parts[1:]:
+            name, _, param_value = param.partition('=')
+            if name.strip() == 'q':
+                try:
+                    quality = float(param_value)
+                except ValueError:
+                    quality = 0.0
+
+        if media_type and quality > 0:
+            media_types.append((-quality, i, media_type))
+
+    return list(map(lambda x: x[2], sorted(media_types)))
+
+
+def get_response_format(request):
+    # JSON is used unless a binary format is explicitly accepted and its optional package is installed
+    accept = request.headers.get('ACCEPT')
+
+    if not accept:
+        return JSON_FORMAT
+
+    for media_type in parse_accept(accept):
+        if media_type in ['*/*', 'application/*']:
+            return JSON_FORMAT
+
+        response_format = MEDIA_TYPE_FORMATS.get(media_type)
+        if response_format is not None and is_format_available(response_format):
+            return response_format
+
+    return JSON_FORMAT
+
+
+def get_response_class(response_format):
+    return FORMAT_RESPONSE_CLASSES.get(response_format, JSONResponse)
@@ -0,0 +1,240 @@
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from jet_bridge_base import settings
+from jet_bridge_base.db import get_request_connection
+from jet_bridge_base.db_types import MongoQueryset, queryset_count_optimized, queryset_count_estimate, \
+    queryset_count_exact, get_queryset_driver_sql
+from jet_bridge_base.logger import logger
+from jet_bridge_base.utils.cache import TTLCache
+from jet_bridge_base.utils.parallel import get_session_queries_timezone, setup_query_session
+
+COUNT_EXACT = 'exact'
+COUNT_OPTIMIZED = 'optimized'
+COUNT_ESTIMATE = 'estimate'
+COUNT_CACHED = 'cached'
+COUNT_DEFERRED = 'deferred'
+
+COUNT_STRATEGIES = [COUNT_EXACT, COUNT_OPTIMIZED, COUNT_ESTIMATE, COUNT_CACHED, COUNT_DEFERRED]
+
+# Estimates below this value are replaced with exact count as it is cheap enough
+ESTIMATE_EXACT_THRESHOLD = 10000
+
+counts_cache = TTLCache(max_size=4096)
+deferred_counts = TTLCache(max_size=1024, ttl=10 * 60)
+deferred_counts_pending = {}
+deferred_counts_connection_pending = {}
+deferred_counts_lock = threading.Lock()
+deferred_counts_executor = None
+
+
+def get_queryset_table_names(queryset):
+    if isinstance(queryset, MongoQueryset):
+        return [queryset.name]
+
+    try:
+        table = queryset.statement.froms[0]
+    except (AttributeError, IndexError):
+        return []
+
+    names = [table.name]
+    if getattr(table, 'schema', None):
+        names.insert(0, '{}.{}'.format(table.schema, table.name))
+    return names
+
+
+def get_count_strategy(queryset, strategy=None):
+    if strategy is None:
+        policies = settings.COUNT_STRATEGIES or {}
+        strategy = next(
+            (policies[x] for x in get_queryset_table_names(queryset) if x in policies),
+            settings.COUNT_STRATEGY
+        )
+
+    if strategy not in COUNT_STRATEGIES:
+        return COUNT_OPTIMIZED
+
+    # Estimates and background counts need SQL session, MongoDB collections use default behaviour
+    if isinstance(queryset, MongoQueryset) and strategy in [COUNT_ESTIMATE, COUNT_DEFERRED]:
+        return COUNT_OPTIMIZED
+
+    return strategy
+
+
+def get_count_key(request, queryset, session=None):
+    if session is None:
+        session = request.session
+
+    connection = get_request_connection(request)
+    connection_id = connection['id'] if connection else None
+
+    if isinstance(queryset, MongoQueryset):
+        query = (queryset.name, repr(queryset.get_filters()))
+    else:
+        sql, params = get_queryset_driver_sql(session, queryset.order_by(None))
+        query = (sql, repr(params))
+
+    return connection_id, request.get_rls_identity(), query
+
+
+def get_deferred_counts_executor():
+    global deferred_counts_executor
+
+    # Separate pool, so that background counts never take request threads
+    with deferred_counts_lock:
+        if deferred_counts_executor is None:
+            deferred_counts_executor = ThreadPoolExecutor(
+                max_workers=settings.COUNT_DEFERRED_WORKERS,
+                thread_name_prefix='jet_deferred_count'
+            )
+
+        return deferred_counts_executor
+
+
+def release_deferred_count(key):
+    with deferred_counts_lock:
+        deferred_counts_pending.pop(key, None)
+
+        connection_pending = deferred_counts_connection_pending.get(key[0], 0) - 1
+
+        if connection_pending > 0:
+            deferred_counts_connection_pending[key[0]] = connection_pending
+        else:
+            deferred_counts_connection_pending.pop(key[0], None)
+
+
+def run_deferred_count(request, queryset, key, token, timezone=None):
+    connection = get_request_connection(request)
+    session = connection['Session']()
+
+    try:
+        # Session is set up the same way as the one the page was fetched with
+        setup_query_session(request, session, timezone)
+        count = queryset_count_exact(queryset.with_session(session))
+        counts_cache.set(key, count, settings.COUNT_CACHE_TTL)
+        deferred_counts.set(token, {'key': key, 'status': 'ready', 'count': count})
+    except Exception as e:
+        logger.warning('Deferred count failed: {}'.format(e))
+        deferred_counts.set(token, {'key': key, 'status': 'error', 'error': str(e)})
+    finally:
+        session.close()
+        release_deferred_count(key)
+
+
+def start_deferred_count(request, queryset, key, session=None):
+    """
+    Starts background count and returns its token, None when the connection already has
+    COUNT_DEFERRED_MAX_PENDING counts running or queued.
+    """
+
+    connection_id = key[0]
+
+    # Identical queries share a single background count
+    with deferred_counts_lock:
+        token = deferred_counts_pending.get(key)
+
+        if token is not None:
+            return token
+
+        connection_pending = deferred_counts_connection_pending.get(connection_id, 0)
+
+        if settings.COUNT_DEFERRED_MAX_PENDING and connection_pending >= settings.COUNT_DEFERRED_MAX_PENDING:
+            return
+
+        token = uuid.uuid4().hex
+        deferred_counts_pending[key] = token
+        deferred_counts_connection_pending[connection_id] = connection_pending + 1
+        deferred_counts.set(token, {'key': key, 'status': 'pending'})
+
+    timezone = get_session_queries_timezone(session if session is not None else request.session)
+
+    try:
+        get_deferred_counts_executor().submit(run_deferred_count, request, queryset, key, token, timezone)
+    except RuntimeError:
+        # Executor is shut down on exit
+        release_deferred_count(key)
+        deferred_counts.delete(token)
+        return
+
+    return token
+
+
+def get_deferred_counts_stats():
+    executor = deferred_counts_executor
+
+    with deferred_counts_lock:
+        connection_pending = dict(deferred_counts_connection_pending)
+
+    return {
+        'max_workers': settings.COUNT_DEFERRED_WORKERS,
+        'max_pending': settings.COUNT_DEFERRED_MAX_PENDING,
+        'queued': executor._work_queue.qsize() if executor else 0,
+        'pending': sum(connection_pending.values()),
+        'connections_pending': connection_pending
+    }
+
+
+def get_deferred_count(request, token):
+    result = deferred_counts.get(token)
+
+    if result is None:
+        return
+
+    # Counts are visible only for the same connection and RLS user they were made for
+    connection = get_request_connection(request)
+    connection_id = connection['id'] if connection else None
+    key = result['key']
+
+    if key[0] != connection_id or key[1] != request.get_rls_identity():
+        return
+
+    return dict(filter(lambda x: x[0] != 'key', result.items()))
+
+
+def queryset_count(request, queryset, strategy=None, session=None):
+    """
+    Returns {"count": ...} using count strategy configured for the queryset table.
+    Estimated counts are marked with "estimated", deferred counts return "count_token" instead of count.
+    """
+
+    if session is None:
+        session = request.session
+
+    strategy = get_count_strategy(queryset, strategy)
+
+    if strategy == COUNT_EXACT:
+        return {'count': queryset_count_exact(queryset)}
+    elif strategy == COUNT_ESTIMATE:
+        count = queryset_count_estimate(session, queryset)
+
+        if count is not None and count >= ESTIMATE_EXACT_THRESHOLD:
+            return {'count': count, 'estimated': True}
+
+        return {'count': queryset_count_optimized(session, queryset)}
+    elif strategy == COUNT_CACHED:
+        key = get_count_key(request, queryset, session)
+        count = counts_cache.get_or_set(key, lambda: queryset_count_exact(queryset), settings.COUNT_CACHE_TTL)
+        return {'count': count}
+    elif strategy == COUNT_DEFERRED:
+        key = get_count_key(request, queryset, session)
+        count = counts_cache.get(key)
+
+        if count is not None:
+            return {'count': count}
+
+        token = start_deferred_count(request, queryset, key, session)
+
+        if token is None:
+            # Too many background counts of this connection, estimate doesn't scan the table
+            return queryset_count(request, queryset, COUNT_ESTIMATE, session)
+
+        result = deferred_counts.get(token)
+
+        # Count may be already finished by the time it is checked
+        if result is not None and result['status'] == 'ready':
+            return {'count': result['count']}
+
+        return {'count': None, 'count_token': token}
+    else:
+        return {'count': queryset_count_optimized(session, queryset)}
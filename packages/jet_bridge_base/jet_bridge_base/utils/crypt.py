@@ -5,21 +5,36 @@ from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from hashlib import sha256
 
+from jet_bridge_base.utils.cache import TTLCache
+
 backend = default_backend()
+derived_keys_cache = TTLCache(max_size=256, ttl=60 * 60)
 
 
-def decrypt(message_encrypted, secret_key):
-    message_salt = message_encrypted[-24:]
-    message_payload = message_encrypted[:-24]
-    salt = base64.b64decode(message_salt)
+def derive_key(secret_key, salt):
+    cache_key = get_sha256_hash('{}:{}'.format(secret_key, salt))
+    key = derived_keys_cache.get(cache_key)
+
+    if key is not None:
+        return key
+
     kdf = PBKDF2HMAC(
         algorithm=hashes.SHA256(),
         length=32,
-        salt=salt,
+        salt=base64.b64decode(salt),
         iterations=100000,
         backend=backend
     )
     key = base64.urlsafe_b64encode(kdf.derive(bytes(secret_key, encoding='utf8')))
+    derived_keys_cache.set(cache_key, key)
+
+    return key
+
+
+def decrypt(message_encrypted, secret_key):
+    message_salt = message_encrypted[-24:]
+    message_payload = message_encrypted[:-24]
+    key = derive_key(secret_key, message_salt)
     f = Fernet(key)
     return f.decrypt(bytes(message_payload, encoding='latin1')).decode('utf8')
 
@@ -1,2 +1,72 @@
+import datetime
+import re
+
+import dateparser
+
+from jet_bridge_base.utils.cache import TTLCache
+
+EPOCH_RE = re.compile(r'^-?\d{9,}(\.\d+)?$')
+EPOCH_MILLISECONDS_MIN = 10 ** 11
+
+# Short TTL keeps relative expressions ("now", "yesterday") parsed by dateparser up to date
+parsed_datetimes_cache = TTLCache(max_size=4096, ttl=10)
+
+
 def date_trunc_minutes(date):
     return date.replace(minute=0, second=0, microsecond=0)
+
+
+def parse_iso_datetime(value):
+    if value[-1:] in ['Z', 'z']:
+        value = value[:-1] + '+00:00'
+
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        pass
+
+    try:
+        result = datetime.date.fromisoformat(value)
+        return datetime.datetime(result.year, result.month, result.day)
+    except ValueError:
+        return
+
+
+def parse_epoch_datetime(value):
+    """
+    Parses numeric strings of 9+ digits as Unix time in seconds, or in milliseconds from 10 ** 11.
+    Result is timezone-aware (UTC), while dateparser used to return naive datetime in server
+    local time, so such values are no longer interpreted in the connection default timezone.
+    """
+    # Shorter numbers are left to dateparser, which treats them as years or partial dates
+    if not EPOCH_RE.match(value):
+        return
+
+    timestamp = float(value)
+
+    if abs(timestamp) >= EPOCH_MILLISECONDS_MIN:
+        timestamp /= 1000
+
+    try:
+        return datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc)
+    except (ValueError, OverflowError, OSError):
+        return
+
+
+def parse_natural_datetime(value):
+    try:
+        return dateparser.parse(value)
+    except ValueError:
+        return
+
+
+def parse_datetime(value):
+    result = parse_iso_datetime(value)
+
+    if result is None:
+        result = parse_epoch_datetime(value)
+
+    if result is None:
+        result = parsed_datetimes_cache.get_or_set(value, lambda: parse_natural_datetime(value))
+
+    return result
@@ -6,13 +6,15 @@ from sqlalchemy.engine import Row
 from sqlalchemy.orm import MANYTOONE, ONETOMANY
 
 from jet_bridge_base.db import get_mapped_base, get_engine, get_request_connection
-from jet_bridge_base.db_types import desc_uniform, inspect_uniform, get_session_engine, queryset_count_optimized, \
+from jet_bridge_base.db_types import desc_uniform, inspect_uniform, get_session_engine, \
     apply_default_ordering, queryset_search, queryset_group, aliased_uniform
 from jet_bridge_base.db_types.sql import sql_load_database_table
 from jet_bridge_base.filters import lookups
 from jet_bridge_base.filters.filter import EMPTY_VALUES
 from jet_bridge_base.filters.filter_for_dbfield import filter_for_column
 from jet_bridge_base.models.model_relation_override import ModelRelationOverrideModel
+from jet_bridge_base.utils.count import queryset_count
+from jet_bridge_base.utils.parallel import submit_parallel_query
 from jet_bridge_base.serializers.model import get_model_serializer
 from jet_bridge_base.store import store
 from jet_bridge_base.utils.common import get_set_first, any_type_sorter, unique, flatten
@@ -86,6 +88,8 @@ class PaginationResponseType(graphene.ObjectType):
     offset = graphene.Int(required=False)
     page = graphene.Int(required=False)
     hasMore = graphene.Boolean(required=False)
+    countEstimated = graphene.Boolean(required=False)
+    countToken = graphene.String(required=False)
 
 
 def get_model_filters_type_relationship_type(self, MappedBase, mapper, relationship, with_relations, depth):
@@ -858,6 +862,15 @@ class GraphQLSchemaGenerator(object):
 
             i += 1
 
+    def get_queryset_count(self, request, queryset, session=None):
+        count_query_start = time.time()
+        count = queryset_count(request, queryset, session=session)
+        count_query_end = time.time()
+
+        count['count_query_time'] = round(count_query_end - count_query_start, 3)
+
+        return count
+
     def resolve_model_list(self, MappedBase, Model, mapper, info, filters=None, lookups=None, sort=None, pagination=None, search=None):
         try:
             filters = filters or []
@@ -882,14 +895,27 @@ class GraphQLSchemaGenerator(object):
             queryset = self.search_queryset(queryset, mapper, search)
             queryset = self.sort_queryset(queryset, MappedBase, mapper, sort)
 
+            pagination_selections = self.get_selections(info, ['pagination']) or []
+            pagination_names = list(map(lambda x: x.name.value, pagination_selections))
+            first_page = pagination.get('offset') == 0 or pagination.get('page') == 1
+            count_future = None
+
+            # First page count is not needed when the page is not full, so it is run after the page only.
+            # For other pages count is run on a separate connection while the page is fetched
+            if ('count' in pagination_names or 'hasMore' in pagination_names) and not first_page:
+                count_future = submit_parallel_query(
+                    request,
+                    lambda session: self.get_queryset_count(request, queryset.with_session(session), session)
+                )
+
             data_query_start = time.time()
             queryset_page = list(self.paginate_queryset(queryset, pagination))
             data_query_end = time.time()
 
             request.context['graphql_data_query_time'] = round(data_query_end - data_query_start, 3)
 
-            serializer_class = get_model_serializer(Model)
-            serializer_context = {**info.context}
+            serializer_class = get_model_serializer(Model, request)
+            serializer = serializer_class(context={**info.context})
 
             queryset_page_lookups = self.get_models_lookups(request, MappedBase, queryset_page, Model, mapper, lookups)
 
@@ -899,8 +925,7 @@ class GraphQLSchemaGenerator(object):
                 else:
                     data = dict(map(lambda x: (self.clean_name(x.name), getattr(row, x.name)), mapper.columns))
 
-                serializer = serializer_class(instance=data, context=serializer_context)
-                serialized = serializer.representation_data
+                serialized = serializer.to_representation_item(data)
                 serialized = self.clean_keys(serialized)
 
                 return {
@@ -916,9 +941,6 @@ class GraphQLSchemaGenerator(object):
                 'data': list(map(map_queryset_page_item, queryset_page))
             }
 
-            pagination_selections = self.get_selections(info, ['pagination']) or []
-            pagination_names = list(map(lambda x: x.name.value, pagination_selections))
-
             if len(pagination_names):
                 limit = self.get_pagination_limit(pagination)
                 offset = pagination.get('offset')
@@ -931,22 +953,27 @@ class GraphQLSchemaGenerator(object):
                 }
 
                 if 'count' in pagination_names or 'hasMore' in pagination_names:
-                    count_query_start = time.time()
-                    if offset == 0 and len(queryset_page) < limit:
-                        count = len(queryset_page)
-                    elif page == 1 and len(queryset_page) < limit:
-                        count = len(queryset_page)
+                    if first_page and len(queryset_page) < limit:
+                        count_result = {'count': len(queryset_page), 'count_query_time': 0}
+                    elif count_future is not None:
+                        count_result = count_future.result()
                     else:
-                        count = queryset_count_optimized(request.session, queryset)
+                        count_result = self.get_queryset_count(request, queryset)
+
+                    count = count_result['count']
                     result['pagination']['count'] = count
-                    count_query_end = time.time()
+                    result['pagination']['countEstimated'] = count_result.get('estimated', False)
+                    result['pagination']['countToken'] = count_result.get('count_token')
 
-                    if offset is not None:
+                    if count is None:
+                        # Count is deferred, page is full so more rows are possible
+                        result['pagination']['hasMore'] = len(queryset_page) >= limit
+                    elif offset is not None:
                         result['pagination']['hasMore'] = offset + limit < count
                     elif page is not None:
                         result['pagination']['hasMore'] = page * limit < count
 
-                    request.context['graphql_count_query_time'] = round(count_query_end - count_query_start, 3)
+                    request.context['graphql_count_query_time'] = count_result['count_query_time']
 
             return result
         except Exception as e:
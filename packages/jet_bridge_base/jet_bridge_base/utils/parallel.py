@@ -0,0 +1,127 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool, QueuePool
+
+from jet_bridge_base import settings
+from jet_bridge_base.db import get_request_connection
+from jet_bridge_base.db_types import apply_session_timezone
+
+parallel_queries_executor = None
+parallel_queries_lock = threading.Lock()
+parallel_queries_local = threading.local()
+
+
+def get_parallel_queries_executor():
+    global parallel_queries_executor
+
+    with parallel_queries_lock:
+        if parallel_queries_executor is None:
+            parallel_queries_executor = ThreadPoolExecutor(
+                max_workers=settings.PARALLEL_QUERIES_WORKERS,
+                thread_name_prefix='jet_parallel_query'
+            )
+
+        return parallel_queries_executor
+
+
+def get_pool_headroom(engine):
+    # Number of connections which can be checked out without waiting, None if not limited
+    pool = engine.pool
+
+    if isinstance(pool, NullPool):
+        return
+    elif isinstance(pool, QueuePool):
+        if pool._max_overflow < 0:
+            return
+        return max(pool.size() + pool._max_overflow - pool.checkedout(), 0)
+
+    # SingletonThreadPool and StaticPool share a single connection
+    return 0
+
+
+def pool_has_headroom(engine, connections=2):
+    headroom = get_pool_headroom(engine)
+    return headroom is None or headroom >= connections
+
+
+def get_session_queries_timezone(session):
+    return session.info.get('_queries_timezone') if isinstance(session, Session) else None
+
+
+def setup_query_session(request, session, timezone=None):
+    # Makes a separate session see the same data as the request session
+    request.apply_statement_timeout(session)
+
+    if timezone is not None:
+        apply_session_timezone(session, timezone)
+
+    request.apply_rls_if_enabled(session)
+
+
+def submit_parallel_query(request, func, session=None, setup_session=True, connections=2):
+    """
+    Runs func(session) in a background thread on a separate session of the request connection with
+    the same timezone and RLS applied (unless setup_session is False). Returns Future or None when
+    the query should be run on the current session instead (disabled, MongoDB, connection pool has
+    less than "connections" free connections, called from a parallel query itself).
+    """
+
+    if not settings.PARALLEL_QUERIES:
+        return
+
+    # Nested query would wait for the same executor, which deadlocks when all its workers wait like this
+    if getattr(parallel_queries_local, 'running', False):
+        return
+
+    if session is None:
+        session = request.session
+
+    if not isinstance(session, Session):
+        return
+
+    connection = get_request_connection(request)
+
+    if not connection or 'Session' not in connection or not pool_has_headroom(connection['engine'], connections):
+        return
+
+    timezone = get_session_queries_timezone(session)
+
+    def run_session():
+        parallel_session = connection['Session']()
+        request.parallel_sessions.add(parallel_session)
+
+        try:
+            if setup_session:
+                setup_query_session(request, parallel_session, timezone)
+
+            return func(parallel_session)
+        finally:
+            request.parallel_sessions.discard(parallel_session)
+            parallel_session.close()
+
+    def run():
+        parallel_queries_local.running = True
+
+        try:
+            return run_session()
+        finally:
+            parallel_queries_local.running = False
+
+    try:
+        return get_parallel_queries_executor().submit(run)
+    except RuntimeError:
+        # Executor is shut down on exit
+        return
+
+
+def get_parallel_queries_stats():
+    executor = parallel_queries_executor
+
+    return {
+        'enabled': settings.PARALLEL_QUERIES,
+        'max_workers': settings.PARALLEL_QUERIES_WORKERS,
+        'queued': executor._work_queue.qsize() if executor else 0,
+        'threads': len(executor._threads) if executor else 0
+    }
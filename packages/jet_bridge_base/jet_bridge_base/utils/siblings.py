@@ -2,7 +2,8 @@ from sqlalchemy import inspect, func
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import load_only
 
-from jet_bridge_base.db_types import apply_default_ordering, queryset_count_optimized, get_queryset_order_by
+from jet_bridge_base.db_types import apply_default_ordering, get_queryset_order_by
+from jet_bridge_base.utils.count import queryset_count
 
 
 def get_row_number(Model, queryset, instance):
@@ -60,9 +61,10 @@ def get_row_siblings(Model, queryset, row_number):
 
 
 def get_model_siblings(request, Model, instance, queryset):
-    count = queryset_count_optimized(request.session, queryset)
+    count = queryset_count(request, queryset)['count']
 
-    if count > 10000:
+    # Deferred count means the table is too large for row numbers as well
+    if count is None or count > 10000:
         return {}
 
     queryset = apply_default_ordering(Model, queryset)
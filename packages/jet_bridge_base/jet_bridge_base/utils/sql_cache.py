@@ -0,0 +1,197 @@
+import asyncio
+import json
+import re
+import threading
+import time
+
+from jet_bridge_base import encoders, settings
+from jet_bridge_base.db import get_request_connection
+from jet_bridge_base.utils.cache import TTLCache
+from jet_bridge_base.utils.crypt import get_sha256_hash
+
+SQL_LITERALS_RE = re.compile(r'(\'(?:[^\']|\'\')*\'|"(?:[^"]|"")*")')
+SQL_IDENTIFIERS_RE = re.compile(r'[a-z_][a-z0-9_$]*')
+SQL_WHITESPACE_RE = re.compile(r'\s+')
+
+# Rows encoded to estimate result size
+SIZE_SAMPLE_ROWS = 32
+
+sql_results_cache = None
+sql_results_cache_lock = threading.Lock()
+sql_results_pending_async = {}
+table_generations = {}
+table_generations_lock = threading.Lock()
+
+
+def get_sql_result_size(entry):
+    # Approximate encoded size extrapolated from evenly spaced rows, so results are not encoded twice
+    result = entry['result']
+    rows = result.get('data') or []
+    size = len(encoders.dumps(dict(filter(lambda x: x[0] != 'data', result.items()))))
+
+    if rows:
+        sample = rows[::max(len(rows) // SIZE_SAMPLE_ROWS, 1)][:SIZE_SAMPLE_ROWS]
+        size += len(encoders.dumps(sample)) * len(rows) // len(sample)
+
+    return size
+
+
+def get_sql_results_cache():
+    global sql_results_cache
+
+    with sql_results_cache_lock:
+        if sql_results_cache is None:
+            sql_results_cache = TTLCache(
+                max_size=4096,
+                max_memory=settings.SQL_CACHE_MAX_MEMORY,
+                sizeof=get_sql_result_size
+            )
+
+        return sql_results_cache
+
+
+def get_sql_cache_ttl(data):
+    ttl = data.get('cache_ttl')
+
+    if ttl is None:
+        ttl = settings.SQL_CACHE_TTL
+
+    if not ttl or ttl < 0 or not settings.SQL_CACHE_MAX_MEMORY:
+        return
+
+    return ttl
+
+
+def normalize_sql_query(query):
+    # Whitespace is collapsed everywhere except string literals and quoted identifiers
+    parts = SQL_LITERALS_RE.split(query.strip())
+    return ''.join(map(lambda x: x[1] if x[0] % 2 else SQL_WHITESPACE_RE.sub(' ', x[1]), enumerate(parts)))
+
+
+def get_sql_fingerprint(data):
+    data = dict(filter(lambda x: x[0] != 'cache_ttl', data.items()))
+    data['query'] = normalize_sql_query(data['query'])
+    return get_sha256_hash(json.dumps(data, sort_keys=True, default=str))
+
+
+def get_request_connection_id(request):
+    connection = get_request_connection(request)
+    return connection['id'] if connection else None
+
+
+def get_sql_query_tables(request, query):
+    # Any mapped table mentioned in query is treated as referenced, extra matches only invalidate more often
+    connection = get_request_connection(request)
+    MappedBase = connection.get('MappedBase') if connection else None
+
+    if MappedBase is None:
+        return []
+
+    identifiers = set(SQL_IDENTIFIERS_RE.findall(query.lower()))
+    table_names = set(map(lambda x: x.name.lower(), MappedBase.metadata.tables.values()))
+
+    return sorted(table_names & identifiers)
+
+
+def get_table_generations(connection_id, table_names):
+    with table_generations_lock:
+        return tuple(map(lambda x: table_generations.get((connection_id, x), 0), table_names))
+
+
+def get_sql_cache_key(request, data):
+    connection_id = get_request_connection_id(request)
+    table_names = get_sql_query_tables(request, data['query'])
+
+    # Writes bump table generations, so results read before the write are no longer reachable
+    return (
+        connection_id,
+        request.get_rls_identity(),
+        get_sql_fingerprint(data),
+        get_table_generations(connection_id, table_names)
+    )
+
+
+def get_sql_cache_response(entry, hit, ttl):
+    return {
+        **entry['result'],
+        'cache': {
+            'hit': hit,
+            'age': round(time.time() - entry['created'], 3),
+            'ttl': ttl
+        }
+    }
+
+
+def get_sql_cache_entry(key, ttl):
+    cache = get_sql_results_cache()
+    entry = cache.get(key)
+
+    # Entry may be created with longer TTL hint than requested
+    if entry is not None and time.time() - entry['created'] > ttl:
+        cache.delete(key)
+        return
+
+    return entry
+
+
+def sql_cache_get_or_execute(request, data, ttl, execute):
+    key = get_sql_cache_key(request, data)
+    entry = get_sql_cache_entry(key, ttl)
+
+    if entry is not None:
+        return get_sql_cache_response(entry, True, ttl)
+
+    executed = []
+
+    def create():
+        executed.append(True)
+        return {'result': execute(), 'created': time.time()}
+
+    # Identical concurrent queries wait for a single execution
+    entry = get_sql_results_cache().get_or_set(key, create, ttl)
+    return get_sql_cache_response(entry, not executed, ttl)
+
+
+async def sql_cache_get_or_execute_async(request, data, ttl, execute):
+    key = get_sql_cache_key(request, data)
+    entry = get_sql_cache_entry(key, ttl)
+
+    if entry is not None:
+        return get_sql_cache_response(entry, True, ttl)
+
+    cache = get_sql_results_cache()
+    task = sql_results_pending_async.get(key)
+
+    # Identical concurrent queries wait for a single execution (all of them run on the same event loop)
+    if task is not None:
+        with cache.lock:
+            cache.coalesced += 1
+
+        entry = await asyncio.shield(task)
+        return get_sql_cache_response(entry, True, ttl)
+
+    async def create():
+        entry = {'result': await execute(), 'created': time.time()}
+        cache.set(key, entry, ttl)
+        return entry
+
+    task = asyncio.ensure_future(create())
+    sql_results_pending_async[key] = task
+    task.add_done_callback(lambda _: sql_results_pending_async.pop(key, None))
+
+    entry = await asyncio.shield(task)
+    return get_sql_cache_response(entry, False, ttl)
+
+
+def invalidate_table_queries(request, table_name):
+    key = (get_request_connection_id(request), table_name.lower())
+
+    with table_generations_lock:
+        table_generations[key] = table_generations.get(key, 0) + 1
+
+
+def invalidate_model_queries(request, Model):
+    table = getattr(Model, '__table__', None)
+
+    if table is not None:
+        invalidate_table_queries(request, table.name)
@@ -1,14 +1,23 @@
 import json
+import time
+from functools import lru_cache
+
 import jwt
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives.serialization import load_pem_public_key
 from jwt import PyJWTError
 
 from jet_bridge_base import settings
+from jet_bridge_base.utils.cache import TTLCache
 from jet_bridge_base.utils.compress import decompress_data
 
 USER_TOKEN_PREFIX = 'Token'
 PROJECT_TOKEN_PREFIX = 'ProjectToken'
 JWT_TOKEN_PREFIX = 'JWT'
 BEARER_TOKEN_PREFIX = 'Bearer'
+JWT_NO_EXP_CACHE_TTL = 5 * 60
+
+verified_jwt_tokens_cache = TTLCache(max_size=1024)
 
 
 def parse_token(value):
@@ -42,14 +51,42 @@ def parse_token(value):
         return list(result.values())[0]
 
 
+@lru_cache(maxsize=4)
+def load_jwt_verify_key(value):
+    key = '\n'.join([line.lstrip() for line in value.split('\\n')])
+
+    try:
+        return load_pem_public_key(key.encode('utf-8'), backend=default_backend())
+    except ValueError:
+        return key
+
+
 def decode_jwt_token(token, verify_exp=True):
-    JWT_VERIFY_KEY = '\n'.join([line.lstrip() for line in settings.JWT_VERIFY_KEY.split('\\n')])
+    cache_key = (token, verify_exp, settings.JWT_VERIFY_KEY)
+    result = verified_jwt_tokens_cache.get(cache_key)
+
+    if result is not None:
+        return result
+
+    JWT_VERIFY_KEY = load_jwt_verify_key(settings.JWT_VERIFY_KEY)
 
     try:
-        return jwt.decode(token, key=JWT_VERIFY_KEY, algorithms=['RS256'], options={'verify_exp': verify_exp})
+        result = jwt.decode(token, key=JWT_VERIFY_KEY, algorithms=['RS256'], options={'verify_exp': verify_exp})
     except PyJWTError:
         return None
 
+    exp = result.get('exp') if isinstance(result.get('exp'), (int, float)) else None
+
+    if exp is None or not verify_exp:
+        ttl = JWT_NO_EXP_CACHE_TTL
+    else:
+        ttl = exp - time.time()
+
+    if ttl > 0:
+        verified_jwt_tokens_cache.set(cache_key, result, ttl=ttl)
+
+    return result
+
 
 def decompress_permissions(permissions):
     decoded = decompress_data(permissions)
@@ -6,7 +6,6 @@ from jet_bridge_base import settings
 from jet_bridge_base.configuration import configuration
 from jet_bridge_base.db import get_request_connection
 from jet_bridge_base.sentry import sentry_controller
-from jet_bridge_base.utils.conf import get_conf
 
 TRACK_DATABASES_THROTTLE = 60 * 15
 
@@ -55,6 +54,6 @@ def track_database_async(request):
     if not settings.TRACK_DATABASES_ENDPOINT:
         return
 
-    conf = get_conf(request)
+    conf = request.get_connection_context().conf
     connection = get_request_connection(request)
     configuration.run_async(track_database, conf, connection)
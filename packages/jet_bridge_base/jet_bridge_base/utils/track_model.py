@@ -1,10 +1,8 @@
-import json
-
 import requests
 
 from jet_bridge_base import settings
 from jet_bridge_base.configuration import configuration
-from jet_bridge_base.encoders import JSONEncoder
+from jet_bridge_base import encoders
 from jet_bridge_base.sentry import sentry_controller
 
 
@@ -42,7 +40,7 @@ def track_model(project, environment, resource_token, model, action, uid, model_
     if settings.TRACK_MODELS_AUTH:
         headers['Authorization'] = settings.TRACK_MODELS_AUTH
 
-    data_str = json.dumps(data, cls=JSONEncoder)
+    data_str = encoders.dumps(data)
 
     try:
         r = requests.post(url, data=data_str, headers=headers)
@@ -16,7 +16,6 @@ from jet_bridge_base.responses.json import JSONResponse
 from jet_bridge_base.responses.template import TemplateResponse
 from jet_bridge_base.logger import logger
 from jet_bridge_base.utils.common import format_size
-from jet_bridge_base.utils.conf import get_connection_name, get_conf, get_connection_schema, get_connection_id
 from jet_bridge_base.utils.exceptions import serialize_validation_error
 
 
@@ -75,11 +74,9 @@ class BaseAPIView(object):
         if not len(tags):
             return
 
-        conf = get_conf(request)
-        schema = get_connection_schema(conf)
-        connection_id = get_connection_id(conf)
-        connection_name = get_connection_name(conf, schema)
-        id_short = connection_id[:4]
+        context = request.get_connection_context()
+        connection_name = context.name
+        id_short = context.id_short
 
         track_query_name = self.get_track_query_name(request) or '{} {}'.format(request.method, request.path)
 
@@ -199,6 +196,12 @@ class BaseAPIView(object):
             raise NotFound()
         return getattr(self, action)(request, *args, **kwargs)
 
+    def get_async_action(self, action, request):
+        # Views may return a coroutine function here to be awaited on the event loop instead of
+        # running the action in a worker thread (used when ASYNC_DATABASE is enabled).
+        # Called in a worker thread, so it may access the request database connection
+        pass
+
     # def build_absolute_uri(self, request, url):
     #     return request.protocol + '://' + request.host + url
 
@@ -3,6 +3,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from jet_bridge_base.db_types import apply_session_timezone
 from jet_bridge_base.db_types.mongo import MongoSession
 from jet_bridge_base.exceptions.not_found import NotFound
+from jet_bridge_base.paginators.cursor import CursorPagination
 from jet_bridge_base.paginators.page_number import PageNumberPagination
 from jet_bridge_base.serializers.model_serializer import get_column_data_type
 from jet_bridge_base.views.base.api import APIView
@@ -12,7 +13,7 @@ class GenericAPIView(APIView):
     serializer_class = None
     filter_class = None
     pagination_class = PageNumberPagination
-    _paginator = None
+    cursor_pagination_class = CursorPagination
     lookup_url_kwarg = None
 
     def get_model(self, request):
@@ -59,15 +60,15 @@ class GenericAPIView(APIView):
         filter_class = self.get_filter_class(request)
         if not filter_class:
             return
-        kwargs['context'] = self.filter_context()
+        kwargs['context'] = self.filter_context(request)
         return filter_class(*args, **kwargs)
 
     def get_filter_class(self, request):
         return self.filter_class
 
-    def filter_context(self):
+    def filter_context(self, request):
         return {
-            # 'request': self.request,
+            'request': request,
             'handler': self
         }
 
@@ -86,24 +87,39 @@ class GenericAPIView(APIView):
             queryset = filter_instance.filter_queryset(request, queryset)
         return queryset
 
-    @property
-    def paginator(self):
-        if not self._paginator:
-            if self.pagination_class is None:
-                self._paginator = None
-            else:
-                self._paginator = self.pagination_class()
-        return self._paginator
+    def get_pagination_class(self, request):
+        # Cursor pagination is enabled with ?_pagination=cursor or by passing a cursor from previous page
+        if self.cursor_pagination_class is not None:
+            if request.get_argument('_pagination', None) == 'cursor' \
+                    or request.get_argument(self.cursor_pagination_class.cursor_query_param, None):
+                return self.cursor_pagination_class
+        return self.pagination_class
+
+    def get_paginator(self, request):
+        # Paginators hold page state, so they are kept per request as view instance is shared
+        if request.paginator is None:
+            pagination_class = self.get_pagination_class(request)
+            if pagination_class is not None:
+                request.paginator = pagination_class()
+        return request.paginator
 
     def paginate_queryset(self, request, queryset):
-        if self.paginator is None:
+        paginator = self.get_paginator(request)
+        if paginator is None:
             return None
-        return self.paginator.paginate_queryset(request, queryset, self)
+        return paginator.paginate_queryset(request, queryset, self)
+
+    def get_paginated_response(self, request, data, **kwargs):
+        paginator = self.get_paginator(request)
+        if paginator is None:
+            raise AssertionError()
+        return paginator.get_paginated_response(request, data, **kwargs)
 
-    def get_paginated_response(self, request, data):
-        if self.paginator is None:
+    def get_paginated_columns_response(self, request, data, **kwargs):
+        paginator = self.get_paginator(request)
+        if paginator is None:
             raise AssertionError()
-        return self.paginator.get_paginated_response(request, data)
+        return paginator.get_paginated_columns_response(request, data, **kwargs)
 
     def get_serializer(self, request, *args, **kwargs):
         serializer_class = self.get_serializer_class(request)
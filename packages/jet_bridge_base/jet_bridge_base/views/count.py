@@ -0,0 +1,18 @@
+from jet_bridge_base.exceptions.not_found import NotFound
+from jet_bridge_base.permissions import HasProjectPermissions
+from jet_bridge_base.responses.json import JSONResponse
+from jet_bridge_base.utils.count import get_deferred_count
+from jet_bridge_base.views.base.api import APIView
+
+
+class CountView(APIView):
+    permission_classes = (HasProjectPermissions,)
+
+    def get(self, request, *args, **kwargs):
+        token = request.get_argument('token', None)
+        result = get_deferred_count(request, token) if token else None
+
+        if result is None:
+            raise NotFound
+
+        return JSONResponse(result)
@@ -199,6 +199,8 @@ class GraphQLView(APIView):
         except Exception as e:
             return JSONResponse({'errors': ['Failed to get table schema: {}'.format(e)]})
 
+        request.apply_statement_timeout()
+
         query = request.data.get('query')
         context_value = {
             'request': request,
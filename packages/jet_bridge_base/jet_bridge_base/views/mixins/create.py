@@ -1,6 +1,7 @@
 from jet_bridge_base import status
 from jet_bridge_base.configuration import configuration
 from jet_bridge_base.responses.json import JSONResponse
+from jet_bridge_base.utils.sql_cache import invalidate_model_queries
 from jet_bridge_base.utils.track_database import track_database_async
 from jet_bridge_base.utils.track_model import track_model_async
 
@@ -26,4 +27,5 @@ class CreateAPIViewMixin(object):
         serializer_instance = serializer.create_instance(serializer.validated_data)
         configuration.on_model_pre_create(request.path_kwargs['model'], serializer_instance)
         instance = serializer.save()
+        invalidate_model_queries(request, self.get_model(request))
         configuration.on_model_post_create(request.path_kwargs['model'], instance)
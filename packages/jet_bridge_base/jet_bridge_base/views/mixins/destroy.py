@@ -5,6 +5,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from jet_bridge_base import status
 from jet_bridge_base.configuration import configuration
 from jet_bridge_base.responses.json import JSONResponse
+from jet_bridge_base.utils.sql_cache import invalidate_model_queries
 from jet_bridge_base.utils.exceptions import validation_error_from_database_error
 
 
@@ -36,4 +37,5 @@ class DestroyAPIViewMixin(object):
             request.session.rollback()
             raise validation_error_from_database_error(e, Model)
 
+        invalidate_model_queries(request, Model)
         configuration.on_model_post_delete(request.path_kwargs['model'], instance)
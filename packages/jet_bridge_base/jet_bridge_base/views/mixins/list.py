@@ -1,7 +1,10 @@
 from sqlalchemy.exc import SQLAlchemyError
 
 from jet_bridge_base.db_types import get_queryset_limit
-from jet_bridge_base.responses.json import JSONResponse
+from jet_bridge_base.responses.streaming_json import StreamingJSONResponse
+from jet_bridge_base.utils.columns import COLUMNS_FORMAT, get_columns_data
+from jet_bridge_base.utils.content_negotiation import ARROW_FORMAT, JSON_FORMAT, get_response_class, \
+    get_response_format
 from jet_bridge_base.utils.track_database import track_database_async
 
 
@@ -10,19 +13,34 @@ class ListAPIViewMixin(object):
     def list(self, request, *args, **kwargs):
         track_database_async(request)
 
+        request.apply_statement_timeout()
         self.apply_timezone(request)
         request.apply_rls_if_enabled()
 
         queryset = self.filter_queryset(request, self.get_queryset(request))
 
         paginate = not request.get_argument('_no_pagination', False)
+        response_format = get_response_format(request)
+        response_class = get_response_class(response_format)
+        # Arrow is columnar by itself, other formats keep JSON layout
+        columns_format = request.get_argument('_format', None) == COLUMNS_FORMAT or response_format == ARROW_FORMAT
+        dictionary = bool(request.get_argument('_dictionary', False)) and response_format != ARROW_FORMAT
 
         try:
             page = self.paginate_queryset(request, queryset) if paginate else None
             if page is not None:
                 instance = list(page)
                 serializer = self.get_serializer(request, instance=instance, many=True)
-                return self.get_paginated_response(request, serializer.representation_data)
+
+                if columns_format:
+                    data = get_columns_data(serializer, instance, dictionary=dictionary)
+                    return self.get_paginated_columns_response(request, data, response_class=response_class)
+
+                return self.get_paginated_response(
+                    request,
+                    serializer.representation_data,
+                    response_class=response_class
+                )
         except SQLAlchemyError:
             request.session.rollback()
             raise
@@ -30,11 +48,22 @@ class ListAPIViewMixin(object):
         if get_queryset_limit(queryset) is None:
             queryset = queryset.limit(10000)
 
+        if response_format == JSON_FORMAT:
+            response_class = StreamingJSONResponse
+
         try:
-            instance = list(queryset)
-            serializer = self.get_serializer(request, instance=instance, many=True)
-            data = serializer.representation_data
-            return JSONResponse(data)
+            serializer = self.get_serializer(request, many=True)
+
+            if columns_format and dictionary:
+                return response_class(get_columns_data(serializer, iter(queryset), dictionary=True))
+            elif columns_format:
+                return response_class({
+                    'columns': serializer.get_representation_columns(),
+                    'rows': map(serializer.to_representation_row, iter(queryset))
+                })
+
+            data = map(serializer.to_representation_item, iter(queryset))
+            return response_class(data)
         except SQLAlchemyError:
             request.session.rollback()
             raise
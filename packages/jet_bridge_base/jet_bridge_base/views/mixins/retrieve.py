@@ -7,6 +7,7 @@ class RetrieveAPIViewMixin(object):
     def retrieve(self, request, *args, **kwargs):
         track_database_async(request)
 
+        request.apply_statement_timeout()
         self.apply_timezone(request)
         request.apply_rls_if_enabled()
         instance = self.get_object(request)
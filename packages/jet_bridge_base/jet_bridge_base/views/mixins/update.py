@@ -1,5 +1,6 @@
 from jet_bridge_base.configuration import configuration
 from jet_bridge_base.responses.json import JSONResponse
+from jet_bridge_base.utils.sql_cache import invalidate_model_queries
 from jet_bridge_base.utils.track_database import track_database_async
 from jet_bridge_base.utils.track_model import track_model_async
 
@@ -31,6 +32,7 @@ class UpdateAPIViewMixin(object):
     def perform_update(self, request, serializer):
         configuration.on_model_pre_update(request.path_kwargs['model'], serializer.instance)
         instance = serializer.save()
+        invalidate_model_queries(request, self.get_model(request))
         configuration.on_model_post_update(request.path_kwargs['model'], instance)
 
     def partial_update(self, *args, **kwargs):
@@ -20,6 +20,7 @@ from jet_bridge_base.serializers.model_group import ModelGroupSerializer
 from jet_bridge_base.serializers.reorder import get_reorder_serializer
 from jet_bridge_base.serializers.reset_order import get_reset_order_serializer
 from jet_bridge_base.utils.siblings import get_model_siblings
+from jet_bridge_base.utils.sql_cache import invalidate_model_queries
 from jet_bridge_base.views.mixins.model import ModelAPIViewMixin
 
 
@@ -71,7 +72,7 @@ class ModelViewSet(ModelAPIViewMixin):
 
     def get_serializer_class(self, request):
         Model = self.get_model(request)
-        return get_model_serializer(Model)
+        return get_model_serializer(Model, request)
 
     def get_filter_class(self, request):
         Model = self.get_model(request)
@@ -121,6 +122,7 @@ class ModelViewSet(ModelAPIViewMixin):
 
     @action(methods=['get'], detail=False)
     def aggregate(self, request, *args, **kwargs):
+        request.apply_statement_timeout()
         self.apply_timezone(request)
         request.apply_rls_if_enabled()
 
@@ -166,6 +168,7 @@ class ModelViewSet(ModelAPIViewMixin):
 
     @action(methods=['get'], detail=False)
     def group(self, request, *args, **kwargs):
+        request.apply_statement_timeout()
         self.apply_timezone(request)
         request.apply_rls_if_enabled()
 
@@ -239,6 +242,7 @@ class ModelViewSet(ModelAPIViewMixin):
         serializer = ReorderSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         serializer.save()
+        invalidate_model_queries(request, Model)
 
         return JSONResponse(serializer.representation_data)
 
@@ -254,6 +258,7 @@ class ModelViewSet(ModelAPIViewMixin):
         serializer = ResetOrderSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         serializer.save()
+        invalidate_model_queries(request, Model)
 
         return JSONResponse(serializer.representation_data)
 
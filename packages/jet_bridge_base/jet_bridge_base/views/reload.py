@@ -1,8 +1,7 @@
-from jet_bridge_base.db import dispose_request_connection, get_request_connection
+from jet_bridge_base.db import dispose_request_connection, get_request_connection, reload_blacklist_hostnames
 from jet_bridge_base.db_types import remove_metadata_file
 from jet_bridge_base.permissions import HasProjectPermissions
 from jet_bridge_base.responses.json import JSONResponse
-from jet_bridge_base.utils.conf import get_conf
 from jet_bridge_base.views.base.api import APIView
 
 
@@ -17,7 +16,9 @@ class ReloadView(APIView):
         }
 
     def post(self, request, *args, **kwargs):
-        conf = get_conf(request)
+        reload_blacklist_hostnames()
+
+        conf = request.get_connection_context().conf
         remove_metadata_file(conf)
 
         result = dispose_request_connection(request)
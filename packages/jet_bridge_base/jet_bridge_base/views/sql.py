@@ -1,6 +1,11 @@
+from jet_bridge_base.db import get_async_engine
 from jet_bridge_base.permissions import HasProjectPermissions
 from jet_bridge_base.responses.json import JSONResponse
+from jet_bridge_base.responses.streaming_json import StreamingJSONResponse
+from jet_bridge_base.responses.arrow import ArrowResponse
 from jet_bridge_base.serializers.sql import SqlSerializer, SqlsSerializer
+from jet_bridge_base.utils.content_negotiation import ARROW_FORMAT, JSON_FORMAT, get_response_class, \
+    get_response_format
 from jet_bridge_base.utils.track_database import track_database_async
 from jet_bridge_base.views.base.api import APIView
 
@@ -9,14 +14,61 @@ class SqlView(APIView):
     permission_classes = (HasProjectPermissions,)
     track_queries = True
 
+    def get_serializer(self, request):
+        if 'queries' in request.data:
+            return SqlsSerializer(data=request.data, context={'request': request})
+        else:
+            return SqlSerializer(data=request.data, context={'request': request})
+
+    def get_async_action(self, action, request):
+        if action == 'post' and get_async_engine(request) is not None:
+            return self.post_async
+
+    def get_response(self, request, serializer, result):
+        response_format = get_response_format(request)
+
+        if isinstance(serializer, SqlsSerializer) and not isinstance(result, list):
+            if response_format == JSON_FORMAT:
+                response = StreamingJSONResponse(result)
+                # Every finished query is sent to the client right away
+                response.chunk_size = 1
+                return response
+
+            result = list(result)
+
+        if response_format == ARROW_FORMAT:
+            # Arrow is supported only for single query results, batches fall back to JSON
+            if isinstance(serializer, SqlSerializer):
+                return ArrowResponse(result, rows_key='data')
+        elif response_format != JSON_FORMAT:
+            return get_response_class(response_format)(result)
+
+        if isinstance(serializer, SqlSerializer) and not isinstance(result.get('data'), list):
+            return StreamingJSONResponse(result)
+
+        return JSONResponse(result)
+
     def post(self, request, *args, **kwargs):
         track_database_async(request)
 
-        if 'queries' in request.data:
-            serializer = SqlsSerializer(data=request.data, context={'request': request})
+        serializer = self.get_serializer(request)
+        serializer.is_valid(raise_exception=True)
+
+        if isinstance(serializer, SqlSerializer):
+            result = serializer.execute_cached(serializer.validated_data, stream=True)
         else:
-            serializer = SqlSerializer(data=request.data, context={'request': request})
+            result = serializer.execute(serializer.validated_data)
+
+        return self.get_response(request, serializer, result)
 
+    async def post_async(self, request, *args, **kwargs):
+        track_database_async(request)
+
+        serializer = self.get_serializer(request)
         serializer.is_valid(raise_exception=True)
-        result = serializer.execute(serializer.validated_data)
-        return JSONResponse(result)
+        if isinstance(serializer, SqlSerializer):
+            result = await serializer.execute_cached_async(serializer.validated_data)
+        else:
+            result = await serializer.execute_async(serializer.validated_data)
+
+        return self.get_response(request, serializer, result)
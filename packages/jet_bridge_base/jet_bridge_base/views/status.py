@@ -1,16 +1,26 @@
 import time
 
+from jet_bridge_base.certificate_store import certificate_store
 from jet_bridge_base.configuration import configuration
 from jet_bridge_base.db import connections, pending_connections
-from jet_bridge_base.db_types import inspect_uniform
-from jet_bridge_base.permissions import AdministratorPermissions
+from jet_bridge_base.db_types import inspect_uniform, get_connection_compiled_cache_stats
+from jet_bridge_base.permissions import AdministratorPermissions, jwt_permissions_cache
+from jet_bridge_base.request import bridge_settings_cache
 from jet_bridge_base.responses.json import JSONResponse
 from jet_bridge_base.sentry import sentry_controller
+from jet_bridge_base.serializers.sql import sql_filter_plans_cache, sql_subqueries_cache
+from jet_bridge_base.utils.backend import project_auth_cache
 from jet_bridge_base.utils.classes import issubclass_safe
 from jet_bridge_base.utils.common import format_size
+from jet_bridge_base.utils.count import counts_cache, deferred_counts, get_deferred_counts_stats
+from jet_bridge_base.utils.crypt import derived_keys_cache
+from jet_bridge_base.utils.datetime import parsed_datetimes_cache
+from jet_bridge_base.utils.parallel import get_parallel_queries_stats
 from jet_bridge_base.utils.graphql import ModelFiltersType, ModelFiltersFieldType, ModelFiltersRelationshipType, \
     ModelLookupsType, ModelLookupsFieldType, ModelLookupsRelationshipType, ModelSortType, ModelAttrsType
 from jet_bridge_base.utils.process import get_memory_usage
+from jet_bridge_base.utils.sql_cache import get_sql_results_cache
+from jet_bridge_base.utils.token import verified_jwt_tokens_cache
 from jet_bridge_base.views.base.api import BaseAPIView
 
 
@@ -138,6 +148,7 @@ class StatusView(BaseAPIView):
             'reflect_metadata_dump': connection.get('reflect_metadata_dump'),
             'default_timezone': str(connection['default_timezone']) if connection.get('default_timezone') else None,
             'default_timezone_updated': default_timezone_updated.isoformat() if default_timezone_updated else None,
+            'compiled_cache': get_connection_compiled_cache_stats(connection),
             'tunnel': tunnel,
             'last_request': last_request.isoformat() if last_request else None
         }
@@ -156,6 +167,22 @@ class StatusView(BaseAPIView):
             'tunnel': tunnel
         }
 
+    def get_caches(self):
+        return {
+            'bridge_settings': bridge_settings_cache.stats(),
+            'counts': counts_cache.stats(),
+            'deferred_counts': deferred_counts.stats(),
+            'derived_keys': derived_keys_cache.stats(),
+            'project_auth': project_auth_cache.stats(),
+            'jwt_permissions': jwt_permissions_cache.stats(),
+            'jwt_tokens': verified_jwt_tokens_cache.stats(),
+            'parsed_datetimes': parsed_datetimes_cache.stats(),
+            'sql_filter_plans': sql_filter_plans_cache.stats(),
+            'sql_results': get_sql_results_cache().stats(),
+            'sql_subqueries': sql_subqueries_cache.stats(),
+            'ssl_certificates': certificate_store.stats()
+        }
+
     def get(self, request, *args, **kwargs):
         now = time.time()
         uptime = round(now - configuration.init_time)
@@ -189,6 +216,10 @@ class StatusView(BaseAPIView):
             'pending_connections': map(lambda x: self.map_pending_connection(x), pending_connections.values()),
             'schema_generating_connections': map(lambda x: self.map_connection(x), schema_generating_connections),
             'active_connections': map(lambda x: self.map_connection(x), active_connections),
+            'caches': self.get_caches(),
+            'executor': configuration.get_executor_stats(),
+            'parallel_queries': get_parallel_queries_stats(),
+            'deferred_counts': get_deferred_counts_stats(),
             'memory_used': memory_used,
             'memory_used_str': format_size(memory_used),
             'uptime': uptime
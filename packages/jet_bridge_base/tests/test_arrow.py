@@ -0,0 +1,73 @@
+import datetime
+import json
+
+import pytest
+
+pyarrow = pytest.importorskip('pyarrow')
+
+from jet_bridge_base.responses.arrow import ArrowResponse, to_arrow_array
+
+
+def read_table(data):
+    return pyarrow.ipc.open_stream(data).read_all()
+
+
+def test_json_values():
+    array = to_arrow_array([{'a': 1}, [1, 2], 'x'])
+
+    assert array.type == pyarrow.string()
+    assert list(map(json.loads, array.to_pylist()[:2])) == [{'a': 1}, [1, 2]]
+    assert array.to_pylist()[2] == 'x'
+
+
+def test_mixed_timezones():
+    values = [
+        datetime.datetime(2024, 1, 1, 10, tzinfo=datetime.timezone(datetime.timedelta(hours=3))),
+        datetime.datetime(2024, 1, 1, 10, tzinfo=datetime.timezone.utc),
+        'x'
+    ]
+
+    assert to_arrow_array(values).to_pylist() == ['2024-01-01T10:00:00+03:00', '2024-01-01T10:00:00Z', 'x']
+    assert to_arrow_array(values[:2]).to_pylist() == ['2024-01-01T10:00:00+03:00', '2024-01-01T10:00:00Z']
+
+    array = to_arrow_array(values[:1])
+    assert array.type == pyarrow.timestamp('us', tz='+03:00')
+    assert array.to_pylist() == values[:1]
+
+
+def test_streaming_batches():
+    rows = list(map(
+        lambda x: [x, None if x < 5 else 'name {}'.format(x), x if x < 3 else 'x', x if x < 7 else 'x'],
+        range(10)
+    ))
+    response = ArrowResponse({
+        'columns': ['id', 'name', 'mixed', 'value'],
+        'column_descriptions': {'id': {'field': 'IntegerField'}},
+        'rows': iter(rows),
+        'count': 10
+    })
+    response.batch_size = 2
+
+    chunks = list(response.render_chunks())
+    table = read_table(b''.join(chunks))
+
+    assert len(chunks) == 6
+    assert table.schema.field('id').type == pyarrow.int64()
+    assert table.schema.field('id').metadata == {b'field': b'IntegerField'}
+    assert table.schema.field('name').type == pyarrow.string()
+    assert json.loads(table.schema.metadata[b'jet']) == {'count': 10}
+    assert table.column('id').to_pylist() == list(range(10))
+    assert table.column('name').to_pylist() == list(map(lambda x: x[1], rows))
+    # Batches are read ahead until name type is known, mixed types of them are unified to string
+    assert table.column('mixed').to_pylist() == ['0', '1', '2'] + ['x'] * 7
+    # Types of later batches are converted to the schema, unconvertible values become nulls
+    assert table.schema.field('value').type == pyarrow.int64()
+    assert table.column('value').to_pylist() == list(range(7)) + [None] * 3
+
+
+def test_empty():
+    response = ArrowResponse({'columns': ['id'], 'column_descriptions': {'id': {'field': 'IntegerField'}}, 'rows': []})
+    table = read_table(response.render())
+
+    assert table.num_rows == 0
+    assert table.schema.field('id').type == pyarrow.int64()
@@ -0,0 +1,76 @@
+import pytest
+from requests import RequestException
+
+from jet_bridge_base.utils import backend
+from jet_bridge_base.utils.backend import cached_project_auth, project_auth_cache
+
+
+class Response(object):
+
+    def __init__(self, status_code, data=None):
+        self.status_code = status_code
+        self.reason = ''
+        self.text = ''
+        self.data = data or {}
+
+    def json(self):
+        return self.data
+
+
+@pytest.fixture
+def responses(monkeypatch):
+    responses = []
+    requests = []
+
+    def request(*args, **kwargs):
+        requests.append(args)
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    monkeypatch.setattr(backend.http_session, 'request', request)
+    project_auth_cache.clear()
+
+    yield responses, requests
+
+    project_auth_cache.clear()
+
+
+def test_allowed_cached(responses):
+    responses, requests = responses
+    responses.append(Response(200))
+
+    assert cached_project_auth('token', 'project_token')['result'] is True
+    assert cached_project_auth('token', 'project_token')['result'] is True
+    assert len(requests) == 1
+
+
+@pytest.mark.parametrize('response', [Response(403), Response(200, {'access_disabled': True})])
+def test_denied_cached(responses, response):
+    responses, requests = responses
+    responses.append(response)
+
+    assert cached_project_auth('token', 'project_token')['result'] is False
+    assert cached_project_auth('token', 'project_token')['result'] is False
+    assert len(requests) == 1
+
+
+def test_backend_error_not_cached(responses):
+    responses, requests = responses
+    responses.extend([Response(502), Response(200)])
+
+    assert cached_project_auth('token', 'project_token')['result'] is False
+    assert cached_project_auth('token', 'project_token')['result'] is True
+    assert len(requests) == 2
+
+
+def test_network_error_not_cached(responses):
+    responses, requests = responses
+    responses.extend([RequestException(), Response(200)])
+
+    with pytest.raises(RequestException):
+        cached_project_auth('token', 'project_token')
+
+    assert cached_project_auth('token', 'project_token')['result'] is True
+    assert len(requests) == 2
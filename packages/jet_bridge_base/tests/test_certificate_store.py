@@ -0,0 +1,48 @@
+import os
+
+from jet_bridge_base import certificate_store as certificate_store_module
+from jet_bridge_base.certificate_store import CertificateStore
+
+
+def test_save(tmp_path):
+    store = CertificateStore(str(tmp_path / 'ssl'))
+    file_path = store.save('{}-ca.pem', 'content')
+
+    with open(file_path) as f:
+        assert f.read() == 'content'
+
+    assert store.save('{}-ca.pem', 'content') == file_path
+    assert store.save('{}-ca.pem', 'other') != file_path
+    assert store.stats() == {'files': 2}
+
+
+def test_index_trusted(tmp_path, monkeypatch):
+    store = CertificateStore(str(tmp_path / 'ssl'))
+    file_path = store.save('{}-ca.pem', 'content')
+    checked = []
+
+    def exists(path):
+        checked.append(path)
+        return os.path.isfile(path)
+
+    monkeypatch.setattr(certificate_store_module.os.path, 'exists', exists)
+
+    store.save('{}-ca.pem', 'content')
+    assert checked == []
+
+    os.remove(file_path)
+    assert store.forget_missing([file_path, 'unknown']) == 1
+    assert store.save('{}-ca.pem', 'content') == file_path
+    assert os.path.isfile(file_path)
+    assert store.forget_missing([file_path]) == 0
+
+
+def test_release_unused(tmp_path):
+    store = CertificateStore(str(tmp_path / 'ssl'))
+    store.max_unused_time = -1
+    used_path = store.save('{}-ca.pem', 'used')
+    unused_path = store.save('{}-ca.pem', 'unused')
+
+    assert store.release_unused({used_path}) == 1
+    assert os.path.isfile(used_path)
+    assert not os.path.exists(unused_path)
@@ -0,0 +1,183 @@
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+from jet_bridge_base.utils import count as count_utils
+from jet_bridge_base import settings
+from jet_bridge_base.utils.count import COUNT_CACHED, COUNT_DEFERRED, COUNT_ESTIMATE, COUNT_EXACT, \
+    COUNT_OPTIMIZED, counts_cache, deferred_counts, get_deferred_count, get_deferred_counts_stats, queryset_count
+
+Base = declarative_base()
+
+
+class Item(Base):
+    __tablename__ = 'item'
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+
+
+class Executor(object):
+
+    def __init__(self, run=True):
+        self.run = run
+        self.pending = []
+
+    def submit(self, func, *args):
+        if self.run:
+            func(*args)
+        else:
+            self.pending.append((func, args))
+
+
+class Request(object):
+
+    def __init__(self, session, rls_identity=None):
+        self.session = session
+        self.rls_identity = rls_identity
+        self.rls_sessions = []
+
+    def get_rls_identity(self):
+        return self.rls_identity
+
+    def apply_statement_timeout(self, session=None):
+        pass
+
+    def apply_rls_if_enabled(self, session=None):
+        self.rls_sessions.append(session)
+
+
+@pytest.fixture
+def Session(monkeypatch):
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+
+    session = Session()
+    session.add_all(map(lambda x: Item(id=x, name='a' if x % 2 else 'b'), range(1, 11)))
+    session.commit()
+    session.close()
+
+    connection = {'id': 'test', 'Session': Session}
+    monkeypatch.setattr(count_utils, 'get_request_connection', lambda request: connection)
+
+    monkeypatch.setattr(count_utils, 'get_deferred_counts_executor', lambda: Executor())
+    counts_cache.clear()
+    deferred_counts.clear()
+    count_utils.deferred_counts_pending.clear()
+    count_utils.deferred_counts_connection_pending.clear()
+
+    return Session
+
+
+def add_items(session, ids):
+    session.add_all(map(lambda x: Item(id=x, name='a'), ids))
+    session.commit()
+
+
+@pytest.mark.parametrize('strategy', [COUNT_EXACT, COUNT_OPTIMIZED, COUNT_ESTIMATE, COUNT_CACHED, COUNT_DEFERRED])
+def test_count_strategies(Session, strategy):
+    session = Session()
+    request = Request(session)
+
+    assert queryset_count(request, session.query(Item), strategy) == {'count': 10}
+    assert queryset_count(request, session.query(Item).filter(Item.name == 'a'), strategy) == {'count': 5}
+
+
+def test_unknown_strategy_is_optimized(Session):
+    session = Session()
+    assert queryset_count(Request(session), session.query(Item), 'unknown') == {'count': 10}
+
+
+def test_estimate(Session, monkeypatch):
+    session = Session()
+    request = Request(session)
+    queryset = session.query(Item)
+
+    monkeypatch.setattr(count_utils, 'queryset_count_estimate', lambda session, queryset: 50000)
+    assert queryset_count(request, queryset, COUNT_ESTIMATE) == {'count': 50000, 'estimated': True}
+
+    # Small estimates are replaced with exact count
+    monkeypatch.setattr(count_utils, 'queryset_count_estimate', lambda session, queryset: 100)
+    assert queryset_count(request, queryset, COUNT_ESTIMATE) == {'count': 10}
+
+
+def test_cached(Session):
+    session = Session()
+    queryset = session.query(Item)
+
+    assert queryset_count(Request(session), queryset, COUNT_CACHED) == {'count': 10}
+
+    add_items(session, [11, 12])
+
+    assert queryset_count(Request(session), queryset, COUNT_CACHED) == {'count': 10}
+    assert queryset_count(Request(session, rls_identity='user'), queryset, COUNT_CACHED) == {'count': 12}
+    assert queryset_count(Request(session), queryset.filter(Item.id > 0), COUNT_CACHED) == {'count': 12}
+
+
+def test_deferred(Session, monkeypatch):
+    executor = Executor(run=False)
+    pending = executor.pending
+    monkeypatch.setattr(count_utils, 'get_deferred_counts_executor', lambda: executor)
+
+    session = Session()
+    request = Request(session)
+    queryset = session.query(Item)
+
+    result = queryset_count(request, queryset, COUNT_DEFERRED)
+    token = result['count_token']
+
+    assert result['count'] is None
+    assert queryset_count(request, queryset, COUNT_DEFERRED)['count_token'] == token
+    assert len(pending) == 1
+    assert get_deferred_count(request, token) == {'status': 'pending'}
+
+    func, args = pending.pop()
+    func(*args)
+
+    assert get_deferred_count(request, token) == {'status': 'ready', 'count': 10}
+    assert get_deferred_count(Request(session, rls_identity='user'), token) is None
+    assert queryset_count(request, queryset, COUNT_DEFERRED) == {'count': 10}
+
+
+def test_deferred_session_setup(Session, monkeypatch):
+    sessions = []
+    monkeypatch.setattr(
+        count_utils,
+        'setup_query_session',
+        lambda request, session, timezone=None: sessions.append((session, timezone))
+    )
+
+    session = Session()
+    session.info['_queries_timezone'] = '+03:00'
+
+    assert queryset_count(Request(session), session.query(Item), COUNT_DEFERRED) == {'count': 10}
+    assert len(sessions) == 1
+    assert sessions[0][0] is not session
+    assert sessions[0][1] == '+03:00'
+
+
+def test_deferred_max_pending(Session, monkeypatch):
+    executor = Executor(run=False)
+    monkeypatch.setattr(count_utils, 'get_deferred_counts_executor', lambda: executor)
+    monkeypatch.setattr(settings, 'COUNT_DEFERRED_MAX_PENDING', 2)
+    monkeypatch.setattr(count_utils, 'queryset_count_estimate', lambda session, queryset: 50000)
+
+    session = Session()
+    request = Request(session)
+
+    assert queryset_count(request, session.query(Item), COUNT_DEFERRED)['count'] is None
+    assert queryset_count(request, session.query(Item).filter(Item.id > 1), COUNT_DEFERRED)['count'] is None
+    assert get_deferred_counts_stats()['connections_pending'] == {'test': 2}
+
+    # Connection has too many counts in progress, table size is estimated instead
+    queryset = session.query(Item).filter(Item.id > 2)
+    assert queryset_count(request, queryset, COUNT_DEFERRED) == {'count': 50000, 'estimated': True}
+    assert len(executor.pending) == 2
+
+    func, args = executor.pending.pop()
+    func(*args)
+
+    assert get_deferred_counts_stats()['connections_pending'] == {'test': 1}
+    assert queryset_count(request, queryset, COUNT_DEFERRED)['count'] is None
+    assert len(executor.pending) == 2
@@ -0,0 +1,118 @@
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+from jet_bridge_base.db_types import get_queryset_ordering_keys, queryset_keyset_filter
+from jet_bridge_base.exceptions.validation_error import ValidationError
+from jet_bridge_base.paginators.cursor import CursorPagination
+
+Base = declarative_base()
+
+
+class Item(Base):
+    __tablename__ = 'item'
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+    price = Column(Integer, nullable=False)
+    category = Column(String, nullable=True)
+
+
+ROWS = [
+    (1, 'a', 10, 'x'),
+    (2, 'b', 20, None),
+    (3, 'c', 10, 'y'),
+    (4, 'd', 30, 'x'),
+    (5, 'e', 20, None),
+    (6, 'f', 10, 'y'),
+    (7, 'g', 30, None),
+    (8, 'h', 20, 'x')
+]
+
+
+@pytest.fixture
+def session():
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all(map(lambda x: Item(id=x[0], name=x[1], price=x[2], category=x[3]), ROWS))
+    session.commit()
+
+    yield session
+
+    session.close()
+
+
+def walk_pages(queryset, page_size):
+    keys = get_queryset_ordering_keys(Item, queryset)
+    pages = []
+    values = None
+
+    while True:
+        page_queryset = queryset
+        if values is not None:
+            page_queryset = queryset_keyset_filter(Item, queryset, keys, values)
+
+        page = list(page_queryset.limit(page_size))
+        if not page:
+            return pages
+
+        pages.extend(map(lambda x: x.id, page))
+        values = list(map(lambda x: getattr(page[-1], x[0].key), keys))
+
+
+def test_cursor_round_trip():
+    paginator = CursorPagination()
+    keys = [(Item.__table__.c.price, True), (Item.__table__.c.id, False)]
+
+    cursor = paginator.encode_cursor([20, 5], keys)
+    assert paginator.decode_cursor(cursor, keys) == ([20, 5], False)
+
+    cursor = paginator.encode_cursor([20, 5], keys, reverse=True)
+    assert paginator.decode_cursor(cursor, keys) == ([20, 5], True)
+
+
+def test_cursor_tamper_rejected():
+    paginator = CursorPagination()
+    keys = [(Item.__table__.c.price, True), (Item.__table__.c.id, False)]
+    cursor = paginator.encode_cursor([20, 5], keys)
+    payload, signature = cursor.split('.')
+
+    tampered = paginator.encode_cursor([99, 5], keys).split('.')[0]
+    other_ordering = [(Item.__table__.c.price, False), (Item.__table__.c.id, False)]
+
+    for value in ['{}.{}'.format(tampered, signature), payload, 'garbage', '{}.é'.format(payload)]:
+        with pytest.raises(ValidationError):
+            paginator.decode_cursor(value, keys)
+
+    with pytest.raises(ValidationError):
+        paginator.decode_cursor(cursor, other_ordering)
+
+
+def test_keyset_mixed_direction_ordering(session):
+    queryset = session.query(Item).order_by(Item.price.desc(), Item.id)
+    expected = list(map(lambda x: x.id, queryset))
+
+    for page_size in [1, 2, 3]:
+        assert walk_pages(queryset, page_size) == expected
+
+
+def test_keyset_row_values(session):
+    queryset = session.query(Item).order_by(Item.price, Item.id)
+    keys = get_queryset_ordering_keys(Item, queryset)
+    statement = str(queryset_keyset_filter(Item, queryset, keys, [20, 2]).statement.compile())
+
+    assert '(item.price, item.id) >' in statement
+    assert walk_pages(queryset, 3) == list(map(lambda x: x.id, queryset))
+
+
+def test_keyset_nullable_key_fallback(session):
+    queryset = session.query(Item).order_by(Item.category, Item.id)
+    keys = get_queryset_ordering_keys(Item, queryset)
+    statement = str(queryset_keyset_filter(Item, queryset, keys, ['x', 1]).statement.compile())
+
+    # Row value comparison never matches NULL, so nullable keys are compared column by column
+    assert '(item.category, item.id)' not in statement
+    assert walk_pages(queryset, 2) == list(map(lambda x: x.id, queryset))
+    assert walk_pages(queryset.order_by(None).order_by(Item.category.desc(), Item.id), 3) \
+        == list(map(lambda x: x.id, queryset.order_by(None).order_by(Item.category.desc(), Item.id)))
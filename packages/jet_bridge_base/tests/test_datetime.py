@@ -0,0 +1,46 @@
+import datetime
+
+import pytest
+
+from jet_bridge_base.utils.datetime import parse_datetime, parse_epoch_datetime, parse_iso_datetime
+
+UTC = datetime.timezone.utc
+
+
+@pytest.mark.parametrize('value,expected', [
+    ('2024-01-02', datetime.datetime(2024, 1, 2)),
+    ('2024-01-02T10:20:30', datetime.datetime(2024, 1, 2, 10, 20, 30)),
+    ('2024-01-02T10:20:30Z', datetime.datetime(2024, 1, 2, 10, 20, 30, tzinfo=UTC)),
+    (
+        '2024-01-02T10:20:30.5+03:00',
+        datetime.datetime(2024, 1, 2, 10, 20, 30, 500000, tzinfo=datetime.timezone(datetime.timedelta(hours=3)))
+    )
+])
+def test_iso(value, expected):
+    assert parse_iso_datetime(value) == expected
+    assert parse_datetime(value) == expected
+
+
+@pytest.mark.parametrize('value,expected', [
+    ('1700000000', datetime.datetime(2023, 11, 14, 22, 13, 20, tzinfo=UTC)),
+    ('1700000000.5', datetime.datetime(2023, 11, 14, 22, 13, 20, 500000, tzinfo=UTC)),
+    ('1700000000000', datetime.datetime(2023, 11, 14, 22, 13, 20, tzinfo=UTC)),
+    ('123456789', datetime.datetime(1973, 11, 29, 21, 33, 9, tzinfo=UTC)),
+    ('-100000000', datetime.datetime(1966, 10, 31, 14, 13, 20, tzinfo=UTC))
+])
+def test_epoch(value, expected):
+    result = parse_datetime(value)
+
+    assert result == expected
+    assert result.tzinfo is UTC
+
+
+@pytest.mark.parametrize('value', ['12345678', '2024', '1700000000x', '99999999999999999999999'])
+def test_not_epoch(value):
+    assert parse_epoch_datetime(value) is None
+
+
+def test_natural_fallback():
+    assert parse_datetime('January 2, 2024 10:20') == datetime.datetime(2024, 1, 2, 10, 20)
+    assert parse_datetime('20240102') == datetime.datetime(2024, 1, 2)
+    assert parse_datetime('not a date') is None
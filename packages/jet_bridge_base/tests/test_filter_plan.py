@@ -0,0 +1,131 @@
+import itertools
+import threading
+import time
+
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+from jet_bridge_base.filters import lookups
+from jet_bridge_base.filters.filter_class import FilterClass
+from jet_bridge_base.filters.filter_for_dbfield import filter_for_column
+
+Base = declarative_base()
+
+
+class Item(Base):
+    __tablename__ = 'item'
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+
+
+class Request(object):
+
+    def __init__(self, arguments):
+        self.query_arguments = dict(arguments)
+
+    def get_argument_safe(self, name, default=None):
+        return self.query_arguments.get(name, default)
+
+
+def create_filter_class():
+    class ItemFilterClass(FilterClass):
+        class Meta:
+            model = Item
+
+    return ItemFilterClass
+
+
+def filter_queryset_scan(request, queryset):
+    # Filtering before filter plans: every column/lookup/exclude filter checked its arguments
+    for column in Item.__table__.columns:
+        item = filter_for_column(column)
+
+        for lookup in item['lookups']:
+            for exclude in [False, True]:
+                instance = item['filter_class'](name=column.key, column=column, lookup=lookup, exclude=exclude)
+                prefix = 'exclude__' if exclude else ''
+                value = request.get_argument_safe('{}{}__{}'.format(prefix, column.key, lookup))
+
+                if value is None and lookup == lookups.DEFAULT_LOOKUP:
+                    value = request.get_argument_safe('{}{}'.format(prefix, column.key))
+
+                queryset = instance.filter(queryset, value)
+
+    return queryset
+
+
+@pytest.fixture
+def session():
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all(map(lambda x: Item(id=x[0], name=x[1]), enumerate(['a', 'b', 'c', 'b'])))
+    session.commit()
+
+    yield session
+
+    session.close()
+
+
+def get_ids(queryset):
+    return sorted(map(lambda x: x.id, queryset))
+
+
+@pytest.mark.parametrize('arguments', list(itertools.permutations([
+    ('name', 'a'),
+    ('name__exact', 'b'),
+    ('exclude__name', 'c')
+])))
+def test_exact_precedence(session, arguments):
+    request = Request(arguments)
+    queryset = session.query(Item)
+    filter_class = create_filter_class()(context={'request': request})
+
+    result = filter_class.filter_queryset(request, queryset)
+    expected = filter_queryset_scan(request, queryset)
+
+    # "name__exact" wins over "name" whatever order the arguments come in
+    assert get_ids(result) == get_ids(expected) == [1, 3]
+    assert str(result.statement.compile(compile_kwargs={'literal_binds': True})) \
+        == str(expected.statement.compile(compile_kwargs={'literal_binds': True}))
+
+
+def test_default_lookup_fallback(session):
+    request = Request([('name', 'a'), ('exclude__name', 'a')])
+    queryset = session.query(Item)
+    filter_class = create_filter_class()(context={'request': request})
+
+    assert get_ids(filter_class.filter_queryset(request, queryset)) == []
+    assert get_ids(filter_class.filter_queryset(Request([('name', 'b')]), queryset)) == [1, 3]
+
+
+def test_filter_plan_built_once(monkeypatch):
+    filter_class = create_filter_class()
+    create_filter_plan = filter_class.create_filter_plan
+    created = []
+    barrier = threading.Barrier(8)
+
+    def create_filter_plan_slow():
+        created.append(True)
+        time.sleep(0.01)
+        return create_filter_plan()
+
+    monkeypatch.setattr(filter_class, 'create_filter_plan', create_filter_plan_slow)
+    results = []
+
+    def get_filter_plan():
+        barrier.wait()
+        results.append(filter_class.get_filter_plan())
+
+    threads = list(map(lambda _: threading.Thread(target=get_filter_plan), range(8)))
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert all(map(lambda x: x is results[0], results))
@@ -0,0 +1,193 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from jet_bridge_base import settings
+from jet_bridge_base.responses.streaming_json import StreamingJSONResponse
+from jet_bridge_base.serializers import sql as sql_serializers
+from jet_bridge_base.serializers.sql import SqlSerializer, SqlsSerializer
+from jet_bridge_base.utils import parallel
+
+
+class Request(object):
+
+    def __init__(self, session):
+        self.session = session
+        self.parallel_sessions = set()
+
+    def get_rls_identity(self):
+        return
+
+    def apply_statement_timeout(self, session=None):
+        pass
+
+    def apply_rls_if_enabled(self, session=None):
+        pass
+
+
+@pytest.fixture
+def Session(tmp_path, monkeypatch):
+    engine = create_engine('sqlite:///{}'.format(tmp_path / 'db.sqlite3'))
+
+    with engine.begin() as connection:
+        connection.execute(text('create table item (id integer primary key, name varchar)'))
+        connection.execute(text('insert into item (id, name) values {}'.format(
+            ', '.join(map(lambda x: '({}, \'name {}\')'.format(x, x), range(1, 51)))
+        )))
+
+    Session = sessionmaker(bind=engine)
+    connection = {'id': 'test', 'engine': engine, 'Session': Session}
+
+    monkeypatch.setattr(parallel, 'get_request_connection', lambda request: connection)
+    monkeypatch.setattr(sql_serializers, 'get_type_code_to_sql_type', lambda request: None)
+    monkeypatch.setattr(sql_serializers, 'get_default_timezone', lambda request: None)
+    monkeypatch.setattr(settings, 'SQL_CACHE_TTL', 0)
+
+    yield Session
+
+    engine.dispose()
+
+
+@pytest.fixture
+def executor(monkeypatch):
+    # Fewer threads than batch workers with counts, which used to wait for each other forever
+    executor = ThreadPoolExecutor(max_workers=2)
+    monkeypatch.setattr(parallel, 'parallel_queries_executor', executor)
+
+    yield executor
+
+    executor.shutdown(wait=False)
+
+
+def execute_batch(Session, data):
+    serializer = SqlsSerializer(data=data, context={'request': Request(Session())})
+    serializer.is_valid(raise_exception=True)
+    result = serializer.execute(serializer.validated_data)
+    return list(result)
+
+
+def run_with_timeout(func, count, timeout=10):
+    results = []
+    threads = list(map(lambda _: threading.Thread(target=lambda: results.append(func()), daemon=True), range(count)))
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join(timeout)
+
+    assert not any(map(lambda x: x.is_alive(), threads)), 'batch execution hangs'
+    return results
+
+
+def count_queries(count):
+    return list(map(lambda x: {'query': 'select * from item where id > {}'.format(x), 'count': True, 'v': 2}, range(count)))
+
+
+@pytest.mark.parametrize('stream', [False, True])
+def test_batch_counts_no_deadlock(Session, executor, stream):
+    data = {'queries': count_queries(6), 'stream': stream}
+    results = run_with_timeout(lambda: execute_batch(Session, data), 2)
+
+    for result in results:
+        if stream:
+            result = sorted(result, key=lambda x: x['index'])
+
+        assert list(map(lambda x: x['count'], result)) == [50, 49, 48, 47, 46, 45]
+
+
+def test_nested_parallel_query_inline(Session, executor):
+    request = Request(Session())
+    future = parallel.submit_parallel_query(
+        request,
+        lambda session: parallel.submit_parallel_query(request, lambda x: None, session)
+    )
+
+    assert future is not None
+    assert future.result(timeout=10) is None
+
+
+def test_stream_worker_failure(Session, executor, monkeypatch):
+    def create_worker(queries, on_result):
+        def worker(session=None):
+            raise Exception('worker failed')
+        return worker
+
+    serializer = SqlsSerializer(data={'queries': count_queries(3), 'stream': True}, context={'request': Request(Session())})
+    serializer.is_valid(raise_exception=True)
+    monkeypatch.setattr(serializer, 'create_worker', create_worker)
+
+    results = run_with_timeout(lambda: list(serializer.execute(serializer.validated_data)), 1)[0]
+
+    assert results == list(map(lambda x: {'index': x, 'error': 'worker failed'}, range(3)))
+
+
+def execute_stream(Session, data, results):
+    session = Session()
+    execute = session.execute
+
+    def execute_tracked(*args, **kwargs):
+        result = execute(*args, **kwargs)
+        results.append(result)
+        return result
+
+    session.execute = execute_tracked
+
+    serializer = SqlSerializer(data=data, context={'request': Request(session)})
+    serializer.is_valid(raise_exception=True)
+    return serializer.execute(serializer.validated_data, stream=True)
+
+
+def test_stream_max_rows(Session, monkeypatch):
+    monkeypatch.setattr(settings, 'SQL_MAX_ROWS', 20)
+    monkeypatch.setattr(settings, 'SQL_FETCH_BATCH_SIZE', 8)
+    results = []
+
+    response = execute_stream(Session, {'query': 'select * from item order by id', 'v': 2, 'limit': 0}, results)
+
+    assert response['max_rows'] == 20
+    assert not results[-1].closed
+
+    rows = list(response['data'])
+
+    assert list(map(lambda x: x[0], rows)) == list(range(1, 21))
+    assert results[-1].closed
+
+
+def test_stream_closed_early(Session, monkeypatch):
+    monkeypatch.setattr(settings, 'SQL_MAX_ROWS', 20)
+    results = []
+
+    response = StreamingJSONResponse(execute_stream(Session, {'query': 'select * from item', 'v': 2, 'limit': 0}, results))
+    response.chunk_size = 1
+    chunks = response.render_chunks()
+
+    assert next(chunks).startswith('{')
+    assert not results[-1].closed
+
+    # Client disconnected, the rest of rows is not read
+    chunks.close()
+
+    assert results[-1].closed
+
+    response = execute_stream(Session, {'query': 'select * from item', 'v': 2, 'limit': 0}, results)
+    rows = response['data']
+
+    assert next(rows)[0] == 1
+
+    rows.close()
+
+    assert results[-1].closed
+    assert next(rows, None) is None
+
+
+def test_stream_limit_below_max_rows(Session, monkeypatch):
+    monkeypatch.setattr(settings, 'SQL_MAX_ROWS', 20)
+
+    response = execute_stream(Session, {'query': 'select * from item', 'v': 2, 'limit': 5}, [])
+
+    assert 'max_rows' not in response
+    assert len(list(response['data'])) == 5
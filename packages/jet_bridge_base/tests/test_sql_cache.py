@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+from sqlalchemy import Column, Integer
+from sqlalchemy.orm import declarative_base
+
+from jet_bridge_base import encoders
+from jet_bridge_base.utils import sql_cache
+from jet_bridge_base.utils.sql_cache import get_sql_cache_key, get_sql_fingerprint, get_sql_query_tables, \
+    get_sql_result_size, invalidate_model_queries, invalidate_table_queries, normalize_sql_query, \
+    sql_cache_get_or_execute, sql_cache_get_or_execute_async
+
+Base = declarative_base()
+
+
+class Item(Base):
+    __tablename__ = 'item'
+
+    id = Column(Integer, primary_key=True)
+
+
+class Order(Base):
+    __tablename__ = 'order_line'
+
+    id = Column(Integer, primary_key=True)
+
+
+class Request(object):
+
+    def __init__(self, rls_identity=None):
+        self.rls_identity = rls_identity
+
+    def get_rls_identity(self):
+        return self.rls_identity
+
+
+@pytest.fixture(autouse=True)
+def connection(monkeypatch):
+    connection = {'id': 'test', 'MappedBase': Base}
+    monkeypatch.setattr(sql_cache, 'get_request_connection', lambda request: connection)
+    sql_cache.get_sql_results_cache().clear()
+    sql_cache.table_generations.clear()
+    return connection
+
+
+def test_normalize_sql_query():
+    assert normalize_sql_query('  select *\n\tfrom   item  ') == 'select * from item'
+    assert normalize_sql_query("select 'a   b'  from \"my   table\"") == "select 'a   b' from \"my   table\""
+    assert normalize_sql_query("select 'it''s   x'   as  y") == "select 'it''s   x' as y"
+    assert normalize_sql_query("select x'01'") != normalize_sql_query("select x '01'")
+
+
+def test_fingerprint():
+    data = {'query': 'select * from item', 'v': 2, 'params_obj': {'a': 1}}
+
+    assert get_sql_fingerprint(data) == get_sql_fingerprint({
+        'params_obj': {'a': 1},
+        'v': 2,
+        'query': 'select  *\nfrom item',
+        'cache_ttl': 60
+    })
+    assert get_sql_fingerprint(data) != get_sql_fingerprint({**data, 'params_obj': {'a': 2}})
+    assert get_sql_fingerprint(data) != get_sql_fingerprint({**data, 'query': "select * from item where x = ' '"})
+
+
+def test_query_tables():
+    assert get_sql_query_tables(Request(), 'SELECT * FROM Item JOIN order_line ON 1 = 1') == ['item', 'order_line']
+    assert get_sql_query_tables(Request(), 'select 1') == []
+
+
+def test_table_invalidation():
+    request = Request()
+    data = {'query': 'select * from item'}
+    other_data = {'query': 'select * from order_line'}
+
+    key = get_sql_cache_key(request, data)
+    other_key = get_sql_cache_key(request, other_data)
+
+    invalidate_table_queries(request, 'ITEM')
+
+    assert get_sql_cache_key(request, data) != key
+    assert get_sql_cache_key(request, other_data) == other_key
+
+    key = get_sql_cache_key(request, data)
+    invalidate_model_queries(request, Item)
+
+    assert get_sql_cache_key(request, data) != key
+    assert get_sql_cache_key(Request('user'), data) != get_sql_cache_key(request, data)
+
+
+def test_get_or_execute():
+    request = Request()
+    data = {'query': 'select * from item'}
+    executed = []
+
+    def execute():
+        executed.append(True)
+        return {'data': [[len(executed)]]}
+
+    result = sql_cache_get_or_execute(request, data, 60, execute)
+    assert result['data'] == [[1]] and result['cache']['hit'] is False
+
+    result = sql_cache_get_or_execute(request, data, 60, execute)
+    assert result['data'] == [[1]] and result['cache']['hit'] is True
+
+    invalidate_model_queries(request, Item)
+
+    result = sql_cache_get_or_execute(request, data, 60, execute)
+    assert result['data'] == [[2]] and result['cache']['hit'] is False
+
+
+def test_get_or_execute_async_coalesced():
+    request = Request()
+    data = {'query': 'select * from item'}
+    executed = []
+
+    async def execute():
+        executed.append(True)
+        await asyncio.sleep(0.01)
+        return {'data': [[1]]}
+
+    async def run():
+        return await asyncio.gather(*map(
+            lambda _: sql_cache_get_or_execute_async(request, data, 60, execute),
+            range(5)
+        ))
+
+    results = asyncio.run(run())
+
+    assert len(executed) == 1
+    assert list(map(lambda x: x['data'], results)) == [[[1]]] * 5
+    assert list(map(lambda x: x['cache']['hit'], results)) == [False] + [True] * 4
+
+
+def test_result_size():
+    rows = list(map(lambda x: [x, 'name {}'.format(x)], range(1000)))
+    result = {'data': rows, 'columns': ['id', 'name']}
+    size = get_sql_result_size({'result': result})
+    exact_size = len(encoders.dumps(result))
+
+    assert abs(size - exact_size) < exact_size * 0.1
+    assert get_sql_result_size({'result': {'data': [], 'columns': []}}) > 0
@@ -86,6 +86,8 @@ class JetDjangoConfiguration(Configuration):
             'DATABASE_MAX_TABLES': settings.JET_DATABASE_MAX_TABLES,
             'DATABASE_SCHEMA': settings.JET_DATABASE_SCHEMA,
             'DATABASE_TIMEZONE': settings.JET_DATABASE_TIMEZONE,
+            'DATABASE_STATEMENT_TIMEOUT': settings.JET_DATABASE_STATEMENT_TIMEOUT,
+            'DATABASE_QUERY_CACHE_SIZE': settings.JET_DATABASE_QUERY_CACHE_SIZE,
             'DATABASE_RLS_TYPE': settings.JET_DATABASE_RLS_TYPE,
             'DATABASE_RLS_SSO': settings.JET_DATABASE_RLS_SSO,
             'DATABASE_RLS_USER_PROPERTY': settings.JET_DATABASE_RLS_USER_PROPERTY,
@@ -114,7 +116,19 @@ class JetDjangoConfiguration(Configuration):
             'TRACK_MODELS_AUTH': settings.JET_TRACK_MODELS_AUTH,
             'TRACK_QUERY_SLOW_TIME': settings.JET_TRACK_QUERY_SLOW_TIME,
             'TRACK_QUERY_HIGH_MEMORY': settings.JET_TRACK_QUERY_HIGH_MEMORY,
-            'DISABLE_AUTH': settings.JET_DISABLE_AUTH
+            'DISABLE_AUTH': settings.JET_DISABLE_AUTH,
+            'COUNT_STRATEGY': settings.JET_COUNT_STRATEGY,
+            'COUNT_STRATEGIES': settings.JET_COUNT_STRATEGIES,
+            'COUNT_CACHE_TTL': settings.JET_COUNT_CACHE_TTL,
+            'COUNT_DEFERRED_WORKERS': settings.JET_COUNT_DEFERRED_WORKERS,
+            'COUNT_DEFERRED_MAX_PENDING': settings.JET_COUNT_DEFERRED_MAX_PENDING,
+            'PARALLEL_QUERIES': settings.JET_PARALLEL_QUERIES,
+            'PARALLEL_QUERIES_WORKERS': settings.JET_PARALLEL_QUERIES_WORKERS,
+            'SQL_CACHE_TTL': settings.JET_SQL_CACHE_TTL,
+            'SQL_CACHE_MAX_MEMORY': settings.JET_SQL_CACHE_MAX_MEMORY,
+            'SQL_BATCH_MAX_PARALLEL': settings.JET_SQL_BATCH_MAX_PARALLEL,
+            'SQL_FETCH_BATCH_SIZE': settings.JET_SQL_FETCH_BATCH_SIZE,
+            'SQL_MAX_ROWS': settings.JET_SQL_MAX_ROWS
         }
 
     def get_django_instance(self, model, instance):
@@ -1,6 +1,6 @@
 import os
 import sys
-from django.http import HttpResponse, HttpResponseRedirect
+from django.http import HttpResponse, HttpResponseRedirect, StreamingHttpResponse
 from django.http.response import HttpResponseBase
 from django.template import Template
 from django.template.context import Context
@@ -18,6 +18,23 @@ from jet_bridge_base.responses.template import TemplateResponse
 from jet_bridge_base.status import HTTP_204_NO_CONTENT
 
 
+class StreamingContent(object):
+    # Django calls close() once the response is sent, even if content was not iterated
+
+    def __init__(self, content, on_close):
+        self.content = content
+        self.on_close = on_close
+
+    def __iter__(self):
+        return iter(self.content)
+
+    def close(self):
+        if self.on_close is not None:
+            on_close = self.on_close
+            self.on_close = None
+            on_close()
+
+
 class BaseRouteView(generic.View):
     view_cls = None
     view = None
@@ -75,6 +92,8 @@ class BaseRouteView(generic.View):
                 context = Context(response.data)
                 content = Template(template).render(context)
                 result = HttpResponse(content, status=response.status)
+        elif response.streaming:
+            result = StreamingHttpResponse(response.render_chunks(), status=response.status)
         else:
             result = HttpResponse(response.render(), status=response.status)
 
@@ -115,16 +134,27 @@ class BaseRouteView(generic.View):
         except RequestError as e:
             request = e.request
 
+        response = None
+
         try:
             self.before_dispatch(request)
             response = super(BaseRouteView, self).dispatch(request, *args, **kwargs)
+
+            if response.streaming:
+                response.streaming_content = self.finish_after_streaming(request, response.streaming_content)
+
             return response
         except Exception:
             exc_type, exc, traceback = sys.exc_info()
             response = self.view.error_response(request, exc_type, exc, traceback)
             return self.write_response(response)
         finally:
-            self.on_finish(request)
+            # Streaming content is rendered after dispatch() returns, session is needed until then
+            if response is None or not response.streaming:
+                self.on_finish(request)
+
+    def finish_after_streaming(self, request, content):
+        return StreamingContent(content, lambda: self.on_finish(request))
 
     @classmethod
     def as_view(cls, **initkwargs):
@@ -37,6 +37,8 @@ JET_DATABASE_EXCEPT = getattr(settings, 'JET_DATABASE_EXCEPT', None)
 JET_DATABASE_MAX_TABLES = getattr(settings, 'JET_DATABASE_MAX_TABLES', None)
 JET_DATABASE_SCHEMA = getattr(settings, 'JET_DATABASE_SCHEMA', None)
 JET_DATABASE_TIMEZONE = getattr(settings, 'JET_DATABASE_TIMEZONE', None)
+JET_DATABASE_STATEMENT_TIMEOUT = getattr(settings, 'JET_DATABASE_STATEMENT_TIMEOUT', None)
+JET_DATABASE_QUERY_CACHE_SIZE = getattr(settings, 'JET_DATABASE_QUERY_CACHE_SIZE', 1000)
 JET_DATABASE_RLS_TYPE = getattr(settings, 'JET_DATABASE_RLS_TYPE', None)
 JET_DATABASE_RLS_SSO = getattr(settings, 'JET_DATABASE_RLS_SSO', None)
 JET_DATABASE_RLS_USER_PROPERTY = getattr(settings, 'JET_DATABASE_RLS_USER_PROPERTY', None)
@@ -76,6 +78,18 @@ JET_TRACK_QUERY_SLOW_TIME = getattr(settings, 'JET_TRACK_QUERY_SLOW_TIME', None)
 JET_TRACK_QUERY_HIGH_MEMORY = getattr(settings, 'JET_TRACK_QUERY_HIGH_MEMORY', None)
 
 JET_DISABLE_AUTH = getattr(settings, 'JET_DISABLE_AUTH', False)
+JET_COUNT_STRATEGY = getattr(settings, 'JET_COUNT_STRATEGY', 'optimized')
+JET_COUNT_STRATEGIES = getattr(settings, 'JET_COUNT_STRATEGIES', '{}')
+JET_COUNT_CACHE_TTL = getattr(settings, 'JET_COUNT_CACHE_TTL', 60)
+JET_COUNT_DEFERRED_WORKERS = getattr(settings, 'JET_COUNT_DEFERRED_WORKERS', 2)
+JET_COUNT_DEFERRED_MAX_PENDING = getattr(settings, 'JET_COUNT_DEFERRED_MAX_PENDING', 4)
+JET_PARALLEL_QUERIES = getattr(settings, 'JET_PARALLEL_QUERIES', True)
+JET_PARALLEL_QUERIES_WORKERS = getattr(settings, 'JET_PARALLEL_QUERIES_WORKERS', 8)
+JET_SQL_CACHE_TTL = getattr(settings, 'JET_SQL_CACHE_TTL', 0)
+JET_SQL_CACHE_MAX_MEMORY = getattr(settings, 'JET_SQL_CACHE_MAX_MEMORY', 64 * 1024 * 1024)
+JET_SQL_BATCH_MAX_PARALLEL = getattr(settings, 'JET_SQL_BATCH_MAX_PARALLEL', 4)
+JET_SQL_FETCH_BATCH_SIZE = getattr(settings, 'JET_SQL_FETCH_BATCH_SIZE', 1000)
+JET_SQL_MAX_ROWS = getattr(settings, 'JET_SQL_MAX_ROWS', 0)
 
 try:
     JET_SSO_APPLICATIONS = json.loads(JET_SSO_APPLICATIONS)
@@ -83,6 +97,12 @@ except Exception as e:
     logger.error('SSO_APPLICATIONS parsing failed', exc_info=e)
     JET_SSO_APPLICATIONS = {}
 
+try:
+    JET_COUNT_STRATEGIES = json.loads(JET_COUNT_STRATEGIES)
+except Exception as e:
+    logger.error('COUNT_STRATEGIES parsing failed', exc_info=e)
+    JET_COUNT_STRATEGIES = {}
+
 database_settings = settings.DATABASES.get(JET_DJANGO_DATABASE, {})
 database_engine = None
 
@@ -12,6 +12,7 @@ from jet_bridge_base.views.model_description_relationship_override import ModelD
 from jet_bridge_base.views.proxy_request import ProxyRequestView
 from jet_bridge_base.views.register import RegisterView
 from jet_bridge_base.views.reload import ReloadView
+from jet_bridge_base.views.count import CountView
 from jet_bridge_base.views.sql import SqlView
 from jet_bridge_base.views.status import StatusView
 from jet_bridge_base.views.table import TableView
@@ -41,6 +42,7 @@ def init_urls():
             path('model_descriptions/relationship_overrides/', route_view(ModelDescriptionRelationshipOverrideView).as_view(), name='model-descriptions-relationships-overrides'),
             path('model_descriptions/', route_view(ModelDescriptionView).as_view(), name='model-descriptions'),
             path('sql/', route_view(SqlView).as_view(), name='sql'),
+            path('count/', route_view(CountView).as_view(), name='count'),
             path('messages/', route_view(MessageView).as_view(), name='message'),
             path('file_upload/', route_view(FileUploadView).as_view(), name='file-upload'),
             path('image_resize/', route_view(ImageResizeView).as_view(), name='image-resize'),
@@ -62,6 +64,7 @@ def init_urls():
             url(r'^model_descriptions/relationship_overrides/', route_view(ModelDescriptionRelationshipOverrideView).as_view(), name='model-descriptions-relationships-overrides'),
             url(r'^model_descriptions/', route_view(ModelDescriptionView).as_view(), name='model-descriptions'),
             url(r'^sql/', route_view(SqlView).as_view(), name='sql'),
+            url(r'^count/', route_view(CountView).as_view(), name='count'),
             url(r'^messages/', route_view(MessageView).as_view(), name='message'),
             url(r'^file_upload/', route_view(FileUploadView).as_view(), name='file-upload'),
             url(r'^image_resize/', route_view(ImageResizeView).as_view(), name='image-resize'),